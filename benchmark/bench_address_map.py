@@ -0,0 +1,80 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+
+import sys
+import os
+import random
+from time import perf_counter
+
+# add custom libraries
+path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'libs'))
+if not path in sys.path:
+    sys.path.insert(1, path)
+del path
+
+from wb_component import WishboneSlave
+from wb_address_map import WishboneAddressMap
+
+''' this programm measures insert, lookup and the overlap/gap reports of the
+address map for big, programmatically generated maps '''
+
+__author__ = "Harald Heckmann"
+__copyright__ = "Copyright 2016"
+__credits__ = ["Prof. Dr. Steffen Reith (steffen.reith@hs-rm.de)", \
+                "Harald Heckmann (harald.heckmann@student.hs-rm.de)"]
+__license__ = "GPLv3"
+__version__ = "1.0.0"
+__maintainer__ = "Harald Heckmann"
+__email__ = "harald.heckmann@student.hs-rm.de"
+__status__ = "Development (beta)"
+
+REGIONCOUNTS = (1000, 10000, 100000)
+LOOKUPS = 100000
+
+def createSlaves(regions):
+    ''' create slaves with 4 KiB ranges, every fourth range is left out
+        to get gaps, the slaves are returned in random order '''
+    slaves = []
+
+    for nr in range(regions):
+        slave = WishboneSlave()
+        slave.setName("s%d" % nr)
+        slave.setBaseAddress((nr+nr//3) << 12)
+        slave.setAddressSize(0x1000)
+        slaves.append(slave)
+
+    random.shuffle(slaves)
+    return slaves
+
+def measure(regions):
+    ''' get the time for inserting, looking up and reporting '''
+    slaves = createSlaves(regions)
+    addressmap = WishboneAddressMap()
+
+    start = perf_counter()
+    for slave in slaves:
+        addressmap.insert(slave)
+    inserted = perf_counter()-start
+
+    highest = (regions+regions//3) << 12
+    addresses = [random.randrange(highest) for _ in range(LOOKUPS)]
+
+    start = perf_counter()
+    for address in addresses:
+        addressmap.find(address)
+    found = perf_counter()-start
+
+    start = perf_counter()
+    addressmap.getOverlaps()
+    addressmap.getGaps()
+    reported = perf_counter()-start
+
+    return (inserted, found, reported)
+
+if __name__ == '__main__':
+    random.seed(0)
+    print("%8s %16s %16s %14s" % ("regions", "insert [us/op]", "find [us/op]", "report [ms]"))
+    for regions in REGIONCOUNTS:
+        inserted, found, reported = measure(regions)
+        print("%8d %16.2f %16.2f %14.2f" % (regions, inserted*1000000/regions,\
+                found*1000000/LOOKUPS, reported*1000))
@@ -0,0 +1,79 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+
+import sys
+import os
+import shutil
+import tempfile
+from time import perf_counter
+
+# add custom libraries
+path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'libs'))
+if not path in sys.path:
+    sys.path.insert(1, path)
+del path
+
+from wb_batch import WishboneBatch
+from bench_scaling import writeConfig, ROOT
+
+''' this programm compares generating many intercons one after another with
+generating them by a batch of worker processes. The batch can only be faster
+with more than one processor, a single processor just adds the pool overhead.
+Whether the batch comes close to the time of the slowest job on a multi-core
+host has not been measured yet '''
+
+__author__ = "Harald Heckmann"
+__copyright__ = "Copyright 2016"
+__credits__ = ["Prof. Dr. Steffen Reith (steffen.reith@hs-rm.de)", \
+                "Harald Heckmann (harald.heckmann@student.hs-rm.de)"]
+__license__ = "GPLv3"
+__version__ = "1.0.0"
+__maintainer__ = "Harald Heckmann"
+__email__ = "harald.heckmann@student.hs-rm.de"
+__status__ = "Development (beta)"
+
+CONFIGS = 16
+SLAVES = 500
+
+def measure(configs, workers):
+    ''' generate all configs (deterministic, so every run generates) '''
+    batch = WishboneBatch(configs, workers, deterministic=True)
+    start = perf_counter()
+    results = batch.run()
+    took = perf_counter()-start
+    return took, max(result[3] for result in results)
+
+if __name__ == '__main__':
+    with tempfile.TemporaryDirectory() as workdir:
+        # the intercons are written to vhdl/ of the working directory
+        os.chdir(workdir)
+        os.mkdir("vhdl")
+
+        for name in os.listdir(os.path.join(ROOT, "vhdl")):
+            if name.endswith(".tmpl"):
+                os.symlink(os.path.join(ROOT, "vhdl", name), os.path.join("vhdl", name))
+
+        configs = []
+
+        for nr in range(CONFIGS):
+            config = os.path.join(workdir, "bus%d.ini" % nr)
+            writeConfig(config, SLAVES)
+
+            # every bus needs its own name
+            with open(config, "r") as configfile:
+                text = configfile.read().replace("name = bench_intercon", "name = bus%d" % nr)
+
+            with open(config, "w") as configfile:
+                configfile.write(text)
+
+            configs.append(config)
+
+        print("%d configs, %d slaves each, %d processors" % (CONFIGS, SLAVES, os.cpu_count()))
+        print("%8s %12s %18s" % ("workers", "batch [ms]", "slowest job [ms]"))
+
+        for workers in sorted(set([1, 2, 4, os.cpu_count() or 1])):
+            # stamps of the previous run would skip every job
+            shutil.rmtree(".wb_cache", ignore_errors=True)
+
+            took, slowest = measure(configs, workers)
+            print("%8d %12.2f %18.2f" % (workers, took*1000, slowest*1000))
@@ -0,0 +1,86 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+
+import sys
+import os
+import tracemalloc
+from time import perf_counter
+
+# add custom libraries
+path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'libs'))
+if not path in sys.path:
+    sys.path.insert(1, path)
+del path
+
+from wb_component import WishboneMaster, WishboneSlave
+
+''' this programm measures the construction time and the memory of the
+component model, e.g. for big address maps generated by scripts '''
+
+__author__ = "Harald Heckmann"
+__copyright__ = "Copyright 2016"
+__credits__ = ["Prof. Dr. Steffen Reith (steffen.reith@hs-rm.de)", \
+                "Harald Heckmann (harald.heckmann@student.hs-rm.de)"]
+__license__ = "GPLv3"
+__version__ = "1.0.0"
+__maintainer__ = "Harald Heckmann"
+__email__ = "harald.heckmann@student.hs-rm.de"
+__status__ = "Development (beta)"
+
+COUNTS = (10000, 50000)
+REPEAT = 3
+
+def createSlave(nr):
+    ''' create a completely configured slave '''
+    slave = WishboneSlave()
+    slave.setName("s%d" % nr)
+    slave.setDataBusWidth(32)
+    slave.setEndianess(slave.CONST.BENDIAN)
+    slave.setDataFlow(slave.CONST.RW)
+    slave.setErrorSignal(True)
+    slave.setRetrySignal(False)
+    slave.setTgaSignal(False)
+    slave.setTgcSignal(False)
+    slave.setTgdSignal(False)
+    slave.setBaseAddress(nr << 12)
+    slave.setAddressSize(0x1000)
+    slave.setAddressingGranularity(slave.CONST.BYTE)
+    slave.setWordSize(32)
+    slave.setHighestAddressBit(11)
+    slave.setLowestAddressBit(0)
+    return slave
+
+def measureTime(count, create):
+    ''' get the best time for creating count components '''
+    best = None
+
+    for _ in range(REPEAT):
+        start = perf_counter()
+        components = [create(nr) for nr in range(count)]
+        took = perf_counter()-start
+        if best == None or took < best: best = took
+
+    return best
+
+def measureMemory(count, create):
+    ''' get the memory allocated for count components '''
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    components = [create(nr) for nr in range(count)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return after-before
+
+if __name__ == '__main__':
+    print("%8s %-14s %18s %18s %16s" % ("count", "component", "construct [us]",\
+            "configure [us]", "memory [bytes]"))
+    for count in COUNTS:
+        for name, create, configure in (\
+                ("WishboneMaster", lambda nr: WishboneMaster(), None),\
+                ("WishboneSlave", lambda nr: WishboneSlave(), createSlave)):
+            took = measureTime(count, create)
+            configured = measureTime(count, configure) if configure else None
+            memory = measureMemory(count, configure or create)
+            print("%8d %-14s %18.2f %18s %16.1f" % (count, name, took*1000000/count,\
+                    "%.2f" % (configured*1000000/count) if configured else "-",\
+                    memory/count))
@@ -0,0 +1,56 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+
+import sys
+import os
+import tempfile
+import configparser
+from time import perf_counter
+
+# add custom libraries
+path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'libs'))
+if not path in sys.path:
+    sys.path.insert(1, path)
+del path
+
+from wb_file_manager import WishboneFileManager
+from bench_scaling import writeConfig
+
+''' this programm measures how long parsing a config takes and how much of
+it is spent in configparser itself '''
+
+__author__ = "Harald Heckmann"
+__copyright__ = "Copyright 2016"
+__credits__ = ["Prof. Dr. Steffen Reith (steffen.reith@hs-rm.de)", \
+                "Harald Heckmann (harald.heckmann@student.hs-rm.de)"]
+__license__ = "GPLv3"
+__version__ = "1.0.0"
+__maintainer__ = "Harald Heckmann"
+__email__ = "harald.heckmann@student.hs-rm.de"
+__status__ = "Development (beta)"
+
+SLAVECOUNTS = (1000, 5000)
+REPEAT = 5
+
+def best(function):
+    ''' get the best time of REPEAT calls '''
+    times = []
+
+    for _ in range(REPEAT):
+        start = perf_counter()
+        function()
+        times.append(perf_counter()-start)
+
+    return min(times)
+
+if __name__ == '__main__':
+    with tempfile.TemporaryDirectory() as workdir:
+        print("%8s %12s %18s %14s" % ("slaves", "parse [ms]", "configparser [ms]",\
+                "schema [ms]"))
+        for slaves in SLAVECOUNTS:
+            config = os.path.join(workdir, "bench_%d.ini" % slaves)
+            writeConfig(config, slaves)
+            parse = best(lambda: WishboneFileManager().parse(config))
+            read = best(lambda: configparser.ConfigParser().read(config))
+            print("%8d %12.2f %18.2f %14.2f" % (slaves, parse*1000, read*1000,\
+                    (parse-read)*1000))
@@ -0,0 +1,93 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+
+import sys
+import os
+import tempfile
+import configparser
+from time import perf_counter
+
+# add custom libraries
+path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'libs'))
+if not path in sys.path:
+    sys.path.insert(1, path)
+del path
+
+from wb_intercon import WishboneIntercon
+from wb_file_manager import WishboneFileManager
+from bench_model import createSlave
+
+''' this programm compares the ways a script can hand over its slaves: write
+a config file and parse it, add the slaves one by one using the setters or
+add them as records by the bulk api of the intercon '''
+
+__author__ = "Harald Heckmann"
+__copyright__ = "Copyright 2016"
+__credits__ = ["Prof. Dr. Steffen Reith (steffen.reith@hs-rm.de)", \
+                "Harald Heckmann (harald.heckmann@student.hs-rm.de)"]
+__license__ = "GPLv3"
+__version__ = "1.0.0"
+__maintainer__ = "Harald Heckmann"
+__email__ = "harald.heckmann@student.hs-rm.de"
+__status__ = "Development (beta)"
+
+SLAVECOUNTS = (1000, 10000, 50000)
+REPEAT = 3
+
+def createRecord(nr):
+    ''' create the record of the slave created by bench_model.createSlave '''
+    return {"name": "s%d" % nr, "data_bus_width": 32, "endianess": "big",
+            "data_flow": "rw", "err": True, "rty": False, "tga": False,
+            "tgc": False, "tgd": False, "base_address": nr << 12,
+            "address_size": 0x1000, "addressing_granularity": "byte",
+            "word_size": 32, "address_bus_high": 11, "address_bus_low": 0}
+
+def writeRecords(path, records):
+    ''' write the records to a config file '''
+    config = configparser.ConfigParser()
+
+    for nr, record in enumerate(records):
+        config["SLAVE%d" % nr] = {key: ("0x%08x" % value if key in ("base_address",\
+                                  "address_size") else str(value).lower())\
+                                  for key, value in record.items()}
+
+    with open(path, "w") as configfile:
+        config.write(configfile)
+
+def addParsed(records):
+    ''' write the slaves to a config file and parse it '''
+    with tempfile.TemporaryDirectory() as workdir:
+        path = os.path.join(workdir, "records.ini")
+        writeRecords(path, records)
+        WishboneFileManager().parse(path)
+
+def addSingle(records):
+    ''' add the slaves one by one, created by the setters '''
+    intercon = WishboneIntercon()
+
+    for nr in reversed(range(len(records))):
+        intercon.addSlave(createSlave(nr))
+
+def addBulk(records):
+    ''' add the slaves by one call of the bulk api '''
+    WishboneIntercon().addSlaves(records)
+
+def best(function, records):
+    ''' get the best time of REPEAT calls '''
+    times = []
+
+    for _ in range(REPEAT):
+        start = perf_counter()
+        function(records)
+        times.append(perf_counter()-start)
+
+    return min(times)
+
+if __name__ == '__main__':
+    print("%8s %16s %14s %14s" % ("slaves", "config file [ms]", "setters [ms]",\
+            "records [ms]"))
+    for slaves in SLAVECOUNTS:
+        # slaves in reverse order, the address map has to sort them
+        records = [createRecord(nr) for nr in reversed(range(slaves))]
+        print("%8d %16.2f %14.2f %14.2f" % (slaves, best(addParsed, records)*1000,\
+                best(addSingle, records)*1000, best(addBulk, records)*1000))
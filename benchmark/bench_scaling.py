@@ -0,0 +1,83 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+
+import sys
+import os
+import tempfile
+from time import perf_counter
+
+# add custom libraries
+path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'libs'))
+if not path in sys.path:
+    sys.path.insert(1, path)
+del path
+
+from wb_file_manager import WishboneFileManager
+
+''' this programm measures how the generation time of the intercon grows
+with the amount of slaves. The time per slave should stay (nearly) constant '''
+
+__author__ = "Harald Heckmann"
+__copyright__ = "Copyright 2016"
+__credits__ = ["Prof. Dr. Steffen Reith (steffen.reith@hs-rm.de)", \
+                "Harald Heckmann (harald.heckmann@student.hs-rm.de)"]
+__license__ = "GPLv3"
+__version__ = "1.0.0"
+__maintainer__ = "Harald Heckmann"
+__email__ = "harald.heckmann@student.hs-rm.de"
+__status__ = "Development (beta)"
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+SLAVECOUNTS = (125, 250, 500, 1000, 2000)
+REPEAT = 3
+
+def writeConfig(filename, slaves, width=64):
+    ''' write a synthetic config with the given amount of slaves, every
+        second slave uses the other endianess to hit the byte lane conversion
+    '''
+    lines = ["[GENERAL]", "name = bench_intercon", "tga_bits = 4", "tgc_bits = 4",
+             "tgd_bits = 4", "data_bus_width = %d" % width, "address_bus_width = 32",
+             "", "[MASTER]", "name = cpu", "data_bus_width = %d" % width,
+             "address_bus_width = 32", "endianess = big", "data_flow = rw",
+             "err = true", "rty = true", "tga = true", "tgc = true", "tgd = true"]
+
+    for nr in range(slaves):
+        lines += ["", "[SLAVE%d]" % nr, "name = s%d" % nr,
+                  "data_bus_width = %d" % width,
+                  "endianess = %s" % ("big" if nr % 2 else "little"),
+                  "address_bus_high = 11", "address_bus_low = 0",
+                  "base_address = 0x%08x" % (nr << 12), "address_size = 0x00001000",
+                  "addressing_granularity = byte", "word_size = %d" % width,
+                  "data_flow = rw", "err = true", "rty = true", "tga = true",
+                  "tgc = true", "tgd = true"]
+
+    with open(filename, "w") as config:
+        config.write("\n".join(lines)+"\n")
+
+def measure(slaves, workdir):
+    ''' parse a synthetic config and return the best generation time '''
+    config = os.path.join(workdir, "bench_%d.ini" % slaves)
+    writeConfig(config, slaves)
+
+    wbmngr = WishboneFileManager()
+    wbmngr.parse(config)
+    wbmngr._tmplinter = os.path.join(ROOT, "vhdl", "template_intercon.tmpl")
+    wbmngr._tmplslave = os.path.join(ROOT, "vhdl", "template_slave.tmpl")
+    wbmngr._tmplmaster = os.path.join(ROOT, "vhdl", "template_master.tmpl")
+    wbmngr._vhdlinter = os.path.join(workdir, "bench_%d.vhdl" % slaves)
+
+    best = None
+    for _ in range(REPEAT):
+        start = perf_counter()
+        wbmngr.generateIntercon()
+        took = perf_counter()-start
+        if best == None or took < best: best = took
+
+    return best
+
+if __name__ == '__main__':
+    with tempfile.TemporaryDirectory() as workdir:
+        print("%8s %14s %18s" % ("slaves", "generate [ms]", "per slave [us]"))
+        for slaves in SLAVECOUNTS:
+            took = measure(slaves, workdir)
+            print("%8d %14.2f %18.2f" % (slaves, took*1000, took*1000000/slaves))
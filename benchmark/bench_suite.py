@@ -0,0 +1,197 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+
+import sys
+import os
+import json
+import argparse
+import tempfile
+import tracemalloc
+from time import perf_counter
+
+# add custom libraries
+path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'libs'))
+if not path in sys.path:
+    sys.path.insert(1, path)
+del path
+
+from wb_file_manager import WishboneFileManager
+
+''' this programm generates synthetic configs with up to 10000 slaves in
+several variants, measures parsing, generating and the peak memory and
+compares the results with a stored baseline to find regressions '''
+
+__author__ = "Harald Heckmann"
+__copyright__ = "Copyright 2016"
+__credits__ = ["Prof. Dr. Steffen Reith (steffen.reith@hs-rm.de)", \
+                "Harald Heckmann (harald.heckmann@student.hs-rm.de)"]
+__license__ = "GPLv3"
+__version__ = "1.0.0"
+__maintainer__ = "Harald Heckmann"
+__email__ = "harald.heckmann@student.hs-rm.de"
+__status__ = "Development (beta)"
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+# the baseline depends on the machine, it is recorded with --save-baseline
+BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+SLAVECOUNTS = (10, 100, 1000, 10000)
+# name -> (data bus width, mixed endianess, tag signals)
+VARIANTS = {"plain": (32, False, False),
+            "endian": (32, True, False),
+            "tags": (32, False, True),
+            "wide": (64, True, True),
+            "narrow": (16, True, True)}
+# a result is a regression if it exceeds the baseline by these factors,
+# times are noisy, memory is not
+TIMETOLERANCE = 1.25
+MEMORYTOLERANCE = 1.05
+
+def writeConfig(filename, slaves, variant):
+    ''' write a synthetic config of a variant (see VARIANTS). With mixed
+        endianess every second slave differs from the master, with tag
+        signals the slaves use tga, tgc and tgd in turns. The data flow
+        alternates as well, so the decoder gets read and write only slaves
+    '''
+    width, mixed, tags = VARIANTS[variant]
+    tagbits = 4 if tags else 0
+    lines = ["[GENERAL]", "name = suite_%s_%d" % (variant, slaves),
+             "tga_bits = %d" % tagbits, "tgc_bits = %d" % tagbits,
+             "tgd_bits = %d" % tagbits, "data_bus_width = %d" % width,
+             "address_bus_width = 32", "", "[MASTER]", "name = cpu",
+             "data_bus_width = %d" % width, "address_bus_width = 32",
+             "endianess = big", "data_flow = rw", "err = true", "rty = true",
+             "tga = %s" % str(tags).lower(), "tgc = %s" % str(tags).lower(),
+             "tgd = %s" % str(tags).lower()]
+
+    for nr in range(slaves):
+        lines += ["", "[SLAVE%d]" % nr, "name = s%d" % nr,
+                  "data_bus_width = %d" % width,
+                  "endianess = %s" % ("little" if mixed and nr % 2 else "big"),
+                  "address_bus_high = 11", "address_bus_low = 0",
+                  "base_address = 0x%08x" % (nr << 12), "address_size = 0x00001000",
+                  "addressing_granularity = byte", "word_size = %d" % width,
+                  "data_flow = %s" % ("rw", "r", "w")[nr % 3],
+                  "err = %s" % str(nr % 2 == 0).lower(), "rty = false",
+                  "tga = %s" % str(tags and nr % 3 == 0).lower(),
+                  "tgc = %s" % str(tags and nr % 3 == 1).lower(),
+                  "tgd = %s" % str(tags and nr % 3 == 2).lower()]
+
+    with open(filename, "w") as config:
+        config.write("\n".join(lines)+"\n")
+
+def repeats(slaves):
+    ''' get how often a measurement is repeated, big configs take long
+        enough to be measured once '''
+    return 1 if slaves >= 10000 else 3 if slaves >= 1000 else 10
+
+def measure(config, workdir, slaves):
+    ''' get the best times of parse and generateIntercon and the peak
+        memory of both together
+        @rtype: Dictionary
+        @return: parse and generate [s], peak memory and size of the vhdl
+                 file [bytes]
+    '''
+    templatedir = os.path.join(ROOT, "vhdl")
+    result = {"parse": None, "generate": None}
+
+    for _ in range(repeats(slaves)):
+        wbmngr = WishboneFileManager(deterministic=True, templatedir=templatedir,\
+                                     outputdir=workdir)
+        start = perf_counter()
+        wbmngr.parse(config)
+        parsed = perf_counter()
+        wbmngr.generateIntercon()
+        generated = perf_counter()
+
+        for phase, took in (("parse", parsed-start), ("generate", generated-parsed)):
+            if result[phase] == None or took < result[phase]:
+                result[phase] = took
+
+    # separate run, tracemalloc slows down every allocation
+    tracemalloc.start()
+    wbmngr = WishboneFileManager(deterministic=True, templatedir=templatedir,\
+                                 outputdir=workdir)
+    wbmngr.parse(config)
+    wbmngr.generateIntercon()
+    result["memory"] = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    result["size"] = os.path.getsize(wbmngr._vhdlinter)
+    return result
+
+def compare(name, result, baseline):
+    ''' get the regressions of a result compared to its baseline
+        @rtype: List containing Strings
+        @return: descriptions of the regressions
+    '''
+    regressions = []
+
+    if baseline == None:
+        return regressions
+
+    for key, tolerance in (("parse", TIMETOLERANCE), ("generate", TIMETOLERANCE),\
+                           ("memory", MEMORYTOLERANCE)):
+        if key in baseline and result[key] > baseline[key]*tolerance:
+            regressions.append("%s %s: %.4g -> %.4g (+%.0f%%)" % (name, key,\
+                               baseline[key], result[key],\
+                               (result[key]/baseline[key]-1)*100))
+
+    return regressions
+
+def parseArguments():
+    ''' parse the command line '''
+    parser = argparse.ArgumentParser(description="measure the generator with "\
+                                     "synthetic configs")
+    parser.add_argument("--slaves", type=int, nargs="+", default=SLAVECOUNTS,\
+                        help="slave counts (default: %s)" % " ".join(map(str, SLAVECOUNTS)))
+    parser.add_argument("--variants", nargs="+", default=list(VARIANTS),\
+                        choices=list(VARIANTS), help="variants (default: all)")
+    parser.add_argument("--baseline", default=BASELINE, metavar="FILE",\
+                        help="baseline to compare with (default: benchmark/baseline.json)")
+    parser.add_argument("--save-baseline", action="store_true",\
+                        help="store the results as baseline instead of comparing")
+    return parser.parse_args()
+
+if __name__ == '__main__':
+    args = parseArguments()
+    baseline = {}
+
+    if not args.save_baseline and os.path.isfile(args.baseline):
+        with open(args.baseline, "r") as baselinefile:
+            baseline = json.load(baselinefile)
+
+    results = {}
+    regressions = []
+
+    with tempfile.TemporaryDirectory() as workdir:
+        print("%-8s %8s %12s %15s %15s %14s %12s" % ("variant", "slaves", "parse [ms]",\
+                "generate [ms]", "per slave [us]", "memory [KiB]", "vhdl [KiB]"))
+
+        for variant in args.variants:
+            for slaves in args.slaves:
+                name = "%s/%d" % (variant, slaves)
+                config = os.path.join(workdir, "suite_%s_%d.ini" % (variant, slaves))
+                writeConfig(config, slaves, variant)
+                result = results[name] = measure(config, workdir, slaves)
+                regressions += compare(name, result, baseline.get(name))
+                print("%-8s %8d %12.2f %15.2f %15.2f %14.1f %12.1f" % (variant, slaves,\
+                        result["parse"]*1000, result["generate"]*1000,\
+                        (result["parse"]+result["generate"])*1000000/slaves,\
+                        result["memory"]/1024, result["size"]/1024))
+
+    if args.save_baseline:
+        with open(args.baseline, "w") as baselinefile:
+            json.dump(results, baselinefile, indent=4, sort_keys=True)
+            baselinefile.write("\n")
+
+        print("\nbaseline saved: "+args.baseline)
+    elif not baseline:
+        print("\nno baseline to compare with, record one with --save-baseline")
+    elif regressions:
+        print("\nregressions:")
+
+        for regression in regressions:
+            print("\t"+regression)
+
+        sys.exit(1)
+    else:
+        print("\nno regressions")
@@ -0,0 +1,233 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+
+# standard
+from bisect import bisect_right
+# custom
+from wb_component import *
+
+''' this programm offers a class to store the address ranges of wishbone
+slaves sorted by their base address, which can be searched by address and
+checked for overlaps and gaps '''
+
+__author__ = "Harald Heckmann"
+__copyright__ = "Copyright 2016"
+__credits__ = ["Prof. Dr. Steffen Reith (steffen.reith@hs-rm.de)", \
+                "Harald Heckmann (harald.heckmann@student.hs-rm.de)"]
+__license__ = "GPLv3"
+__version__ = "1.0.0"
+__maintainer__ = "Harald Heckmann"
+__email__ = "harald.heckmann@student.hs-rm.de"
+__status__ = "Development (beta)"
+
+class WishboneAddressMap:
+    ''' WishboneAddressMap is a class which stores slaves in a list sorted by
+their base address. The position of a slave is found by binary search, but the
+list shifts its entries on every insert and remove, so these take O(N) and
+extend should be used for many slaves. Slaves with the same base address or
+overlapping ranges are kept and reported by getOverlaps. Iterating over the
+map yields the slaves in address order '''
+
+    def __init__(self):
+        ''' initialize an empty address map '''
+        # parallel lists, sorted by base address
+        self._bases = []
+        self._slaves = []
+        # highest end address of the slaves 0..i, rebuilt on demand
+        self._reach = None
+
+    def __len__(self):
+        return len(self._slaves)
+
+    def __iter__(self):
+        return iter(self._slaves)
+
+    def __contains__(self, slave):
+        return self._index(slave) >= 0
+
+    def __str__(self):
+        strrepr = "Address map: "+str(len(self._slaves))+" slaves"
+
+        for first, second in self.getOverlaps():
+            strrepr += "\n\tOverlap: "+self._describe(first)+" and "+self._describe(second)
+
+        for start, end in self.getGaps():
+            strrepr += "\n\tGap: "+hex(start)+" - "+hex(end-1)
+
+        return strrepr
+
+    def _describe(self, slave):
+        ''' get the name and address range of a slave for reports
+            @param slave: slave to describe
+            @type slave: WishboneSlave
+            @rtype: String
+            @return: name [first address - last address]
+        '''
+        base = slave.getBaseAddress()
+        return slave.getName()+" ["+hex(base)+" - "+hex(base+slave.getAddressSize()-1)+"]"
+
+    def insert(self, slave):
+        ''' insert a slave behind all slaves with a lower or equal base
+            address. The position is found by binary search, the list insert
+            moves all slaves behind it (O(N))
+            @param slave: slave with base address and address size
+            @type slave: WishboneSlave
+            @raise ValueError: raised if the slave has no base address or
+                               no address size
+        '''
+        base = slave.getBaseAddress()
+
+        if base == None or slave.getAddressSize() == None:
+            raise ValueError("slave "+slave.getName()+" needs a base_address and an address_size")
+
+        index = bisect_right(self._bases, base)
+        self._bases.insert(index, base)
+        self._slaves.insert(index, slave)
+        self._reach = None
+
+    def extend(self, slaves):
+        ''' insert several slaves at once. The slaves are merged into the
+            sorted lists by one sort instead of one list insert per slave,
+            slaves with equal base addresses keep their order
+            @param slaves: slaves with base address and address size
+            @type slaves: List containing WishboneSlave objects
+            @raise ValueError: raised if a slave has no base address or no
+                               address size, no slave is inserted then
+        '''
+        for slave in slaves:
+            if slave.getBaseAddress() == None or slave.getAddressSize() == None:
+                raise ValueError("slave "+slave.getName()+" needs a base_address and an address_size")
+
+        # the sort is stable and runs in linear time on the sorted part
+        merged = sorted(zip(self._bases+[slave.getBaseAddress() for slave in slaves],\
+                            self._slaves+list(slaves)), key=lambda entry: entry[0])
+        self._bases = [base for base, slave in merged]
+        self._slaves = [slave for base, slave in merged]
+        self._reach = None
+
+    def remove(self, slave):
+        ''' remove a slave from the map, the list moves all slaves behind
+            it (O(N))
+            @param slave: slave to remove
+            @type slave: WishboneSlave
+            @raise ValueError: raised if the slave is not in the map
+        '''
+        index = self._index(slave)
+
+        if index < 0:
+            raise ValueError("slave "+slave.getName()+" is not in the address map")
+
+        del self._bases[index]
+        del self._slaves[index]
+        self._reach = None
+
+    def _index(self, slave):
+        ''' get the position of a slave in the sorted lists
+            @param slave: slave to search
+            @type slave: WishboneSlave
+            @rtype: Integer
+            @return: index on success, -1 if the slave is not in the map
+        '''
+        base = slave.getBaseAddress()
+        index = bisect_right(self._bases, base)-1
+
+        # slaves with the same base address are stored next to each other
+        while index >= 0 and self._bases[index] == base:
+            if self._slaves[index] is slave:
+                return index
+
+            index -= 1
+
+        return -1
+
+    def find(self, address):
+        ''' get the slave, whose address range contains an address. If
+            ranges overlap, the slave with the highest base address wins.
+            Without overlaps this is one binary search (O(log N)). With
+            overlaps the search steps back over the slaves below the address
+            until none of them reaches it, which takes O(N) for a slave
+            overlapping all others. The first search after a change rebuilds
+            the reach of the slaves (O(N))
+            @param address: address to search
+            @type address: Integer
+            @rtype: WishboneSlave
+            @return: slave on success, None if no slave contains the address
+        '''
+        if self._reach == None:
+            self._buildReach()
+
+        index = bisect_right(self._bases, address)-1
+
+        while index >= 0:
+            slave = self._slaves[index]
+
+            if address < self._bases[index]+slave.getAddressSize():
+                return slave
+
+            # no slave with a lower base address reaches this address
+            if index == 0 or self._reach[index-1] <= address:
+                return None
+
+            index -= 1
+
+        return None
+
+    def _buildReach(self):
+        ''' calculate the highest end address of the slaves 0..i for every i '''
+        reach = []
+        end = 0
+
+        for base, slave in zip(self._bases, self._slaves):
+            end = max(end, base+slave.getAddressSize())
+            reach.append(end)
+
+        self._reach = reach
+
+    def getOverlaps(self):
+        ''' get the slaves, whose address ranges overlap. Every slave is
+            reported once, together with the slave before it reaching
+            furthest into its range
+            @rtype: List
+            @return: (slave, overlapping slave) tuples in address order
+        '''
+        overlaps = []
+        end = None
+        owner = None
+
+        for base, slave in zip(self._bases, self._slaves):
+            if end != None and base < end:
+                overlaps.append((owner, slave))
+
+            if end == None or base+slave.getAddressSize() > end:
+                end = base+slave.getAddressSize()
+                owner = slave
+
+        return overlaps
+
+    def getGaps(self, start=0, end=None):
+        ''' get the address ranges between start and end, which are not
+            covered by any slave
+            @param start: first address to check
+            @type start: Integer
+            @param end: address behind the last address to check, None for
+                        the end of the last slave
+            @type end: Integer
+            @rtype: List
+            @return: (first address, address behind the gap) tuples
+        '''
+        gaps = []
+        covered = start
+
+        for base, slave in zip(self._bases, self._slaves):
+            if end != None and base >= end:
+                break
+
+            if base > covered:
+                gaps.append((covered, base))
+
+            covered = max(covered, base+slave.getAddressSize())
+
+        if end != None and covered < end:
+            gaps.append((covered, end))
+
+        return gaps
@@ -0,0 +1,163 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+
+# standard
+from bisect import bisect_left, bisect_right
+# custom
+from wb_component import *
+
+''' this programm offers a class to assign base addresses to wishbone slaves,
+which declare only their address size, so the address decoder stays cheap '''
+
+__author__ = "Harald Heckmann"
+__copyright__ = "Copyright 2016"
+__credits__ = ["Prof. Dr. Steffen Reith (steffen.reith@hs-rm.de)", \
+                "Harald Heckmann (harald.heckmann@student.hs-rm.de)"]
+__license__ = "GPLv3"
+__version__ = "1.0.0"
+__maintainer__ = "Harald Heckmann"
+__email__ = "harald.heckmann@student.hs-rm.de"
+__status__ = "Development (beta)"
+
+class WishboneAllocator:
+    ''' WishboneAllocator is a class which places slaves without base address
+into the free address ranges. Every slave gets a block of the next power of
+two above its address size and alignment, aligned to its own size. The blocks
+are placed from the biggest to the smallest at the lowest free address, so
+they fill each other's gaps without holes and slaves of similar size share
+their upper address bits. Then every slave with a power of two sized range
+can be decoded by prefix matching and partial decoding needs few bits '''
+
+    def __init__(self, addressbuswidth):
+        ''' initialize an allocator for an address bus
+            @param addressbuswidth: width of the address bus, which limits
+                                    the addresses
+            @type addressbuswidth: Integer
+        '''
+        self._end = 1 << addressbuswidth
+        # occupied ranges, sorted and merged: first address, address behind
+        self._starts = []
+        self._ends = []
+        # (block, first, end) -> address where the last search succeeded
+        self._hints = {}
+
+    def _reserve(self, first, end):
+        ''' mark a range as occupied, it is merged with the ranges it
+            touches or overlaps
+            @param first: first address of the range
+            @type first: Integer
+            @param end: address behind the range
+            @type end: Integer
+        '''
+        # the merged ranges are disjoint, so both lists are sorted
+        lo = bisect_left(self._ends, first)
+        hi = bisect_right(self._starts, end)
+
+        if lo < hi:
+            first = min(first, self._starts[lo])
+            end = max(end, self._ends[hi-1])
+
+        self._starts[lo:hi] = [first]
+        self._ends[lo:hi] = [end]
+
+    def _block(self, slave):
+        ''' get the size of the aligned block a slave occupies
+            @param slave: slave to place
+            @type slave: WishboneSlave
+            @rtype: Integer
+            @return: power of two
+        '''
+        size = max(slave.getAddressSize(), slave.getAddressAlignment() or 1, 1)
+        return 1 << (size-1).bit_length()
+
+    def _limits(self, slave):
+        ''' get the addresses a slave can be placed in
+            @param slave: slave to place
+            @type slave: WishboneSlave
+            @rtype: Tuple
+            @return: (first address, address behind the last address)
+        '''
+        region = slave.getAddressRegion()
+
+        if region == None:
+            return (0, self._end)
+
+        return (region[0], min(region[1]+1, self._end))
+
+    def _place(self, slave):
+        ''' get the lowest free address of the block of a slave
+            @param slave: slave to place
+            @type slave: WishboneSlave
+            @raise ValueError: raised if there is no free block left
+            @rtype: Integer
+            @return: base address
+        '''
+        block = self._block(slave)
+        first, end = self._limits(slave)
+        # ranges are only added, so nothing is free in front of the last hit
+        key = (block, first, end)
+        address = max(first, self._hints.get(key, first))
+        address = -(-address // block)*block
+
+        while address+block <= end:
+            index = bisect_right(self._starts, address)-1
+
+            if index >= 0 and self._ends[index] > address:
+                address = -(-self._ends[index] // block)*block
+            elif index+1 < len(self._starts) and self._starts[index+1] < address+block:
+                address = -(-self._ends[index+1] // block)*block
+            else:
+                self._hints[key] = address
+                return address
+
+        raise ValueError("no free address range of "+hex(block)+" for slave "\
+                         +slave.getName()+" between "+hex(first)+" and "+hex(end-1))
+
+    def _check(self, slave):
+        ''' check a slave with base address against its constraints
+            @param slave: slave with base address
+            @type slave: WishboneSlave
+            @raise ValueError: raised if a constraint is violated
+        '''
+        base = slave.getBaseAddress()
+        alignment = slave.getAddressAlignment()
+        region = slave.getAddressRegion()
+
+        if alignment != None and base % alignment:
+            raise ValueError("base_address of slave "+slave.getName()\
+                             +" is not aligned to "+hex(alignment))
+
+        if region != None and (base < region[0]\
+        or base+slave.getAddressSize()-1 > region[1]):
+            raise ValueError("slave "+slave.getName()+" is not inside of its "\
+                             "address_region "+hex(region[0])+"-"+hex(region[1]))
+
+    def allocate(self, placed, slaves):
+        ''' assign base addresses to slaves, around the slaves which have a
+            base address already
+            @param placed: slaves with base address
+            @type placed: Iterable containing WishboneSlave objects
+            @param slaves: slaves without base address, they get one
+            @type slaves: List containing WishboneSlave objects
+            @raise ValueError: raised if a slave has no address size, a
+                               constraint is violated or a slave does not
+                               fit, no base address is assigned then
+        '''
+        for slave in placed:
+            self._check(slave)
+            self._reserve(slave.getBaseAddress(),\
+                          slave.getBaseAddress()+max(slave.getAddressSize(), 1))
+
+        for slave in slaves:
+            if slave.getAddressSize() == None:
+                raise ValueError("slave "+slave.getName()+" needs an address_size")
+
+        bases = []
+        # biggest blocks first, slaves of the same size in the given order
+        for slave in sorted(slaves, key=lambda slave: -self._block(slave)):
+            base = self._place(slave)
+            self._reserve(base, base+self._block(slave))
+            bases.append((slave, base))
+
+        for slave, base in bases:
+            slave.setBaseAddress(base)
@@ -0,0 +1,201 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+
+# standard
+import os
+import glob
+import configparser
+from time import perf_counter
+from concurrent.futures import ProcessPoolExecutor
+# custom
+from wb_file_manager import WishboneFileManager
+from wb_intercon import interconName
+from wb_template import WishboneTemplate
+from wb_stamp import directory, OUTPUTDIR
+
+''' this programm offers a class to generate the intercons of many config
+files in one run, distributed over a pool of worker processes '''
+
+__author__ = "Harald Heckmann"
+__copyright__ = "Copyright 2016"
+__credits__ = ["Prof. Dr. Steffen Reith (steffen.reith@hs-rm.de)", \
+                "Harald Heckmann (harald.heckmann@student.hs-rm.de)"]
+__license__ = "GPLv3"
+__version__ = "1.0.0"
+__maintainer__ = "Harald Heckmann"
+__email__ = "harald.heckmann@student.hs-rm.de"
+__status__ = "Development (beta)"
+
+def _loadTemplates(templatedir=None):
+    ''' compile the templates, so every job of a worker process uses the
+        same compiled templates
+        @param templatedir: see WishboneFileManager
+        @type templatedir: String
+    '''
+    wbmngr = WishboneFileManager(templatedir=templatedir)
+
+    for path in (wbmngr._tmplinter, wbmngr._tmplslave, wbmngr._tmplmaster,\
+                 wbmngr._tmplcrossbar):
+        WishboneTemplate.load(path)
+
+def _outputPath(config, outputdir=None):
+    ''' get the vhdl file a config file is generated into, without parsing
+        the whole config: the name of the general section decides it, named
+        like WishboneIntercon.setName names the intercon
+        @param config: path to the config file
+        @type config: String
+        @param outputdir: see WishboneFileManager
+        @type outputdir: String
+        @rtype: String
+        @return: absolute path of the vhdl file, None if the config file
+                 cannot be read, its job reports the error then
+    '''
+    parser = configparser.ConfigParser()
+
+    try:
+        if not parser.read(config):
+            return None
+
+        name = "wb_intercon"
+
+        for section in parser.sections():
+            if "general" in section.lower() and parser.has_option(section, "name"):
+                name = interconName(parser.get(section, "name"))
+    except configparser.Error:
+        return None
+
+    return directory(outputdir, OUTPUTDIR)+name+".vhdl"
+
+def _generate(config, deterministic, templatedir=None, outputdir=None):
+    ''' job of a worker: generate the intercon of one config file, unless
+        it is up to date
+        @param config: path to the config file
+        @type config: String
+        @param deterministic: see WishboneFileManager
+        @type deterministic: Boolean
+        @param templatedir: see WishboneFileManager
+        @type templatedir: String
+        @param outputdir: see WishboneFileManager
+        @type outputdir: String
+        @rtype: Tuple
+        @return: (config, status, path of the vhdl file, seconds, message)
+    '''
+    start = perf_counter()
+
+    try:
+        wbmngr = WishboneFileManager(deterministic=deterministic,\
+                                     templatedir=templatedir, outputdir=outputdir)
+
+        if wbmngr.update(config):
+            status = "generated"
+        else:
+            status = "up to date"
+
+        return (config, status, os.path.abspath(wbmngr._vhdlinter), perf_counter()-start, "")
+    except Exception as e:
+        return (config, "failure", None, perf_counter()-start, str(e))
+
+class WishboneBatch:
+    ''' WishboneBatch is a class which generates the intercons of several
+config files. The jobs run in parallel in worker processes, each worker
+compiles the templates once and keeps them for all of its jobs '''
+
+    def __init__(self, configs, workers=None, deterministic=False,\
+                 templatedir=None, outputdir=None):
+        ''' initialize the batch
+            @param configs: paths or glob patterns (e.g. cfg/*.ini) of the
+                            config files
+            @type configs: List containing Strings
+            @param workers: number of worker processes, None for one per
+                            processor
+            @type workers: Integer
+            @param deterministic: see WishboneFileManager
+            @type deterministic: Boolean
+            @param templatedir: see WishboneFileManager
+            @type templatedir: String
+            @param outputdir: see WishboneFileManager
+            @type outputdir: String
+        '''
+        self._configs = []
+        self._workers = workers
+        self._deterministic = deterministic
+        self._templatedir = templatedir
+        self._outputdir = outputdir
+
+        for pattern in configs:
+            matches = sorted(glob.glob(pattern))
+
+            # a path without match is kept, so its job reports the error
+            for config in (matches if matches else [pattern]):
+                if config not in self._configs:
+                    self._configs.append(config)
+
+    def getConfigs(self):
+        ''' get the config files of the batch, the glob patterns expanded
+            @rtype: List containing Strings
+            @return: paths of the config files
+        '''
+        return self._configs
+
+    def run(self):
+        ''' generate the intercons of all config files. A single config file
+            is generated without starting a worker process. A config file
+            generated into the same vhdl file as an earlier one (same
+            intercon name) fails without running, so no job overwrites the
+            file and the stamp of another job
+            @rtype: List
+            @return: (config, status, path of the vhdl file, seconds,
+                     message) per config file, in the order of the configs
+        '''
+        results = {}
+        writers = {}
+        jobs = []
+
+        for config in self._configs:
+            output = _outputPath(config, self._outputdir)
+
+            if output != None and output in writers:
+                results[config] = (config, "failure", output, 0.0,\
+                                   "same vhdl file as "+writers[output]+": "+output)
+                continue
+            elif output != None:
+                writers[output] = config
+
+            jobs.append((config, self._deterministic, self._templatedir, self._outputdir))
+
+        workers = min(self._workers or os.cpu_count() or 1, len(jobs))
+
+        if workers <= 1:
+            _loadTemplates(self._templatedir)
+            done = [_generate(*job) for job in jobs]
+        else:
+            # the templates compiled here are inherited by forked workers
+            _loadTemplates(self._templatedir)
+
+            with ProcessPoolExecutor(max_workers=workers, initializer=_loadTemplates,\
+                                     initargs=(self._templatedir,)) as pool:
+                done = list(pool.map(_generate, *zip(*jobs)))
+
+        for result in done:
+            results[result[0]] = result
+
+        return [results[config] for config in self._configs]
+
+    def printSummary(self, results, seconds):
+        ''' print the status and the time of every job
+            @param results: results of run
+            @type results: List
+            @param seconds: time of the whole batch
+            @type seconds: Float
+        '''
+        width = max([len(config) for config, *_ in results]+[6])
+        print("%-*s %-10s %10s" % (width, "config", "status", "time [ms]"))
+
+        for config, status, output, took, message in results:
+            print("%-*s %-10s %10.2f" % (width, config, status, took*1000))
+
+            if message:
+                print("\t"+message)
+
+        failed = sum(1 for result in results if result[1] == "failure")
+        print("%d jobs, %d failed, %.2f ms" % (len(results), failed, seconds*1000))
@@ -2,7 +2,10 @@
 # -*- coding: UTF-8 -*-
 
 # standard
-from random import randint
+from enum import IntEnum
+from itertools import count
+# custom
+from wb_record import *
 
 ''' this programm offers a class to store abstract informations for wishbone 
 master and slave modules, which can be processed afterwards '''
@@ -31,12 +34,71 @@ class Const:
             raise self.ConstError("Can't unbind const(%s)"%name)
         raise NameError(name)
 
+class Endianess(IntEnum):
+    LENDIAN = 0x00000001
+    BENDIAN = 0x00000002
+
+class DataFlow(IntEnum):
+    READ = 0x00000003
+    WRITE = 0x00000004
+    RW = 0x00000005
+
+class DataTransfer(IntEnum):
+    SINGLE = 0x00000006
+    BURST = 0x00000007
+    RMW = 0x00000008
+
+class Granularity(IntEnum):
+    BYTE = 0x00000009
+    WORD = 0x00000010
+
+# one constant table shared by all components, the enums are ints, so
+# CONST.X and the plain values compare equal
+_CONST = Const()
+for _enum in (Endianess, DataFlow, DataTransfer, Granularity):
+    for _member in _enum:
+        setattr(_CONST, _member.name, _member)
+del _enum, _member
+
+# names of the constants in config files and records
+ENDIANESS = {"big": Endianess.BENDIAN, "little": Endianess.LENDIAN}
+DATAFLOW = {"r": DataFlow.READ, "w": DataFlow.WRITE, "rw": DataFlow.RW}
+DATATRANSFER = {"single": DataTransfer.SINGLE, "burst": DataTransfer.BURST,
+                "rmw": DataTransfer.RMW}
+MODE = {"classic": False, "pipelined": True}
+GRANULARITY = {"byte": Granularity.BYTE, "word": Granularity.WORD}
+
+# serial numbers for default names
+_serial = count()
 
 class WishboneComponent:
     ''' WishboneComponent is a class which offers functions to store information 
 and read them again, where the stored informations can be used to describe 
 properties, which both, master as well as slave components, use'''
 
+    # components are created in big numbers, so the attributes are stored
+    # in slots instead of a __dict__ per instance
+    __slots__ = ("_name", "_databuswidth", "_endianess", "_dataflow",
+                "_datatransfer", "_pipelined", "_err", "_rty", "_tga", "_tgc",
+                "_tgd")
+
+    CONST = _CONST
+
+    # record keys -> (attribute, check), see fromRecord
+    _RECORD = {
+        "name": ("_name", text),
+        "data_bus_width": ("_databuswidth", natural),
+        "endianess": ("_endianess", choice(ENDIANESS)),
+        "data_flow": ("_dataflow", choice(DATAFLOW)),
+        "data_transfer": ("_datatransfer", choice(DATATRANSFER)),
+        "mode": ("_pipelined", choice(MODE)),
+        "err": ("_err", choice(BOOLEAN)),
+        "rty": ("_rty", choice(BOOLEAN)),
+        "tga": ("_tga", choice(BOOLEAN)),
+        "tgc": ("_tgc", choice(BOOLEAN)),
+        "tgd": ("_tgd", choice(BOOLEAN)),
+    }
+
     def __init__(self):
         # masters and slaves common signals:
         # name              = string
@@ -45,30 +107,20 @@ properties, which both, master as well as slave components, use'''
         # endianess         = big/little
         # data_flow         = r/w/rw
         # data_transfer     = single/burst/rmw
+        # mode              = classic/pipelined
         # err               = true/false
         # rty               = true/false
         # tga               = true/false
         # tgc               = true/false
         # tgd               = true/false
-        self.CONST = Const()
-        self.CONST.LENDIAN = 0x00000001
-        self.CONST.BENDIAN = 0x00000002
-        self.CONST.READ = 0x00000003
-        self.CONST.WRITE = 0x00000004
-        self.CONST.RW = 0x00000005
-        self.CONST.SINGLE = 0x00000006
-        self.CONST.BURST = 0x00000007
-        self.CONST.RMW = 0x00000008
-        self.CONST.BYTE = 0x00000009
-        self.CONST.WORD = 0x00000010
-        
         # one underscore = protected visibility
         # two underscores = private visibility
-        self._name = "wbcomp"+str(randint(0,1000))
+        self._name = "wbcomp"+str(next(_serial))
         self._databuswidth = None
         self._endianess = None
         self._dataflow = None
-        #self._datatransfer = None
+        self._datatransfer = DataTransfer.SINGLE
+        self._pipelined = False
         self._err = None
         self._rty = None
         self._tga = None
@@ -98,7 +150,6 @@ properties, which both, master as well as slave components, use'''
             else:
                 strrepr += "\nDirection of dataflow: Read/Write"
 
-        '''
         if self._datatransfer == None:
             strrepr += "\nDatatransfer cycle: None"
         else:
@@ -110,7 +161,11 @@ properties, which both, master as well as slave components, use'''
                 strrepr += "\nDatatransfer cycle: Burst"
             else:
                 strrepr += "\nDatatransfer cycle: Read, modify, write"
-        '''
+
+        if self._pipelined:
+            strrepr += "\nBus cycle mode: Pipelined"
+        else:
+            strrepr += "\nBus cycle mode: Classic"
 
         strrepr += "\nEnable error signal: "+str(self._err)+"\nEnable retry signal: "\
                     +str(self._rty)+"\nEnable tga signal: "+str(self._tga)\
@@ -119,6 +174,23 @@ properties, which both, master as well as slave components, use'''
 
         return strrepr.replace("None", "Not defined")
 
+    @classmethod
+    def fromRecord(cls, record):
+        ''' create a component from a record in one pass. The values are
+            checked together instead of calling the setter of every field
+            @param record: keys of the config files mapped to the values,
+                           constants can be given by their config name
+                           (e.g. "big") or as constant
+            @type record: Dictionary
+            @raise ValueError: raised on unknown keys and values which are
+                               not allowed
+            @rtype: WishboneComponent
+            @return: component configured by the record
+        '''
+        component = cls()
+        applyRecord(component, record, cls._RECORD)
+        return component
+
     def setName(self, name):
         ''' set a name for a wishbone component
             @param name: name to set
@@ -291,8 +363,11 @@ properties, which both, master as well as slave components, use'''
         return self._dataflow
 
     
-    #def setDataTransfer(self, datatransfer):
-        ''' define how data will be transfered (single, burst, rmw)
+    def setDataTransfer(self, datatransfer):
+        ''' define how data will be transfered (single, burst, rmw). Burst
+            components get the cycle type signals cti and bte (registered
+            feedback bursts), rmw cycles keep cyc asserted between the read
+            and the write, which already holds the bus
             @param datatransfer: can be WishboneComponent.CONST.SINGLE, .BURST, .RMW
             @type datatransfer: Integer
             @raise TypeError: raised if parameter type mismatch is found
@@ -301,7 +376,6 @@ properties, which both, master as well as slave components, use'''
             @rtype: Boolean
             @return: true on success, false otherwise
         '''
-        '''
         try:
             if not isinstance(datatransfer, int):
                 raise TypeError("datatransfer got the wrong type,"
@@ -321,25 +395,44 @@ properties, which both, master as well as slave components, use'''
 
         self._datatransfer = datatransfer
         return True
-        '''
 
-    #def getDataTransfer(self):
-        ''' get the endianess
-            @raise UnboundLocalError: raised if no datatransfer was set yet
+    def getDataTransfer(self):
+        ''' get the datatransfer
             @rtype: Integer
-            @return: datatransfer (constant) on success, None otherwise
+            @return: datatransfer (constant), default: CONST.SINGLE
         '''
+        return self._datatransfer
+
+    def setPipelinedMode(self, enabled):
+        ''' activate (true) / deactivate (false) the pipelined mode of
+            wishbone B4. A pipelined slave gets stall_o and accepts a new
+            request every clock it does not stall, a pipelined master gets
+            stall_i and does not wait for ack before the next request
+            @param enabled: Boolean to activate/deactivate the pipelined mode
+            @type enabled: Boolean
+            @raise TypeError: raised if parameter type mismatch is found
+            @rtype: Boolean
+            @return: true on success, false otherwise
         '''
         try:
-            if self._datatransfer == None:
-                raise UnboundLocalError("datatransfer was not set yet")
-        except UnboundLocalError as e:
-            print("WishboneComponent.getDataTransfer:\n"
-                +"\tUnboundLocalError occurred: "+e.args[0]+"\nstopping execution")
+            if not isinstance(enabled, bool):
+                raise TypeError("enabled got the wrong type,"
+                    +"excepted: Boolean, got: "+str(type(enabled)))
+        except TypeError as e:
+            print("WishboneComponent.setPipelinedMode:\n"
+                +"\tTypeError occurred: "+e.args[0]+"\nstopping execution")
+            return False
 
-        return self._datatransfer
+        self._pipelined = enabled
+        return True
+
+    def getPipelinedMode(self):
+        ''' get the enabled state of the pipelined mode
+            @rtype: Boolean
+            @return: true/false for pipelined/classic, default: false
         '''
-        
+        return self._pipelined
+
     def setErrorSignal(self, enabled):
         ''' activate (true) / deactivate (false) the error signal
             @param enabled: Boolean to activate/deactivate the error signal
@@ -519,6 +612,17 @@ class WishboneMaster(WishboneComponent):
     ''' WishboneMaster is a subclass of WishboneComponent and was created to 
 store informations from a wishbone component which are present in a master
 component, but not in a slave'''
+    __slots__ = ("__addressbuswidth", "__weight", "__lock", "__connections")
+
+    # private attributes are stored with the class name in front
+    _RECORD = dict(WishboneComponent._RECORD)
+    _RECORD.update({
+        "address_bus_width": ("_WishboneMaster__addressbuswidth", natural),
+        "weight": ("_WishboneMaster__weight", positive),
+        "lock": ("_WishboneMaster__lock", choice(BOOLEAN)),
+        "connect": ("_WishboneMaster__connections", names),
+    })
+
     def __init__(self):
         #initfunction
         # call super
@@ -527,13 +631,22 @@ component, but not in a slave'''
         self._name = "wbm"
         # set address_bus_width
         self.__addressbuswidth = None
+        # arbitration (multiple masters)
+        self.__weight = 1
+        self.__lock = False
+        # crossbar: names of the reachable slaves, None for every slave
+        self.__connections = None
 
     def __str__(self):
         strrepr = "------------------ Wishbone Master: "+str(self._name)\
                   +" ------------------\n"
         strrepr += super().__str__()
         strrepr += "\nMaster specific:\n\tSize of Addressbus: "\
-                + str(self.__addressbuswidth)
+                + str(self.__addressbuswidth)+"\n\tArbitration weight: "\
+                + str(self.__weight)+"\n\tEnable lock signal: "+str(self.__lock)
+
+        if self.__connections != None:
+            strrepr += "\n\tConnected slaves: "+", ".join(self.__connections)
 
         return strrepr.replace("None", "Not defined")
 
@@ -580,10 +693,125 @@ component, but not in a slave'''
 
         return self.__addressbuswidth
 
+    def setWeight(self, weight):
+        ''' Set the weight of the master for weighted round robin arbitration,
+            the master gets weight turns per round
+            @param weight: weight of the master (at least 1)
+            @type weight: Integer
+            @raise TypeError: raised if parameter type mismatch is found
+            @raise ValueError: raised if weight is smaller than 1
+            @rtype: Boolean
+            @return: true on success, false otherwise
+        '''
+        try:
+            if not isinstance(weight, int):
+                raise TypeError("weight got the wrong type,"
+                    +"excepted: Integer, got: "+str(type(weight)))
+            else:
+                if weight < 1:
+                    raise ValueError("weight has to be at least 1")
+        except TypeError as e:
+            print("WishboneMaster.setWeight:\n"
+                +"\tTypeError occurred: "+e.args[0]+"\nstopping execution")
+            return False
+        except ValueError as e:
+            print("WishboneMaster.setWeight:\n"
+                +"\tValueError occurred: "+e.args[0]+"\nstopping execution")
+            return False
+
+        self.__weight = weight
+        return True
+
+    def getWeight(self):
+        ''' get the weight of the master for weighted round robin arbitration
+            @rtype: Integer
+            @return: weight of the master, default: 1
+        '''
+        return self.__weight
+
+    def setLockSignal(self, enabled):
+        ''' activate (true) / deactivate (false) the lock signal. While the
+            master asserts lock_o, the arbiter does not take the bus away
+            @param enabled: Boolean to activate/deactivate the lock signal
+            @type enabled: Boolean
+            @raise TypeError: raised if parameter type mismatch is found
+            @rtype: Boolean
+            @return: true on success, false otherwise
+        '''
+        try:
+            if not isinstance(enabled, bool):
+                raise TypeError("enabled got the wrong type,"
+                    +"excepted: Boolean, got: "+str(type(enabled)))
+        except TypeError as e:
+            print("WishboneMaster.setLockSignal:\n"
+                +"\tTypeError occurred: "+e.args[0]+"\nstopping execution")
+            return False
+
+        self.__lock = enabled
+        return True
+
+    def getLockSignal(self):
+        ''' get the enabled state of the lock signal
+            @rtype: Boolean
+            @return: true/false for used/not used, default: false
+        '''
+        return self.__lock
+
+    def setConnections(self, slaves):
+        ''' Set the slaves the master can reach in a crossbar. No logic is
+            generated for the paths to other slaves
+            @param slaves: names of the slaves, None to reach every slave
+            @type slaves: List containing Strings, None
+            @raise TypeError: raised if parameter type mismatch is found
+            @rtype: Boolean
+            @return: true on success, false otherwise
+        '''
+        try:
+            if slaves != None and (not isinstance(slaves, list)\
+            or not all(isinstance(slave, str) for slave in slaves)):
+                raise TypeError("slaves got the wrong type,"
+                    +"excepted: List containing Strings or None, got: "+str(type(slaves)))
+        except TypeError as e:
+            print("WishboneMaster.setConnections:\n"
+                +"\tTypeError occurred: "+e.args[0]+"\nstopping execution")
+            return False
+
+        if slaves == None:
+            self.__connections = None
+        else:
+            self.__connections = [slave.replace(" ", "_") for slave in slaves]
+
+        return True
+
+    def getConnections(self):
+        ''' get the names of the slaves the master can reach in a crossbar
+            @rtype: List containing Strings, None
+            @return: names of the slaves, None for every slave (default)
+        '''
+        return self.__connections
+
 class WishboneSlave(WishboneComponent):
     ''' WishboneMaster is a subclass of WishboneComponent and was created to 
 store informations from a wishbone component which are present in a slave
 component, but not in a master'''
+    __slots__ = ("__baseaddress", "__addresssize", "__addressinggranularity",
+                "__wordsize", "__addressbushigh", "__addressbuslow",
+                "__addressalignment", "__addressregion")
+
+    # private attributes are stored with the class name in front
+    _RECORD = dict(WishboneComponent._RECORD)
+    _RECORD.update({
+        "base_address": ("_WishboneSlave__baseaddress", natural),
+        "address_size": ("_WishboneSlave__addresssize", natural),
+        "addressing_granularity": ("_WishboneSlave__addressinggranularity",
+                                   choice(GRANULARITY)),
+        "word_size": ("_WishboneSlave__wordsize", natural),
+        "address_bus_high": ("_WishboneSlave__addressbushigh", natural),
+        "address_bus_low": ("_WishboneSlave__addressbuslow", natural),
+        "address_alignment": ("_WishboneSlave__addressalignment", power),
+        "address_region": ("_WishboneSlave__addressregion", region),
+    })
+
     def __init__(self):
         #initfunction
         # List of keywords for slave modules and possible values:
@@ -594,10 +822,12 @@ component, but not in a master'''
         # word_size                 = decimal value
         # address_bus_high          = decimal value
         # address_bus_low           = decimal value (lowest bit = 0)
+        # address_alignment         = hexadecimal value (power of two)
+        # address_region            = hexadecimal value-hexadecimal value
         # call super
         super().__init__()
         # override name
-        self._name = "wbs"+str(randint(0,1000))
+        self._name = "wbs"+str(next(_serial))
         # set slave specific variables
         self.__baseaddress = None
         self.__addresssize = None
@@ -605,6 +835,9 @@ component, but not in a master'''
         self.__wordsize = None
         self.__addressbushigh = None
         self.__addressbuslow = None
+        # constraints for the allocation of the base address
+        self.__addressalignment = None
+        self.__addressregion = None
 
     def __str__(self):
         strrepr = "------------------ Wishbone Slave: "+str(self._name)\
@@ -632,6 +865,13 @@ component, but not in a master'''
 
         strrepr += "\n\tWordsize: "+str(self.__wordsize)+"\n\tHighest addressbit: "\
                 +str(self.__addressbushigh)+"\n\tLowest addressbit: "+str(self.__addressbuslow)
+
+        if self.__addressalignment != None:
+            strrepr += "\n\tAddressalignment: "+hex(self.__addressalignment)
+
+        if self.__addressregion != None:
+            strrepr += "\n\tAddressregion: "+hex(self.__addressregion[0])+" - "\
+                    +hex(self.__addressregion[1])
                 
         return strrepr.replace("None", "Not defined")
 
@@ -928,3 +1168,77 @@ component, but not in a master'''
                 +"\tUnboundLocalError occurred: "+e.args[0]+"\nstopping execution")
 
         return self.__addressbuslow
+
+    def setAddressAlignment(self, alignment):
+        ''' Set the alignment of the base address, which is assigned by the
+            allocator if the slave has no base address
+            @param alignment: alignment in addresses, a power of two
+            @type alignment: Integer
+            @raise TypeError: raised if parameter type mismatch is found
+            @raise ValueError: raised if alignment is not a power of two
+            @rtype: Boolean
+            @return: true on success, false otherwise
+        '''
+        try:
+            if not isinstance(alignment, int):
+                raise TypeError("alignment got the wrong type,"
+                    +"excepted: Integer, got: "+str(type(alignment)))
+            else:
+                if alignment <= 0 or alignment & (alignment-1):
+                    raise ValueError("address alignment has to be a power of two")
+        except TypeError as e:
+            print("WishboneSlave.setAddressAlignment:\n"
+                +"\tTypeError occurred: "+e.args[0]+"\nstopping execution")
+            return False
+        except ValueError as e:
+            print("WishboneSlave.setAddressAlignment:\n"
+                +"\tValueError occurred: "+e.args[0]+"\nstopping execution")
+            return False
+
+        self.__addressalignment = alignment
+        return True
+
+    def getAddressAlignment(self):
+        ''' get the alignment of the base address
+            @rtype: Integer
+            @return: alignment, None if the slave has no alignment constraint
+        '''
+        return self.__addressalignment
+
+    def setAddressRegion(self, region):
+        ''' Set the region, in which the allocator places the slave if it
+            has no base address
+            @param region: (first address, last address) of the region
+            @type region: Tuple containing two Integers
+            @raise TypeError: raised if parameter type mismatch is found
+            @raise ValueError: raised if the region is empty or negative
+            @rtype: Boolean
+            @return: true on success, false otherwise
+        '''
+        try:
+            if not isinstance(region, tuple) or len(region) != 2\
+            or not all(isinstance(address, int) for address in region):
+                raise TypeError("region got the wrong type,"
+                    +"excepted: Tuple containing two Integers, got: "+str(type(region)))
+            else:
+                if region[0] < 0 or region[0] > region[1]:
+                    raise ValueError("address region has to be first address-last address")
+        except TypeError as e:
+            print("WishboneSlave.setAddressRegion:\n"
+                +"\tTypeError occurred: "+e.args[0]+"\nstopping execution")
+            return False
+        except ValueError as e:
+            print("WishboneSlave.setAddressRegion:\n"
+                +"\tValueError occurred: "+e.args[0]+"\nstopping execution")
+            return False
+
+        self.__addressregion = region
+        return True
+
+    def getAddressRegion(self):
+        ''' get the region, in which the slave is placed
+            @rtype: Tuple
+            @return: (first address, last address), None if the slave has
+                     no placement constraint
+        '''
+        return self.__addressregion
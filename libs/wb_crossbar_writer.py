@@ -0,0 +1,492 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+
+# standard
+from itertools import chain
+# custom
+from wb_component import *
+from wb_intercon import *
+from wb_vhdl_writer import WishboneVhdlWriter
+
+''' this programm offers a class to emit the vhdl code of a crossbar intercon,
+in which every slave has its own arbiter '''
+
+__author__ = "Harald Heckmann"
+__copyright__ = "Copyright 2016"
+__credits__ = ["Prof. Dr. Steffen Reith (steffen.reith@hs-rm.de)", \
+                "Harald Heckmann (harald.heckmann@student.hs-rm.de)"]
+__license__ = "GPLv3"
+__version__ = "1.0.0"
+__maintainer__ = "Harald Heckmann"
+__email__ = "harald.heckmann@student.hs-rm.de"
+__status__ = "Development (beta)"
+
+class WishboneCrossbarWriter(WishboneVhdlWriter):
+    ''' WishboneCrossbarWriter is a subclass of WishboneVhdlWriter, which
+translates a WishboneIntercon into a crossbar. Every master decodes its own
+address, every slave has its own arbiter and every master its own return
+multiplexer, so masters accessing different slaves transfer at the same time.
+Paths between a master and the slaves it is not connected to get no logic '''
+
+    def write(self, stream):
+        ''' write the crossbar section by section into a file object
+            @param stream: object offering write(String)
+            @type stream: file object
+            @raise ValueError: raised if pipeline stages are requested, slaves
+                               overlap, a master is connected to an unknown
+                               slave or a connected master and slave differ
+                               in data bus width
+        '''
+        intercon = self._intercon
+
+        if intercon.getPipelineStages() > 0:
+            raise ValueError("pipeline stages are not supported by the crossbar topology")
+
+        if intercon.getReturnPath() == intercon.CONST.ANDOR:
+            raise ValueError("return_path = and_or is not supported by the crossbar topology")
+
+        self._prune = intercon.getPrune()
+        self._masters = self._pruned(intercon.getMasters())
+        self._master = self._pruned([intercon.getMaster()])[0]
+        self._slaves = self._sortedSlaves()
+        self._tgabits = str(intercon.getTgaBits()-1)
+        self._tgcbits = str(intercon.getTgcBits()-1)
+        self._tgdbits = str(intercon.getTgdBits()-1)
+        self._comparators = 0
+        self._prefixmatches = 0
+        self._partial = {}
+        self._partialmatches = 0
+        self._partialbits = set()
+        self._connect()
+        # only the port definitions of the slaves are fragments
+        self._fragments = {}
+
+        # placeholder values
+        values = {}
+        values["date"] = self._date()
+        values["iname"] = intercon.getName()
+        values["masters"] = self._masterPortDefinitions()
+        values["slaves"] = self._slavePorts()
+        values["signals"] = chain(self._selectSignals(), self._slaveSignals())
+        values["crossbar"] = self._timed("decoder", chain(self._selectAssignments(),\
+                                         self._requestPaths(), self._returnPaths()))
+
+        self._tmplinter.stream(stream, values)
+
+    def _hasStall(self):
+        ''' masters have to wait for the arbiter of a slave, so every master
+            gets a stall_i port
+            @rtype: Boolean
+            @return: true
+        '''
+        return True
+
+    def _connect(self):
+        ''' build the sparse connectivity matrix from the connections of the
+            masters. _slavemasters lists the indices of the masters of every
+            slave, _masterslaves the indices of the slaves of every master,
+            the position in this list is the bit of the slave in <master>_ssel
+            (stored in _sselbits)
+            @raise ValueError: raised if a master is connected to an unknown
+                               slave, the data bus widths differ or a classic
+                               master is connected to a pipelined slave
+        '''
+        slavenrs = {}
+
+        for slavenr, slave in enumerate(self._slaves):
+            slavenrs[slave.getName()] = slavenr
+
+        self._slavemasters = [[] for slave in self._slaves]
+        self._masterslaves = []
+        self._sselbits = {}
+
+        for masternr, master in enumerate(self._masters):
+            names = master.getConnections()
+
+            if names == None:
+                connected = list(range(len(self._slaves)))
+            else:
+                for name in names:
+                    if name not in slavenrs:
+                        raise ValueError("master "+master.getName()\
+                            +" is connected to an unknown slave: "+name)
+
+                connected = sorted(set([slavenrs[name] for name in names]))
+
+            for bit, slavenr in enumerate(connected):
+                self._sselbits[(masternr, slavenr)] = bit
+                slave = self._slaves[slavenr]
+
+                if slave.getDataBusWidth() != master.getDataBusWidth():
+                    raise ValueError("connected master and slave need the same"\
+                        +" data_bus_width: "+master.getName()+", "+slave.getName())
+
+                # the crossbar does not hold requests, a classic master would
+                # strobe the same request into a pipelined slave several times
+                if slave.getPipelinedMode() and not master.getPipelinedMode():
+                    raise ValueError("pipelined slaves can only be connected to pipelined"\
+                        +" masters in a crossbar: "+master.getName()+", "+slave.getName())
+
+                self._slavemasters[slavenr].append(masternr)
+
+            self._masterslaves.append(connected)
+
+    def _ssel(self, masternr, slavenr):
+        ''' get the bit of a slave in the slave select vector of a master
+            @param masternr: index of the master
+            @type masternr: Integer
+            @param slavenr: index of the (connected) slave
+            @type slavenr: Integer
+            @rtype: String
+            @return: vhdl expression (std_logic)
+        '''
+        return self._masters[masternr].getName()+"_ssel("\
+            +str(self._sselbits[(masternr, slavenr)])+")"
+
+    def _owned(self, masternr, slavenr):
+        ''' get the condition, which is true while a master is connected to
+            a slave (it addresses the slave and owns it)
+            @param masternr: index of the master
+            @type masternr: Integer
+            @param slavenr: index of the (connected) slave
+            @type slavenr: Integer
+            @rtype: String
+            @return: vhdl condition
+        '''
+        masters = self._slavemasters[slavenr]
+        owned = self._ssel(masternr, slavenr)+" = '1'"
+
+        if len(masters) > 1:
+            sname = self._slaves[slavenr].getName()
+            owned += " and "+sname+"_granted = '1' and "+sname+"_owner = "\
+                +str(masters.index(masternr))
+
+        return owned
+
+    def _bitSwap(self, signal, width):
+        ''' get an expression, which reverses the bit order of a signal
+            @param signal: name of the signal
+            @type signal: String
+            @param width: width of the signal in bits
+            @type width: Integer
+            @rtype: String
+            @return: vhdl expression
+        '''
+        if width <= 1:
+            return signal
+
+        return " & ".join([signal+"("+str(i)+")" for i in range(width)])
+
+    def _selectSignals(self):
+        ''' generator for the slave select vectors of the masters '''
+        for masternr, master in enumerate(self._masters):
+            if self._masterslaves[masternr]:
+                yield "\nsignal "+master.getName()+"_ssel : std_logic_vector("\
+                    +str(len(self._masterslaves[masternr])-1)+" downto 0) := (others => '0');"
+
+    def _slaveSignals(self):
+        ''' generator for the request vectors and arbiter states of the
+            slaves shared by several masters '''
+        shared = (self._intercon.getArbitration() != self._intercon.CONST.PRIORITY)
+
+        for slavenr, slave in enumerate(self._slaves):
+            masters = self._slavemasters[slavenr]
+
+            if len(masters) < 2:
+                continue
+
+            sname = slave.getName()
+            yield "\n\n-- arbiter of "+sname
+            yield "\nsignal "+sname+"_req : std_logic_vector("+str(len(masters)-1)\
+                +" downto 0) := (others => '0');"
+            yield "\nsignal "+sname+"_owner : integer range 0 to "+str(len(masters)-1)+" := 0;"
+
+            if shared:
+                slots = self._arbiterSlots([self._masters[masternr] for masternr in masters])
+                yield "\nsignal "+sname+"_slot : integer range 0 to "+str(len(slots)-1)+" := 0;"
+
+            yield "\nsignal "+sname+"_granted, "+sname+"_busy : std_logic := '0';"
+
+    def _selectAssignments(self):
+        ''' generator for the address decoders, one range match per master
+            and connected slave '''
+        yield "\n\n\t-- address decoders, one range match per connected slave"
+
+        for masternr, master in enumerate(self._masters):
+            mname = master.getName()
+            adr = mname+"_adr_o"
+
+            for bit, slavenr in enumerate(self._masterslaves[masternr]):
+                slave = self._slaves[slavenr]
+                match = self._addressMatch(slave, self._rangeMatch(slave, adr), adr,\
+                                           master.getAddressBusWidth())
+                yield "\n\t"+mname+"_ssel("+str(bit)+") <= '1' when ("+match\
+                    +") else '0';"
+
+        for line in self._prefixReport("\n\t"):
+            yield line
+
+    def _slaveInput(self, slavenr, signal, values):
+        ''' generator for the assignment of a slave input, which is either
+            connected directly to the only master or selected by the owner
+            @param slavenr: index of the slave
+            @type slavenr: Integer
+            @param signal: signal suffix, e.g. "adr_i"
+            @type signal: String
+            @param values: value of every master of the slave
+            @type values: List
+        '''
+        sname = self._slaves[slavenr].getName()
+
+        if len(values) == 1:
+            yield "\n\t"+sname+"_"+signal+" <= "+values[0]+";"
+            return
+
+        yield "\n\twith "+sname+"_owner select "+sname+"_"+signal+" <="
+
+        for nr, value in enumerate(values):
+            if nr == len(values)-1:
+                yield "\n\t\t"+value+" when others;"
+            else:
+                yield "\n\t\t"+value+" when "+str(nr)+","
+
+    def _requestPaths(self):
+        ''' generator for the request path and the arbiter of every slave '''
+        intercon = self._intercon
+
+        for slavenr, slave in enumerate(self._slaves):
+            sname = slave.getName()
+            masters = [self._masters[masternr] for masternr in self._slavemasters[slavenr]]
+
+            if not masters:
+                yield "\n\n\t-- "+sname+": not connected"
+
+                for line in self._slaveIdle(slave):
+                    yield "\n\t"+line
+
+                continue
+
+            yield "\n\n\t-- "+sname+": "+", ".join([master.getName() for master in masters])
+
+            adrslice = "_adr_o("+str(slave.getHighestAddressBit())+" downto "\
+                +str(slave.getLowestAddressBit())+")"
+            swap = [master.getEndianess() != slave.getEndianess() for master in masters]
+            dbwidth = slave.getDataBusWidth()
+
+            if len(masters) > 1:
+                granted = " and "+sname+"_granted"
+            else:
+                granted = ""
+
+            values = {}
+
+            if self._writesData(slave):
+                values["dat_i"] = [self._byteSwap(master.getName()+"_dat_o", dbwidth)\
+                    if swap[nr] else master.getName()+"_dat_o" for nr, master in enumerate(masters)]
+
+            values["adr_i"] = [master.getName()+adrslice for master in masters]
+            values["sel_i"] = [self._bitSwap(master.getName()+"_sel_o", dbwidth >> 3)\
+                if swap[nr] else master.getName()+"_sel_o" for nr, master in enumerate(masters)]
+            values["we_i"] = [master.getName()+"_we_o" for master in masters]
+            values["cyc_i"] = [master.getName()+"_cyc_o and "\
+                +self._ssel(masternr, slavenr)+granted\
+                for masternr, master in zip(self._slavemasters[slavenr], masters)]
+            values["stb_i"] = [master.getName()+"_stb_o and "\
+                +self._ssel(masternr, slavenr)+granted\
+                for masternr, master in zip(self._slavemasters[slavenr], masters)]
+
+            for signal, enabled in (("tga_i", WishboneComponent.getTgaSignal),\
+                                    ("tgc_i", WishboneComponent.getTgcSignal),\
+                                    ("tgd_i", WishboneComponent.getTgdSignal),\
+                                    ("cti_i", self._isBurst),\
+                                    ("bte_i", self._isBurst)):
+                if signal == "tgd_i" and not self._writesData(slave):
+                    continue
+
+                if enabled(slave):
+                    values[signal] = [master.getName()+"_"+signal[:3]+"_o"\
+                        if enabled(master) else "(others => '0')" for master in masters]
+
+            for signal in ("dat_i", "adr_i", "sel_i", "we_i", "cyc_i", "stb_i",\
+                           "tga_i", "tgc_i", "tgd_i", "cti_i", "bte_i"):
+                if signal in values:
+                    for line in self._slaveInput(slavenr, signal, values[signal]):
+                        yield line
+
+            if len(masters) > 1:
+                for line in self._slaveArbiter(slavenr, masters):
+                    yield line
+
+    def _slaveArbiter(self, slavenr, masters):
+        ''' generator for the arbiter of a slave shared by several masters
+            @param slavenr: index of the slave
+            @type slavenr: Integer
+            @param masters: masters of the slave
+            @type masters: List
+        '''
+        intercon = self._intercon
+        sname = self._slaves[slavenr].getName()
+        requests = [sname+"_req("+str(nr)+")" for nr in range(len(masters))]
+
+        yield "\n"
+
+        for nr, masternr in enumerate(self._slavemasters[slavenr]):
+            yield "\n\t"+requests[nr]+" <= "+masters[nr].getName()+"_cyc_o and "\
+                +self._ssel(masternr, slavenr)+";"
+
+        # the owner keeps the slave while it requests it (or holds lock)
+        if any(master.getLockSignal() for master in masters):
+            yield "\n\twith "+sname+"_owner select "+sname+"_busy <="
+
+            for nr, master in enumerate(masters):
+                if master.getLockSignal():
+                    value = sname+"_granted and ("+requests[nr]+" or "\
+                        +master.getName()+"_lock_o)"
+                else:
+                    value = sname+"_granted and "+requests[nr]
+
+                if nr == len(masters)-1:
+                    yield "\n\t\t"+value+" when others;"
+                else:
+                    yield "\n\t\t"+value+" when "+str(nr)+","
+        else:
+            yield "\n\t"+sname+"_busy <= "+sname+"_granted and "+sname+"_req("\
+                +sname+"_owner);"
+
+        if intercon.getArbitration() == intercon.CONST.PRIORITY:
+            slots = None
+        else:
+            slots = self._arbiterSlots(masters)
+
+        yield "\n"
+
+        for line in self._arbiterProcess(sname+"_arbiter", sname+"_", requests, slots):
+            yield line
+
+    def _slaveIdle(self, slave):
+        ''' get the assignments (without indentation) for a slave, which is
+            not connected to any master
+            @param slave: unconnected slave
+            @type slave: WishboneSlave
+            @rtype: List
+            @return: list of vhdl statements
+        '''
+        sname = slave.getName()
+        lines = [sname+"_dat_i <= (others => '0');",
+                 sname+"_sel_i <= (others => '0');",
+                 sname+"_adr_i <= (others => '0');",
+                 sname+"_cyc_i <= '0';",
+                 sname+"_stb_i <= '0';",
+                 sname+"_we_i <= '0';"]
+
+        if not self._writesData(slave):
+            del lines[0]
+
+        if slave.getTgaSignal():
+            lines.append(sname+"_tga_i <= (others => '0');")
+
+        if slave.getTgcSignal():
+            lines.append(sname+"_tgc_i <= (others => '0');")
+
+        if slave.getTgdSignal() and self._writesData(slave):
+            lines.append(sname+"_tgd_i <= (others => '0');")
+
+        if self._isBurst(slave):
+            lines.append(sname+"_cti_i <= (others => '0');")
+            lines.append(sname+"_bte_i <= (others => '0');")
+
+        return lines
+
+    def _returnMux(self, signal, entries, default):
+        ''' generator for a conditional assignment, which connects the
+            output of one slave to an input of a master
+            @param signal: name of the master input
+            @type signal: String
+            @param entries: (condition, value) for every possible source
+            @type entries: List
+            @param default: value if no condition is true
+            @type default: String
+        '''
+        if not entries:
+            yield "\n\t"+signal+" <= "+default+";"
+            return
+
+        for nr, (condition, value) in enumerate(entries):
+            if nr == 0:
+                yield "\n\t"+signal+" <= "+value+" when ("+condition+") else"
+            else:
+                yield "\n\t\t"+value+" when ("+condition+") else"
+
+        yield "\n\t\t"+default+";"
+
+    def _returnPaths(self):
+        ''' generator for the return multiplexer of every master '''
+        for masternr, master in enumerate(self._masters):
+            mname = master.getName()
+            slaves = [(slavenr, self._slaves[slavenr]) for slavenr in self._masterslaves[masternr]]
+            yield "\n\n\t-- "+mname+": return path"
+
+            dat = []
+            ack = []
+            err = []
+            rty = []
+            tgd = []
+            stall = []
+
+            for slavenr, slave in slaves:
+                sname = slave.getName()
+                selected = self._ssel(masternr, slavenr)+" = '1'"
+                owned = self._owned(masternr, slavenr)
+
+                # write only slaves are no input of the return multiplexer
+                if self._readsData(slave):
+                    if slave.getEndianess() != master.getEndianess():
+                        dat.append((selected, self._byteSwap(sname+"_dat_o",\
+                                                             slave.getDataBusWidth())))
+                    else:
+                        dat.append((selected, sname+"_dat_o"))
+
+                ack.append((owned, sname+"_ack_o"))
+
+                if slave.getErrorSignal():
+                    err.append((owned, sname+"_err_o"))
+
+                if slave.getRetrySignal():
+                    rty.append((owned, sname+"_rty_o"))
+
+                if slave.getTgdSignal() and self._readsData(slave):
+                    tgd.append((selected, sname+"_tgd_o"))
+
+                # the master waits while another master owns the slave
+                if len(self._slavemasters[slavenr]) > 1:
+                    stall.append((selected+" and ("+sname+"_granted = '0' or "+sname\
+                        +"_owner /= "+str(self._slavemasters[slavenr].index(masternr))+")", "'1'"))
+
+                # a pipelined master waits while the slave does not accept the
+                # request, classic slaves accept one request per termination
+                if slave.getPipelinedMode():
+                    stall.append((owned, sname+"_stall_o"))
+                elif master.getPipelinedMode():
+                    term = [sname+"_ack_o"]
+                    if slave.getErrorSignal(): term.append(sname+"_err_o")
+                    if slave.getRetrySignal(): term.append(sname+"_rty_o")
+                    stall.append((owned, "not ("+" or ".join(term)+")"))
+
+            for line in chain(self._returnMux(mname+"_dat_i", dat, "(others => '0')"),\
+                              self._returnMux(mname+"_ack_i", ack, "'0'")):
+                yield line
+
+            if master.getErrorSignal():
+                for line in self._returnMux(mname+"_err_i", err, "'0'"):
+                    yield line
+
+            if master.getRetrySignal():
+                for line in self._returnMux(mname+"_rty_i", rty, "'0'"):
+                    yield line
+
+            if master.getTgdSignal():
+                for line in self._returnMux(mname+"_tgd_i", tgd, "(others => '0')"):
+                    yield line
+
+            for line in self._returnMux(mname+"_stall_i", stall, "'0'"):
+                yield line
@@ -5,11 +5,14 @@
 import os
 #import sys
 import configparser
-from datetime import datetime
-from copy import copy
+import tempfile
+from contextlib import nullcontext
 # custom
 from wb_component import *
 from wb_intercon import *
+from wb_vhdl_writer import WishboneVhdlWriter
+from wb_crossbar_writer import WishboneCrossbarWriter
+from wb_stamp import *
 
 ''' this programm offers functions to read wishbone config files
 and generate an intercon in vhdl '''
@@ -24,378 +27,390 @@ __maintainer__ = "Harald Heckmann"
 __email__ = "harald.heckmann@student.hs-rm.de"
 __status__ = "Development (beta)"
 
+def _hexadecimal(value):
+    ''' convert a hexadecimal config value (e.g. 0x00001000) '''
+    return int(value, 16)
+
+def _region(value):
+    ''' convert an address region config value (e.g. 0x1000-0x1fff) '''
+    first, last = value.split("-")
+    return (int(first, 16), int(last, 16))
+
+def _names(value):
+    ''' convert a comma separated config value into a list of names '''
+    return [name.strip() for name in value.split(",") if name.strip()]
+
+# config schema: key -> (setter, converter, allowed values). Keys with allowed
+# values are looked up case insensitive in the allowed values, all other keys
+# are passed through the converter
+GENERAL_KEYS = {
+    "name": (WishboneIntercon.setName, str, None),
+    "tga_bits": (WishboneIntercon.setTgaBits, int, None),
+    "tgc_bits": (WishboneIntercon.setTgcBits, int, None),
+    "tgd_bits": (WishboneIntercon.setTgdBits, int, None),
+    "data_bus_width": (WishboneIntercon.setDataBusWidth, int, None),
+    "address_bus_width": (WishboneIntercon.setAddressBusWidth, int, None),
+    "decoder": (WishboneIntercon.setDecoderStyle, None, DECODER),
+    "prefix_match": (WishboneIntercon.setPrefixMatch, None, BOOLEAN),
+    "partial_decode": (WishboneIntercon.setPartialDecode, None, BOOLEAN),
+    "prune": (WishboneIntercon.setPrune, None, BOOLEAN),
+    "pipeline_stages": (WishboneIntercon.setPipelineStages, int, None),
+    "arbitration": (WishboneIntercon.setArbitration, None, ARBITRATION),
+    "bus_parking": (WishboneIntercon.setBusParking, None, BOOLEAN),
+    "topology": (WishboneIntercon.setTopology, None, TOPOLOGY),
+    "return_path": (WishboneIntercon.setReturnPath, None, RETURNPATH),
+}
+
+# configurations both, master and slave, have
+COMPONENT_KEYS = {
+    "name": (WishboneComponent.setName, str, None),
+    "data_bus_width": (WishboneComponent.setDataBusWidth, int, None),
+    "endianess": (WishboneComponent.setEndianess, None, ENDIANESS),
+    "data_flow": (WishboneComponent.setDataFlow, None, DATAFLOW),
+    "data_transfer": (WishboneComponent.setDataTransfer, None, DATATRANSFER),
+    "mode": (WishboneComponent.setPipelinedMode, None, MODE),
+    "err": (WishboneComponent.setErrorSignal, None, BOOLEAN),
+    "rty": (WishboneComponent.setRetrySignal, None, BOOLEAN),
+    "tga": (WishboneComponent.setTgaSignal, None, BOOLEAN),
+    "tgc": (WishboneComponent.setTgcSignal, None, BOOLEAN),
+    "tgd": (WishboneComponent.setTgdSignal, None, BOOLEAN),
+}
+
+# configurations only the master has
+MASTER_KEYS = dict(COMPONENT_KEYS)
+MASTER_KEYS.update({
+    "address_bus_width": (WishboneMaster.setAddressBusWidth, int, None),
+    "weight": (WishboneMaster.setWeight, int, None),
+    "lock": (WishboneMaster.setLockSignal, None, BOOLEAN),
+    "connect": (WishboneMaster.setConnections, _names, None),
+})
+
+# configurations only the slave has
+SLAVE_KEYS = dict(COMPONENT_KEYS)
+SLAVE_KEYS.update({
+    "base_address": (WishboneSlave.setBaseAddress, _hexadecimal, None),
+    "address_size": (WishboneSlave.setAddressSize, _hexadecimal, None),
+    "addressing_granularity": (WishboneSlave.setAddressingGranularity, None,
+                               GRANULARITY),
+    "word_size": (WishboneSlave.setWordSize, int, None),
+    "address_bus_high": (WishboneSlave.setHighestAddressBit, int, None),
+    "address_bus_low": (WishboneSlave.setLowestAddressBit, int, None),
+    "address_alignment": (WishboneSlave.setAddressAlignment, _hexadecimal, None),
+    "address_region": (WishboneSlave.setAddressRegion, _region, None),
+})
+
 class WishboneFileManager:
     ''' WishboneFileManager is a class offering functions to properly parse
 a wishbone intercon config file '''
 
-    def __init__(self):
-        ''' initialize all variables required '''
+    def __init__(self, intercon=None, deterministic=False,\
+                 templatedir=None, outputdir=None, timer=None):
+        ''' initialize all variables required
+            @param intercon: intercon to generate, e.g. created by
+                             WishboneIntercon.fromRecords, None to parse a
+                             config file
+            @type intercon: WishboneIntercon
+            @param deterministic: leave out the date stamp, so the same
+                                  inputs result in a byte identical file
+            @type deterministic: Boolean
+            @param templatedir: directory of the templates, None for vhdl/
+                                in the working directory
+            @type templatedir: String
+            @param outputdir: directory of the generated intercon, None for
+                              vhdl/ in the working directory
+            @type outputdir: String
+            @param timer: timer for the phases of the generation, None to
+                          measure nothing
+            @type timer: WishboneTimer
+        '''
         self.__config = configparser.ConfigParser()
-        self.__intercon = WishboneIntercon()
+        self.__intercon = WishboneIntercon() if intercon == None else intercon
+        self._allocated = []
+        self._statistics = {}
+        self._deterministic = deterministic
+        self._timer = timer
 
         self._workdir = os.getcwd()+"/"
-        self._tmplinter = self._workdir+"vhdl/template_intercon.tmpl"
-        self._vhdlinter = self._workdir+"vhdl/wb_intercon.vhdl"
-        self._tmplslave = self._workdir+"vhdl/template_slave.tmpl"
+        self._templatedir = directory(templatedir, TEMPLATEDIR)
+        self._outputdir = directory(outputdir, OUTPUTDIR)
+        self._tmplinter = self._templatedir+"template_intercon.tmpl"
+        self._vhdlinter = self._outputdir+"wb_intercon.vhdl"
+        self._tmplslave = self._templatedir+"template_slave.tmpl"
+        self._tmplmaster = self._templatedir+"template_master.tmpl"
+        self._tmplcrossbar = self._templatedir+"template_crossbar.tmpl"
+        # stamps of the generated intercons, see update
+        self._cachedir = directory(None, CACHEDIR)
+
+        if intercon != None:
+            self._vhdlinter = self._outputdir+intercon.getName()+".vhdl"
 
     def parse(self, file_to_parse="./cfg/wishbone.ini"):
-        ''' parse the given wishbone config file '''
-        self.__config.read(file_to_parse)
-        wasfound = False
+        ''' parse the given wishbone config file. The kind of every section
+            is determined once, every key is then applied by one lookup in
+            the schema of this kind
+            @param file_to_parse: path to the config file
+            @type file_to_parse: String
+            @raise configparser.Error: raised on unknown sections or keys
+            @raise ValueError: raised on values which are not allowed
+        '''
+        with self._phase("read"):
+            self.__config.read(file_to_parse)
+
+        with self._phase("parse"):
+            self._parseSections(self.__config, self.__intercon)
+
+    def _parseSections(self, config, intercon):
+        ''' check the sections read from a config file and add them to the
+            intercon
+            @param config: config containing the sections
+            @type config: configparser.ConfigParser
+            @param intercon: intercon to configure
+            @type intercon: WishboneIntercon
+            @raise configparser.Error: raised on unknown sections or keys
+            @raise ValueError: raised on values which are not allowed and
+                               slaves which cannot be allocated
+        '''
+        slaves = []
+        # sections of the slaves without base address, see writeAddressMap
+        self._allocated = []
 
         # sections: general, master, <prefix>slave<sufix>
-        for section in self.__config.sections():
+        for section in config.sections():
             secl = section.lower()
 
             if "master" in secl:
                 wbcomp = WishboneMaster()
+                schema = MASTER_KEYS
             elif "slave" in secl:
                 wbcomp = WishboneSlave()
-            elif "general" in secl: 
-                pass
+                schema = SLAVE_KEYS
+            elif "general" in secl:
+                wbcomp = intercon
+                schema = GENERAL_KEYS
             else:
                 raise configparser.Error("unknown section: "+section)
 
-            for key in self.__config[section]:
-                keyl = key.lower()
-
-                # parse general intercon configuration
-                if "general" in secl:
-                    if keyl == "name":
-                        self.__intercon.setName(str(self.__config[section][key]))
-                        self._vhdlinter = self._workdir+"vhdl/"+self.__intercon.getName()+".vhdl"
-                    elif keyl == "tga_bits":
-                        self.__intercon.setTgaBits(int(self.__config[section][key]))
-                    elif keyl == "tgc_bits":
-                        self.__intercon.setTgcBits(int(self.__config[section][key]))
-                    elif keyl == "tgd_bits":
-                        self.__intercon.setTgdBits(int(self.__config[section][key]))
-                    elif keyl == "data_bus_width":
-                        self.__intercon.setDataBusWidth(int(self.__config[section][key]))
-                    elif keyl == "address_bus_width":
-                        self.__intercon.setAddressBusWidth(int(self.__config[section][key]))
-                    else:
-                        raise configparser.Error("unknown key: "+key)
-
-                # parse configurations both, master and slave, have
-                elif "master" in secl or "slave" in secl:
-                    wasfound = True
-                    # parse confiurations only the master has
-                    if "master" in secl:
-                        if keyl == "address_bus_width":
-                            wbcomp.setAddressBusWidth(int(self.__config[section][key]))
-                        else:
-                            wasfound = False
-
-                    # parse configurations only the slave has
-                    if "slave" in secl:
-                        if keyl == "base_address":
-                            wbcomp.setBaseAddress(int(self.__config[section][key], 16))
-                        elif keyl == "address_size":
-                            wbcomp.setAddressSize(int(self.__config[section][key], 16))
-                        elif keyl == "addressing_granularity":
-                            if self.__config[section][key].lower() == "byte":
-                                wbcomp.setAddressingGranularity(wbcomp.CONST.BYTE)
-                            elif self.__config[section][key].lower() == "word":
-                                wbcomp.setAddressingGranularity(wbcomp.CONST.WORD)
-                            else:
-                                raise ValueError("Adressinggranularity can be\
-                                    byte or word, got: "+self.__config[section][key])
-                        elif keyl == "word_size":
-                            wbcomp.setWordSize(int(self.__config[section][key]))
-                        elif keyl == "address_bus_high":
-                            wbcomp.setHighestAddressBit(int(self.__config[section][key]))
-                        elif keyl == "address_bus_low":
-                            wbcomp.setLowestAddressBit(int(self.__config[section][key]))
-                        else:
-                            wasfound = False
-
-                    if not wasfound:
-                        if keyl == "name":
-                            wbcomp.setName(str(self.__config[section][key]))
-                        elif keyl == "data_bus_width":
-                            wbcomp.setDataBusWidth(int(self.__config[section][key]))
-                        elif keyl == "endianess":
-                            if self.__config[section][key].lower() == "big":
-                                wbcomp.setEndianess(wbcomp.CONST.BENDIAN)
-                            elif self.__config[section][key].lower() == "little":
-                                wbcomp.setEndianess(wbcomp.CONST.LENDIAN)
-                            else:
-                                raise ValueError("Endianess can be big/little,\
-                                                got: "+self.__config[section][key])
-                        elif keyl == "data_flow":
-                            if self.__config[section][key].lower() == "r":
-                                wbcomp.setDataFlow(wbcomp.CONST.READ)
-                            elif self.__config[section][key].lower() == "w":
-                                wbcomp.setDataFlow(wbcomp.CONST.WRITE)
-                            elif self.__config[section][key].lower() == "rw":
-                                wbcomp.setDataFlow(wbcomp.CONST.RW)
-                            else:
-                                raise ValueError("Dataflow can be: r,w or rw,\
-                                                got: "+self.__config[section][key])
-                        elif keyl == "err":
-                            if self.__config[section][key].lower() == "true":
-                                wbcomp.setErrorSignal(True)
-                            elif self.__config[section][key].lower() == "false":
-                                wbcomp.setErrorSignal(False)
-                            else:
-                                raise ValueError("err can be: true or false,\
-                                    got: "+self.__config[section][key])
-
-                        elif keyl == "rty":
-                            if self.__config[section][key].lower() == "true":
-                                wbcomp.setRetrySignal(True)
-                            elif self.__config[section][key].lower() == "false":
-                                wbcomp.setRetrySignal(False)
-                            else:
-                                raise ValueError("rty can be: true or false,\
-                                    got: "+self.__config[section][key])
-                        elif keyl == "tga":
-                            if self.__config[section][key].lower() == "true":
-                                wbcomp.setTgaSignal(True)
-                            elif self.__config[section][key].lower() == "false":
-                                wbcomp.setTgaSignal(False)
-                            else:
-                                raise ValueError("tga can be: true or false,\
-                                    got: "+self.__config[section][key])
-                        elif keyl == "tgc":
-                            if self.__config[section][key].lower() == "true":
-                                wbcomp.setTgcSignal(True)
-                            elif self.__config[section][key].lower() == "false":
-                                wbcomp.setTgcSignal(False)
-                            else:
-                                raise ValueError("tgc can be: true or false,\
-                                    got: "+self.__config[section][key])
-                        elif keyl == "tgd":
-                            if self.__config[section][key].lower() == "true":
-                                wbcomp.setTgdSignal(True)
-                            elif self.__config[section][key].lower() == "false":
-                                wbcomp.setTgdSignal(False)
-                            else:
-                                raise ValueError("tgd can be: true or false,\
-                                    got: "+self.__config[section][key])
-                        else:
-                            raise configparser.Error("unknown key: "+key)
-
-            if "master" in secl: self.__intercon.setMaster(wbcomp)
-            elif "slave" in secl: self.__intercon.addSlave(wbcomp)
+            # interpolation is only needed for values referencing others
+            for key, value in config.items(section, raw=True):
+                if "%" in value:
+                    value = config.get(section, key)
+
+                entry = schema.get(key)
+
+                if entry == None:
+                    raise configparser.Error("unknown key: "+key)
+
+                setter, converter, allowed = entry
+
+                if allowed == None:
+                    accepted = setter(wbcomp, converter(value))
+                elif value.lower() in allowed:
+                    accepted = setter(wbcomp, allowed[value.lower()])
+                else:
+                    raise ValueError(key+" can be: "+", ".join(allowed)+", got: "+value)
+
+                # the setters print why they refuse a value and return false
+                if not accepted:
+                    raise ValueError(section+": "+key+" can not be: "+value)
+
+            if schema is MASTER_KEYS:
+                intercon.addMaster(wbcomp)
+            elif schema is SLAVE_KEYS:
+                slaves.append(wbcomp)
+
+                if wbcomp.getBaseAddress() == None:
+                    self._allocated.append((section, wbcomp))
+            elif config.has_option(section, "name"):
+                self._vhdlinter = self._outputdir+intercon.getName()+".vhdl"
+
+        # slaves without base address are placed when the address bus width
+        # and all fixed slaves are known
+        intercon.allocateSlaves(slaves)
+
+    def _phase(self, phase):
+        ''' measure a with block as a phase, if there is a timer
+            @param phase: name of the phase
+            @type phase: String
+            @rtype: Object
+            @return: context manager
+        '''
+        if self._timer is None:
+            return nullcontext()
+
+        return self._timer.phase(phase)
+
+    def writeAddressMap(self, file):
+        ''' write the parsed config file with the base addresses assigned
+            by the allocator, so the address map stays fixed when slaves are
+            added later. Comments of the parsed file are not kept
+            @param file: path of the config file to write
+            @type file: String
+            @raise OSError: raised if the file cannot be written
+        '''
+        for section, slave in self._allocated:
+            self.__config.set(section, "base_address", "0x%08x" % slave.getBaseAddress())
+
+        with open(file, "w") as config:
+            self.__config.write(config)
 
     def printConfigContent(self):
         ''' print parsed information nicely to console '''
         print(self.__intercon)
 
     
-    def generateIntercon(self):
-        ''' generate intercon and write it to a vhdl file'''
-        # read template
-        with open(self._tmplinter, "r") as template:
-            content = template.read()
-
-        # replace placeholders, header
-        content = content.replace("%date%", datetime.now().__str__())
-        content = content.replace("%iname%", self.__intercon.getName())
-        
-        # master
-        master = self.__intercon.getMaster()
-        content = content.replace("%mname%", master.getName())
-        content = content.replace("%mdbwidth%", str(master.getDataBusWidth()-1))
-        content = content.replace("%madwidth%", str(master.getAddressBusWidth()-1))
-        content = content.replace("%mselwidth%", str((master.getDataBusWidth() >> 3)-1))
-        
-        # additional port definitions
-        additional = ""
-        # additional signal definitions
-        s_additional = ""
-        # additional signal assignments
-        a_additional = ""
-
-        # set optional master signals
-        if master.getErrorSignal():
-            additional += "\n\t\t\t"+master.getName()+"_err_i : out std_logic := '0';"
-            s_additional += "\nsignal err : std_logic := '0';"
-            a_additional += "\n\t"+master.getName()+"_err_i <= err;"
-
-        if master.getRetrySignal():
-            additional += "\n\t\t\t"+master.getName()+"_rty_i : out std_logic := '0';"
-            s_additional += "\nsignal rty : std_logic := '0';"
-            a_additional += "\n\t"+master.getName()+"_rty_i <= rty;"
-
-        if master.getTgaSignal():
-            additional += "\n\t\t\t"+master.getName()+"_tga_o : in  std_logic_vector("\
-                +str(self.__intercon.getTgaBits()-1)+" downto 0);"
-            s_additional += "\nsignal tga : std_logic_vector(%d downto 0) := (others => '0');" % \
-                            (self.__intercon.getTgaBits()-1)
-            a_additional += "\n\ttga <= "+master.getName()+"_tga_o;"
-
-        if master.getTgcSignal():
-            additional += "\n\t\t\t"+master.getName()+"_tgc_o : in  std_logic_vector("\
-                +str(self.__intercon.getTgcBits()-1)+" downto 0);"
-            s_additional += "\nsignal tgc : std_logic_vector(%d downto 0) := (others => '0');" % \
-                            (self.__intercon.getTgcBits()-1)
-            a_additional += "\n\ttgc <= "+master.getName()+"_tgc_o;"
-
-        if master.getTgdSignal():
-            additional += "\n\t\t\t"+master.getName()+"_tgd_i : out std_logic_vector("\
-                +str(self.__intercon.getTgdBits()-1)+" downto 0) := (others => '0');"
-            additional += "\n\t\t\t"+master.getName()+"_tgd_o : in  std_logic_vector("\
-                +str(self.__intercon.getTgdBits()-1)+" downto 0);"
-            s_additional += "\nsignal tgdm2s : std_logic_vector(%d downto 0) := (others => '0');" % \
-                            (self.__intercon.getTgdBits()-1)
-            s_additional += "\nsignal tgds2m : std_logic_vector(%d downto 0) := (others => '0');" % \
-                            (self.__intercon.getTgdBits()-1)
-            a_additional += "\n\ttgdm2s <= "+master.getName()+"_tgd_o;"
-            a_additional += "\n\t"+master.getName()+"_tgd_i <= tgds2m;"
-
-        content = content.replace("%madditional%", additional)
-        content = content.replace("%additonalsignals%", s_additional)
-        content = content.replace("%additional_assignments%", a_additional)
-
-        # slave
-        with open(self._tmplslave, "r") as template:
-            fb_scontent = template.read()
-
-        slavedefinitions = ""
-
-        slavenr = 0;
-        slavemax = len(self.__intercon.getSlaves())
-
-        # address decoder and interconnection
-        interconnection = ""
-        # prevent latches when cyc is low (no valid cycle)
-        antilatch = "\n\t\t\t\t\t\t-- prevent latches on invalid slave selection"
-
-        for slave in sorted(self.__intercon.getSlaves()):
-            scontent = copy(fb_scontent)
-            scontent = scontent.replace("%sname%", slave.getName())
-            scontent = scontent.replace("%sdbwidth%", str(slave.getDataBusWidth()-1))
-            scontent = scontent.replace("%sadhi%", str(slave.getHighestAddressBit()))
-            scontent = scontent.replace("%sadlo%", str(slave.getLowestAddressBit()))
-            scontent = scontent.replace("%sselwidth%", str((slave.getDataBusWidth() >> 3)-1))
-
-            additional = ""
-
-            # define address decoder and interconnection
-            if slavenr == 0:
-                interconnection += "\n\t\t\t\t\t-- Baseaddress: "+hex(slave.getBaseAddress())\
-                                + ", size: "+hex(slave.getAddressSize())
-                interconnection += "\n\t\t\t\t\tif (to_integer(unsigned(adr)) <= "\
-                        +str((slave.getBaseAddress()+slave.getAddressSize()))+") then"
-            else:
-                interconnection += "\n\t\t\t\t\t-- Baseaddress: "+hex(slave.getBaseAddress())\
-                        + ", size: "+hex(slave.getAddressSize())
-                interconnection += "\n\t\t\t\t\telsif (to_integer(unsigned(adr)) <= "\
-                        +str((slave.getBaseAddress()+slave.getAddressSize()))+") then"
+    def _writer(self):
+        ''' create the writer for the topology of the intercon
+            @rtype: WishboneVhdlWriter
+            @return: shared bus or crossbar writer
+        '''
+        if self.__intercon.getTopology() == self.__intercon.CONST.CROSSBAR:
+            return WishboneCrossbarWriter(self.__intercon, self._tmplcrossbar,\
+                                          self._tmplslave, self._tmplmaster,\
+                                          self._deterministic, self._timer)
+
+        return WishboneVhdlWriter(self.__intercon, self._tmplinter, self._tmplslave,\
+                                  self._tmplmaster, self._deterministic, self._timer)
 
-            slavenr += 1
-
-            antilatch += "\n\t\t\t\t\t\t"+slave.getName()+"_dat_i <= (others => '0');"
-            antilatch += "\n\t\t\t\t\t\t"+slave.getName()+"_sel_i <= (others => '0');"
-
-            # endianess conversion
-            if slave.getEndianess() == master.getEndianess():
-                interconnection += "\n\t\t\t\t\t\t"+slave.getName()+"_dat_i <= datm2s;"
-                interconnection += "\n\t\t\t\t\t\tdats2m <= "+slave.getName()+"_dat_o;"
-                interconnection += "\n\t\t\t\t\t\t"+slave.getName()+"_sel_i <= sel;"
+    def generateIntercon(self):
+        ''' generate intercon and write it section by section to a vhdl
+            file. The sections are written to a temporary file next to it,
+            which replaces the vhdl file when the whole intercon is written,
+            so an error in the config keeps the last generated intercon
+            @raise ValueError: raised if the intercon cannot be generated
+        '''
+        writer = self._writer()
+        timer = self._timer
+        outputdir = os.path.dirname(self._vhdlinter)
+        os.makedirs(outputdir, exist_ok=True)
+        handle, temporary = tempfile.mkstemp(suffix=".tmp", dir=outputdir)
+
+        try:
+            if timer is None:
+                with os.fdopen(handle, "w") as intercon:
+                    writer.write(intercon)
             else:
-                interconnection += "\n\t\t\t\t\t\t-- conversion of endianess"
-                mbw = master.getDataBusWidth()-1
-                sbw = slave.getDataBusWidth()-1
-                selmax = (master.getDataBusWidth() >> 3)
-
-                for i in range(0, (slave.getDataBusWidth() >> 3)):
-                    datm2shi = str(mbw-8*i)
-                    if i != (slave.getDataBusWidth() >> 3): datm2slo = str(mbw-8*(i+1)+1)
-                    else: datm2slo = "0"
-
-                    dats2mhi = str(sbw-8*i)
-                    if i != (slave.getDataBusWidth() >> 3): dats2mlo = str(sbw-8*(i+1)+1)
-                    else: dats2mlo = "0"
-
-                    phi = str(8*(i+1)-1) 
-                    if i != 0: plo = str(8*i)
-                    else: plo = "0"
-
-                    interconnection += "\n\t\t\t\t\t\t"+slave.getName()+"_sel_i("\
-                        +str(i)+" downto "+str(i)+") <= sel("+str(selmax-(i+1))+" downto "\
-                        +str(selmax-(i+1))+");"
-                    interconnection += "\n\t\t\t\t\t\t"+slave.getName()+"_dat_i("\
-                        +phi+" downto "+plo+") <= datm2s("+datm2shi+" downto "\
-                        +datm2slo+");"
-                    interconnection += "\n\t\t\t\t\t\tdats2m("+datm2shi+" downto "\
-                        +datm2slo+") <= "+slave.getName()+"_dat_o("+phi+" downto "\
-                        +plo+");"
-
-                interconnection += "\n\t\t\t\t\t\t-- end of conversion"
-
-            interconnection += "\n\t\t\t\t\t\tack <= "+slave.getName()+"_ack_o;"
-            interconnection += "\n\t\t\t\t\t\t"+slave.getName()+"_adr_i <= adr("\
-                            +str(slave.getHighestAddressBit())+" downto "\
-                            +str(slave.getLowestAddressBit())+");"
-            interconnection += "\n\t\t\t\t\t\t"+slave.getName()+"_cyc_i <= cyc;"
-            interconnection += "\n\t\t\t\t\t\t"+slave.getName()+"_stb_i <= stb;"
-            interconnection += "\n\t\t\t\t\t\t"+slave.getName()+"_we_i <= we;"
-
-            antilatch += "\n\t\t\t\t\t\t"+slave.getName()+"_adr_i <= (others => '0');"
-            antilatch += "\n\t\t\t\t\t\t"+slave.getName()+"_cyc_i <= '0';"
-            antilatch += "\n\t\t\t\t\t\t"+slave.getName()+"_stb_i <= '0';"
-            antilatch += "\n\t\t\t\t\t\t"+slave.getName()+"_we_i <= '0';"
-
-            # set optional slave signals
-            if slave.getErrorSignal():
-                additional += ";\n\t\t\t"+slave.getName()+"_err_o : in  std_logic"
-                interconnection += "\n\t\t\t\t\t\terr <= "+slave.getName()+"_err_o;"
-                antilatch += "\n\t\t\t\t\t\terr <= '0';"
-
-            if slave.getRetrySignal():
-                additional += ";\n\t\t\t"+slave.getName()+"_rty_o : in  std_logic"
-                interconnection += "\n\t\t\t\t\t\trty <= "+slave.getName()+"_rty_o;"
-                antilatch += "\n\t\t\t\t\t\trty <= '0';"
-
-            if slave.getTgaSignal():
-                additional += ";\n\t\t\t"+slave.getName()+"_tga_i : out std_logic_vector("\
-                    +str(self.__intercon.getTgaBits()-1)+" downto 0) := (others => '0')"
-                interconnection += "\n\t\t\t\t\t\t"+slave.getName()+"_tga_i <= tga;"
-                antilatch += "\n\t\t\t\t\t\t"+slave.getName()+"_tga_i <= (others => '0');"
-
-            if slave.getTgcSignal():
-                additional += ";\n\t\t\t"+slave.getName()+"_tgc_i : out std_logic_vector("\
-                    +str(self.__intercon.getTgcBits()-1)+" downto 0) := (others => '0')"
-                interconnection += "\n\t\t\t\t\t\t"+slave.getName()+"_tgc_i <= tgc;"
-                antilatch += "\n\t\t\t\t\t\t"+slave.getName()+"_tgc_i <= (others => '0');"
-
-            if slave.getTgdSignal():
-                additional += ";\n\t\t\t"+slave.getName()+"_tgd_i : out std_logic_vector("\
-                    +str(self.__intercon.getTgdBits()-1)+" downto 0) := (others => '0')"
-                additional += ";\n\t\t\t"+slave.getName()+"_tgd_o : in  std_logic_vector("\
-                    +str(self.__intercon.getTgdBits()-1)+" downto 0)"
-                interconnection += "\n\t\t\t\t\t\t"+slave.getName()+"_tgd_i <= tgdm2s;"
-                antilatch += "\n\t\t\t\t\t\t"+slave.getName()+"_tgd_i <= (others => '0');"
-                antilatch += "\n\t\t\t\t\t\ttgds2m <= (others => '0');"
-                interconnection += "\n\t\t\t\t\t\ttgds2m <= "+slave.getName()+"_tgd_o;"
-
-            if (slavenr != slavemax):
-                additional += ";"
-
-            slavedefinitions += scontent.replace("%sadditional%", additional)+"\n"
-            
-
-        antilatch += "\n\t\t\t\t\t\tdats2m <= (others => '0');"
-        antilatch += "\n\t\t\t\t\t\tack <= '0';"
-        interconnection += "\n\t\t\t\t\telse%antilatch%\n\t\t\t\t\tend if;"
-
-        content = content.replace("%slaves%", slavedefinitions)
-        content = content.replace("%interconnection%", interconnection)
-        content = content.replace("%antilatch%", antilatch)
-        content = content.replace("%antilatch2%", antilatch.replace("\n\t\t\t\t\t\t",\
-                 "\n\t\t\t\t\t").replace("slave selection","cycles"))
-
-        # signal definitions
-        # required signals
-        content = content.replace("%intabwidth%", str(self.__intercon.getAddressBusWidth()-1))
-        content = content.replace("%intdbwidth%", str(self.__intercon.getDataBusWidth()-1))
-        content = content.replace("%selwidth%", str((self.__intercon.getDataBusWidth() >> 3)-1))
-
-        with open(self._vhdlinter, "w") as intercon:
-            intercon.write(content)
-
-        
+                # the sections are generated while they are written, writing is
+                # measured per write, everything else is the phase generate
+                with timer.phase("write"), os.fdopen(handle, "w") as intercon:
+                    with timer.phase("generate"):
+                        writer.write(timer.stream("write", intercon))
+
+            # mkstemp creates the file readable by the owner only
+            os.chmod(temporary, 0o666 & ~self._umask())
+            os.replace(temporary, self._vhdlinter)
+        except BaseException:
+            os.remove(temporary)
+            raise
+
+        self._statistics = {}
+
+        if self.__intercon.getPrefixMatch():
+            self._statistics["prefix"] = writer.getPrefixStatistics()
+
+        if self.__intercon.getPartialDecode():
+            self._statistics["partial"] = writer.getPartialStatistics()
+
+        return self._statistics
+
+    def _umask(self):
+        ''' get the file mode creation mask of the process
+            @rtype: Integer
+            @return: umask
+        '''
+        umask = os.umask(0)
+        os.umask(umask)
+        return umask
+
+    def getDecoderStatistics(self):
+        ''' get the statistics of the address decoder of the last generated
+            intercon, the caller decides whether to report them
+            @rtype: Dictionary
+            @return: "prefix": (replaced comparators, total comparators) if
+                     prefix matching is enabled, "partial": (replaced
+                     comparators, total comparators, address bits) if
+                     partial decoding is enabled, empty if nothing was
+                     generated
+        '''
+        return self._statistics
+
+    def _inputKey(self, file_to_parse):
+        ''' get the hash of everything the generated intercon depends on
+            @param file_to_parse: path to the config file
+            @type file_to_parse: String
+            @raise OSError: raised if an input cannot be read
+            @rtype: String
+            @return: hexadecimal sha256 digest
+        '''
+        return inputKey(file_to_parse, self._templatedir, self._outputdir, self._deterministic)
+
+    def isUpToDate(self, file_to_parse="./cfg/wishbone.ini", key=None):
+        ''' check if the intercon of a config file was generated from the
+            current inputs (config, generator, templates, options)
+            @param file_to_parse: path to the config file
+            @type file_to_parse: String
+            @param key: input key if it is known already
+            @type key: String
+            @raise OSError: raised if an input cannot be read
+            @rtype: Boolean
+            @return: true if the intercon is up to date
+        '''
+        if key == None:
+            key = self._inputKey(file_to_parse)
+
+        output = readStamp(file_to_parse, key)
+
+        if output == None:
+            return False
+
+        self._vhdlinter = output
+        return True
+
+    def update(self, file_to_parse="./cfg/wishbone.ini"):
+        ''' parse the config file and generate the intercon, unless the
+            inputs did not change since the last update. Then the config is
+            not parsed and the generated file is not touched, so tools
+            checking its modification time do not rebuild
+            @param file_to_parse: path to the config file
+            @type file_to_parse: String
+            @raise configparser.Error: raised on unknown sections or keys
+            @raise ValueError: raised on values which are not allowed
+            @rtype: Boolean
+            @return: true if the intercon was generated, false if it was up
+                     to date
+        '''
+        with self._phase("stamp"):
+            key = self._inputKey(file_to_parse)
+
+            if self.isUpToDate(file_to_parse, key):
+                return False
+
+        self.parse(file_to_parse)
+        self.generateIntercon()
+
+        with self._phase("stamp"):
+            writeStamp(file_to_parse, key, self._vhdlinter)
+
+        return True
+
+    def regenerate(self, file_to_parse="./cfg/wishbone.ini"):
+        ''' generate the intercon parsed before again and stamp it, e.g.
+            after the templates changed. The config file is not parsed again,
+            so it has to be the same as parsed before
+            @param file_to_parse: path to the config file parsed before
+            @type file_to_parse: String
+            @raise OSError: raised if an input cannot be read
+        '''
+        with self._phase("stamp"):
+            key = self._inputKey(file_to_parse)
+
+        self.generateIntercon()
+
+        with self._phase("stamp"):
+            writeStamp(file_to_parse, key, self._vhdlinter)
+
+    def renderIntercon(self):
+        ''' generate intercon in memory
+            @rtype: String
+            @return: vhdl code of the intercon
+        '''
+        return self._writer().render()
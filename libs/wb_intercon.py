@@ -4,8 +4,12 @@
 # standard
 import os
 import sys
+from enum import IntEnum
 # custom
 from wb_component import *
+from wb_record import *
+from wb_address_map import WishboneAddressMap
+from wb_allocator import WishboneAllocator
 
 ''' this programm offers functions to read wishbone config iles
 and generate an intercon in vhdl '''
@@ -20,11 +24,80 @@ __maintainer__ = "Harald Heckmann"
 __email__ = "harald.heckmann@student.hs-rm.de"
 __status__ = "Development (beta)"
 
+# address decoder styles
+class DecoderStyle(IntEnum):
+    CHAIN = 0x00000001
+    TREE = 0x00000002
+    PARALLEL = 0x00000003
+
+# arbitration policies (multiple masters)
+class Arbitration(IntEnum):
+    ROUNDROBIN = 0x00000004
+    PRIORITY = 0x00000005
+    WEIGHTED = 0x00000006
+
+# topologies
+class Topology(IntEnum):
+    SHARED = 0x00000007
+    CROSSBAR = 0x00000008
+
+# return paths (shared bus)
+class ReturnPath(IntEnum):
+    PRIORITYMUX = 0x00000009
+    ANDOR = 0x0000000A
+
+# constants of the intercon, shared by all intercons, like the constants of
+# the components
+_CONST = Const()
+for _enum in (DecoderStyle, Arbitration, Topology, ReturnPath):
+    for _member in _enum:
+        setattr(_CONST, _member.name, _member)
+del _enum, _member
+
+# names of the constants in config files and records
+DECODER = {"chain": DecoderStyle.CHAIN, "tree": DecoderStyle.TREE,
+           "parallel": DecoderStyle.PARALLEL}
+ARBITRATION = {"round_robin": Arbitration.ROUNDROBIN, "priority": Arbitration.PRIORITY,
+               "weighted": Arbitration.WEIGHTED}
+TOPOLOGY = {"shared": Topology.SHARED, "crossbar": Topology.CROSSBAR}
+RETURNPATH = {"priority": ReturnPath.PRIORITYMUX, "and_or": ReturnPath.ANDOR}
+
+def interconName(name):
+    ''' get the name an intercon is stored with, it is used in signal and
+        file names, so spaces are replaced by underscores
+        @param name: configured name
+        @type name: String
+        @rtype: String
+        @return: name of the intercon
+    '''
+    return name.replace(" ", "_")
+
 class WishboneIntercon:
     ''' WishboneIntercon is a class which is used to gather all informations,
 which are required to create an intercon, such as general information,
 in this state of development one master object and slave objects '''
 
+    CONST = _CONST
+
+    # record keys -> (attribute, check), see fromRecords
+    _RECORD = {
+        "name": ("_name", text),
+        "tga_bits": ("_tgabits", natural),
+        "tgc_bits": ("_tgcbits", natural),
+        "tgd_bits": ("_tgdbits", natural),
+        "data_bus_width": ("_databuswidth", natural),
+        "address_bus_width": ("_addressbuswidth", natural),
+        "decoder": ("_decoderstyle", choice(DECODER)),
+        "prefix_match": ("_prefixmatch", choice(BOOLEAN)),
+        "partial_decode": ("_partialdecode", choice(BOOLEAN)),
+        "prune": ("_prune", choice(BOOLEAN)),
+        "pipeline_stages": ("_pipelinestages", choice({"0": 0, "1": 1, "2": 2})),
+        "arbitration": ("_arbitration", choice(ARBITRATION)),
+        "bus_parking": ("_busparking", choice(BOOLEAN)),
+        "topology": ("_topology", choice(TOPOLOGY)),
+        "return_path": ("_returnpath", choice(RETURNPATH)),
+    }
+
     def __init__(self):
         ''' initialize the class by initializing all fields '''
         self._name = "wb_intercon"
@@ -33,8 +106,17 @@ in this state of development one master object and slave objects '''
         self._tgdbits = None
         self._databuswidth = None
         self._addressbuswidth = None
-        self._master = None
-        self._slaves = set()
+        self._decoderstyle = self.CONST.CHAIN
+        self._prefixmatch = False
+        self._partialdecode = False
+        self._prune = False
+        self._pipelinestages = 0
+        self._arbitration = self.CONST.ROUNDROBIN
+        self._busparking = False
+        self._topology = self.CONST.SHARED
+        self._returnpath = self.CONST.PRIORITYMUX
+        self._masters = []
+        self._slaves = WishboneAddressMap()
 
     def __str__(self):
         strrepr = "------------------ Intercon ------------------"\
@@ -45,14 +127,105 @@ in this state of development one master object and slave objects '''
                 + "\nSize of Databus: "+str(self._databuswidth)\
                 + "\nSize of Addressbus: "+str(self._addressbuswidth)
 
-        if self._master != None:
-            strrepr += "\n"+str(self._master)
+        if self._topology == self.CONST.CROSSBAR:
+            strrepr += "\nTopology: Crossbar"
+        else:
+            strrepr += "\nTopology: Shared bus"
+
+        if self._decoderstyle == self.CONST.TREE:
+            strrepr += "\nAddress decoder: Binary tree"
+        elif self._decoderstyle == self.CONST.PARALLEL:
+            strrepr += "\nAddress decoder: Parallel"
+        else:
+            strrepr += "\nAddress decoder: Priority chain"
+
+        if self._returnpath == self.CONST.ANDOR:
+            strrepr += "\nReturn path: AND-OR of the selected slave"
+        else:
+            strrepr += "\nReturn path: Priority multiplexer"
+
+        strrepr += "\nPrefix matching: "+str(self._prefixmatch)\
+                + "\nPartial decoding: "+str(self._partialdecode)\
+                + "\nPruning: "+str(self._prune)\
+                + "\nPipeline stages: "+str(self._pipelinestages)
+
+        if len(self._masters) > 1:
+            if self._arbitration == self.CONST.PRIORITY:
+                strrepr += "\nArbitration: Fixed priority"
+            elif self._arbitration == self.CONST.WEIGHTED:
+                strrepr += "\nArbitration: Weighted round robin"
+            else:
+                strrepr += "\nArbitration: Round robin"
+
+            strrepr += "\nBus parking: "+str(self._busparking)
+
+        for master in self._masters:
+            strrepr += "\n"+str(master)
+
+        strrepr += "\n"+str(self._slaves)
 
         for slave in self._slaves:
             strrepr += "\n"+str(slave)
 
         return strrepr.replace("None", "Not defined")
 
+    @classmethod
+    def fromRecords(cls, general=None, masters=(), slaves=()):
+        ''' create an intercon from records (dictionaries using the keys of
+            the config files) without writing and parsing a config file
+            @param general: keys of the general section mapped to the values
+            @type general: Dictionary
+            @param masters: one record per master, in the order of priority
+            @type masters: Iterable containing Dictionaries
+            @param slaves: one record per slave, slaves without base
+                           address are placed by allocateSlaves
+            @type slaves: Iterable containing Dictionaries
+            @raise ValueError: raised on unknown keys, values which are not
+                               allowed and slaves without address size,
+                               the message lists every problem
+            @rtype: WishboneIntercon
+            @return: intercon configured by the records
+        '''
+        intercon = cls()
+
+        if general != None:
+            applyRecord(intercon, general, cls._RECORD)
+
+        intercon.addMasters(masters)
+        intercon.allocateSlaves(slaves)
+        return intercon
+
+    def _fromRecords(self, records, component):
+        ''' create components from records, all records are checked before
+            an error is raised
+            @param records: records or already created components
+            @type records: Iterable containing Dictionaries or components
+            @param component: class of the components
+            @type component: WishboneMaster or WishboneSlave
+            @raise ValueError: raised if a record is not valid
+            @rtype: List containing components
+            @return: components in the order of the records
+        '''
+        components = []
+        problems = []
+
+        for nr, record in enumerate(records):
+            if isinstance(record, component):
+                components.append(record)
+                continue
+
+            try:
+                components.append(component.fromRecord(record))
+            except ValueError as e:
+                problems.append("record "+str(nr)+" ("+str(record.get("name"))+"): "+e.args[0])
+            except AttributeError:
+                problems.append("record "+str(nr)+" is neither a dictionary nor a "+component.__name__)
+
+        if problems:
+            raise ValueError("\n".join(problems))
+
+        return components
+
     def setName(self, name):
         ''' set a name for the intercon
             @param name: name to set
@@ -70,7 +243,7 @@ in this state of development one master object and slave objects '''
                 +"\tTypeError occurred: "+e.args[0]+"\nstopping execution")
             return False
 
-        self._name = name.replace(" ", "_")
+        self._name = interconName(name)
         return True
 
     def getName(self):
@@ -311,8 +484,352 @@ in this state of development one master object and slave objects '''
 
         return self._databuswidth
 
+    def setDecoderStyle(self, style):
+        ''' Set the structure of the generated address decoder
+            @param style: WishboneIntercon.CONST.CHAIN (if/elsif chain, N
+                          comparators deep), .TREE (balanced binary search
+                          over the base addresses, log2(N) deep) or .PARALLEL
+                          (one range match per slave, one comparator deep)
+            @type style: Integer
+            @raise TypeError: raised if parameter type mismatch is found
+            @raise ValueError: raised if value is not: WishboneIntercon.CONST
+                                .CHAIN, .TREE, .PARALLEL
+            @rtype: boolean
+            @return: true on success, false otherwise
+        '''
+        try:
+            if not isinstance(style, int):
+                raise TypeError("style got the wrong type,"
+                    +"excepted: Integer, got: "+str(type(style)))
+            else:
+                if not (style == self.CONST.CHAIN or style == self.CONST.TREE
+                or style == self.CONST.PARALLEL):
+                    raise ValueError("Unknown decoder style (use the given constants)")
+        except TypeError as e:
+            print("WishboneIntercon.setDecoderStyle:\n"
+                +"\tTypeError occurred: "+e.args[0]+"\nstopping execution")
+            return False
+        except ValueError as e:
+            print("WishboneIntercon.setDecoderStyle:\n"
+                +"\tValueError occurred: "+e.args[0]+"\nstopping execution")
+            return False
+
+        self._decoderstyle = style
+        return True
+
+    def getDecoderStyle(self):
+        ''' get the structure of the generated address decoder
+            @rtype: Integer
+            @return: decoder style (constant), default: CONST.CHAIN
+        '''
+        return self._decoderstyle
+
+    def setPrefixMatch(self, enabled):
+        ''' activate (true) / deactivate (false) prefix matching. Slaves with
+            a power of two sized and aligned address range are decoded by
+            comparing only the upper address bits instead of a magnitude
+            comparison
+            @param enabled: Boolean to activate/deactivate prefix matching
+            @type enabled: Boolean
+            @raise TypeError: raised if parameter type mismatch is found
+            @rtype: boolean
+            @return: true on success, false otherwise
+        '''
+        try:
+            if not isinstance(enabled, bool):
+                raise TypeError("enabled got the wrong type,"
+                    +"excepted: Boolean, got: "+str(type(enabled)))
+        except TypeError as e:
+            print("WishboneIntercon.setPrefixMatch:\n"
+                +"\tTypeError occurred: "+e.args[0]+"\nstopping execution")
+            return False
+
+        self._prefixmatch = enabled
+        return True
+
+    def getPrefixMatch(self):
+        ''' get the enabled state of prefix matching
+            @rtype: Boolean
+            @return: true/false for used/not used, default: false
+        '''
+        return self._prefixmatch
+
+    def setPartialDecode(self, enabled):
+        ''' activate (true) / deactivate (false) partial address decoding.
+            Every slave is selected by the few address bits, which tell it
+            apart from all other slaves, unmapped addresses alias to slaves.
+            Slaves which cannot be told apart by their aligned ranges are
+            decoded completely
+            @param enabled: Boolean to activate/deactivate partial decoding
+            @type enabled: Boolean
+            @raise TypeError: raised if parameter type mismatch is found
+            @rtype: boolean
+            @return: true on success, false otherwise
+        '''
+        try:
+            if not isinstance(enabled, bool):
+                raise TypeError("enabled got the wrong type,"
+                    +"excepted: Boolean, got: "+str(type(enabled)))
+        except TypeError as e:
+            print("WishboneIntercon.setPartialDecode:\n"
+                +"\tTypeError occurred: "+e.args[0]+"\nstopping execution")
+            return False
+
+        self._partialdecode = enabled
+        return True
+
+    def getPartialDecode(self):
+        ''' get the enabled state of partial address decoding
+            @rtype: Boolean
+            @return: true/false for used/not used, default: false
+        '''
+        return self._partialdecode
+
+    def setPrune(self, enabled):
+        ''' activate (true) / deactivate (false) pruning of logic, which can
+            never carry data: the write data of read only slaves (data_flow =
+            r), the read data of write only slaves (data_flow = w) and tag
+            signals with 0 bits
+            @param enabled: Boolean to activate/deactivate pruning
+            @type enabled: Boolean
+            @raise TypeError: raised if parameter type mismatch is found
+            @rtype: boolean
+            @return: true on success, false otherwise
+        '''
+        try:
+            if not isinstance(enabled, bool):
+                raise TypeError("enabled got the wrong type,"
+                    +"excepted: Boolean, got: "+str(type(enabled)))
+        except TypeError as e:
+            print("WishboneIntercon.setPrune:\n"
+                +"\tTypeError occurred: "+e.args[0]+"\nstopping execution")
+            return False
+
+        self._prune = enabled
+        return True
+
+    def getPrune(self):
+        ''' get the enabled state of pruning
+            @rtype: Boolean
+            @return: true/false for used/not used, default: false
+        '''
+        return self._prune
+
+    def setPipelineStages(self, stages):
+        ''' Set the amount of register stages between master and slaves.
+            0: combinational intercon, 1: registered request (address, data
+            and strobe of the master feed the address decoder from registers),
+            2: registered request and registered response (ack, data, ...)
+            @param stages: amount of pipeline stages (0, 1 or 2)
+            @type stages: Integer
+            @raise TypeError: raised if parameter type mismatch is found
+            @raise ValueError: raised if stages is not 0, 1 or 2
+            @rtype: boolean
+            @return: true on success, false otherwise
+        '''
+        try:
+            if not isinstance(stages, int):
+                raise TypeError("stages got the wrong type,"
+                    +"excepted: Integer, got: "+str(type(stages)))
+            else:
+                if stages < 0 or stages > 2:
+                    raise ValueError("pipeline stages can be 0, 1 or 2")
+        except TypeError as e:
+            print("WishboneIntercon.setPipelineStages:\n"
+                +"\tTypeError occurred: "+e.args[0]+"\nstopping execution")
+            return False
+        except ValueError as e:
+            print("WishboneIntercon.setPipelineStages:\n"
+                +"\tValueError occurred: "+e.args[0]+"\nstopping execution")
+            return False
+
+        self._pipelinestages = stages
+        return True
+
+    def getPipelineStages(self):
+        ''' get the amount of register stages between master and slaves
+            @rtype: Integer
+            @return: amount of pipeline stages, default: 0
+        '''
+        return self._pipelinestages
+
+    def setArbitration(self, policy):
+        ''' Set the policy the arbiter uses to grant the bus to one of
+            several masters
+            @param policy: WishboneIntercon.CONST.ROUNDROBIN, .PRIORITY (the
+                           master defined first wins) or .WEIGHTED (round
+                           robin, a master gets as many turns as its weight)
+            @type policy: Integer
+            @raise TypeError: raised if parameter type mismatch is found
+            @raise ValueError: raised if value is not: WishboneIntercon.CONST
+                                .ROUNDROBIN, .PRIORITY, .WEIGHTED
+            @rtype: boolean
+            @return: true on success, false otherwise
+        '''
+        try:
+            if not isinstance(policy, int):
+                raise TypeError("policy got the wrong type,"
+                    +"excepted: Integer, got: "+str(type(policy)))
+            else:
+                if not (policy == self.CONST.ROUNDROBIN or policy == self.CONST.PRIORITY
+                or policy == self.CONST.WEIGHTED):
+                    raise ValueError("Unknown arbitration policy (use the given constants)")
+        except TypeError as e:
+            print("WishboneIntercon.setArbitration:\n"
+                +"\tTypeError occurred: "+e.args[0]+"\nstopping execution")
+            return False
+        except ValueError as e:
+            print("WishboneIntercon.setArbitration:\n"
+                +"\tValueError occurred: "+e.args[0]+"\nstopping execution")
+            return False
+
+        self._arbitration = policy
+        return True
+
+    def getArbitration(self):
+        ''' get the policy of the arbiter
+            @rtype: Integer
+            @return: arbitration policy (constant), default: CONST.ROUNDROBIN
+        '''
+        return self._arbitration
+
+    def setBusParking(self, enabled):
+        ''' activate (true) / deactivate (false) bus parking. The grant stays
+            with the last master while no master requests the bus, so it can
+            start its next cycle without waiting for the arbiter
+            @param enabled: Boolean to activate/deactivate bus parking
+            @type enabled: Boolean
+            @raise TypeError: raised if parameter type mismatch is found
+            @rtype: boolean
+            @return: true on success, false otherwise
+        '''
+        try:
+            if not isinstance(enabled, bool):
+                raise TypeError("enabled got the wrong type,"
+                    +"excepted: Boolean, got: "+str(type(enabled)))
+        except TypeError as e:
+            print("WishboneIntercon.setBusParking:\n"
+                +"\tTypeError occurred: "+e.args[0]+"\nstopping execution")
+            return False
+
+        self._busparking = enabled
+        return True
+
+    def getBusParking(self):
+        ''' get the enabled state of bus parking
+            @rtype: Boolean
+            @return: true/false for used/not used, default: false
+        '''
+        return self._busparking
+
+    def setTopology(self, topology):
+        ''' Set the topology of the intercon
+            @param topology: WishboneIntercon.CONST.SHARED (one bus, the
+                             masters are serialized by one arbiter) or
+                             .CROSSBAR (one arbiter per slave, masters
+                             accessing different slaves transfer at the
+                             same time)
+            @type topology: Integer
+            @raise TypeError: raised if parameter type mismatch is found
+            @raise ValueError: raised if value is not: WishboneIntercon.CONST
+                                .SHARED, .CROSSBAR
+            @rtype: boolean
+            @return: true on success, false otherwise
+        '''
+        try:
+            if not isinstance(topology, int):
+                raise TypeError("topology got the wrong type,"
+                    +"excepted: Integer, got: "+str(type(topology)))
+            else:
+                if not (topology == self.CONST.SHARED or topology == self.CONST.CROSSBAR):
+                    raise ValueError("Unknown topology (use the given constants)")
+        except TypeError as e:
+            print("WishboneIntercon.setTopology:\n"
+                +"\tTypeError occurred: "+e.args[0]+"\nstopping execution")
+            return False
+        except ValueError as e:
+            print("WishboneIntercon.setTopology:\n"
+                +"\tValueError occurred: "+e.args[0]+"\nstopping execution")
+            return False
+
+        self._topology = topology
+        return True
+
+    def getTopology(self):
+        ''' get the topology of the intercon
+            @rtype: Integer
+            @return: topology (constant), default: CONST.SHARED
+        '''
+        return self._topology
+
+    def setReturnPath(self, returnpath):
+        ''' Set the structure of the shared bus return path (data, ack, err,
+            rty, tgd and stall of the slaves towards the master)
+            @param returnpath: WishboneIntercon.CONST.PRIORITYMUX (assigned
+                               by the address decoder, a multiplexer growing
+                               with every slave) or .ANDOR (every output is
+                               masked by the one-hot slave select of the
+                               parallel decoder and the results are ored,
+                               two gates deep)
+            @type returnpath: Integer
+            @raise TypeError: raised if parameter type mismatch is found
+            @raise ValueError: raised if value is not: WishboneIntercon.CONST
+                                .PRIORITYMUX, .ANDOR
+            @rtype: boolean
+            @return: true on success, false otherwise
+        '''
+        try:
+            if not isinstance(returnpath, int):
+                raise TypeError("returnpath got the wrong type,"
+                    +"excepted: Integer, got: "+str(type(returnpath)))
+            else:
+                if not (returnpath == self.CONST.PRIORITYMUX or returnpath == self.CONST.ANDOR):
+                    raise ValueError("Unknown return path (use the given constants)")
+        except TypeError as e:
+            print("WishboneIntercon.setReturnPath:\n"
+                +"\tTypeError occurred: "+e.args[0]+"\nstopping execution")
+            return False
+        except ValueError as e:
+            print("WishboneIntercon.setReturnPath:\n"
+                +"\tValueError occurred: "+e.args[0]+"\nstopping execution")
+            return False
+
+        self._returnpath = returnpath
+        return True
+
+    def getReturnPath(self):
+        ''' get the structure of the shared bus return path
+            @rtype: Integer
+            @return: return path (constant), default: CONST.PRIORITYMUX
+        '''
+        return self._returnpath
+
     def setMaster(self, wbmaster):
-        ''' set the only wishbone master component of intercon
+        ''' set the only wishbone master component of intercon, masters
+            which have been added before are removed
+            @param wbmaster: WishboneMaster Object containing informations for 
+                             a master module
+            @type wbmaster: WishboneMaster (superclass: WishboneComponent)
+            @raise TypeError: raised if parameter type mismatch is found
+            @rtype: boolean
+            @return: true on success, false otherwise
+        '''
+        try:
+            if not isinstance(wbmaster, WishboneMaster):
+                raise TypeError("wbmaster got wrong type,"
+                    +"excepted: WishboneMaster, got: "+str(type(wbmaster)))
+        except TypeError as e:
+            print("WishboneIntercon.setMaster:\n"
+                +"\tTypeError occurred: "+e.args[0]+"\nstopping execution")
+            return False
+
+        self._masters = [wbmaster]
+        return True
+
+    def addMaster(self, wbmaster):
+        ''' add a wishbone master component to intercon. If more than one
+            master is added, an arbiter is generated. For fixed priority
+            arbitration the master added first has the highest priority
             @param wbmaster: WishboneMaster Object containing informations for 
                              a master module
             @type wbmaster: WishboneMaster (superclass: WishboneComponent)
@@ -329,25 +846,45 @@ in this state of development one master object and slave objects '''
                 +"\tTypeError occurred: "+e.args[0]+"\nstopping execution")
             return False
 
-        self._master = wbmaster
+        self._masters.append(wbmaster)
         return True
 
+    def addMasters(self, masters):
+        ''' add several wishbone masters at once, either as WishboneMaster
+            objects or as records, which are checked in one pass. No master
+            is added, if one of them is not valid
+            @param masters: masters in the order of priority
+            @type masters: Iterable containing WishboneMaster objects or
+                           Dictionaries (keys of the config files)
+            @raise ValueError: raised if a record is not valid
+        '''
+        self._masters.extend(self._fromRecords(masters, WishboneMaster))
+
     def getMaster(self):
-        ''' get the only wishbone master component for this intercon
+        ''' get the (first) wishbone master component for this intercon
             @raise UnboundLocalError: raised if no master was set yet
             @rtype: WishboneMaster
             @return: master component on success, empty master component on fail
         '''
 
         try:
-            if self._master == None:
+            if not self._masters:
                 raise UnboundLocalError("no master component was set yet")
         except UnboundLocalError as e:
             print("WishboneIntercon.getMaster:\n"
                 +"UnboundLocalError occurred: "+e.args[0]+"\nstopping execution")
             return WishboneMaster()
 
-        return self._master
+        return self._masters[0]
+
+    def getMasters(self):
+        ''' get a list containing all wishbone masters which have been applied
+            to this intercon object, in the order they were added
+            @rtype: List (can be empty) containing WishboneMaster objects
+            @return: List containing all masters for this intercon
+        '''
+
+        return self._masters
 
     def addSlave(self, wbslave):
         ''' add a wishbone slave component to intercon
@@ -355,6 +892,8 @@ in this state of development one master object and slave objects '''
                             a slave module
             @type wbslave: WishboneSlave (superclass: WishboneComponent)
             @raise TypeError: raised if parameter type mismatch is found
+            @raise ValueError: raised if the slave has no base address or
+                               address size
             @rtype: boolean
             @return: true on success, false otherwise
         '''
@@ -362,19 +901,65 @@ in this state of development one master object and slave objects '''
             if not isinstance(wbslave, WishboneSlave):
                 raise TypeError("wbslave got wrong type,"
                     +"excepted: WishboneSlave, got: "+str(type(wbslave)))
+
+            self._slaves.insert(wbslave)
         except TypeError as e:
             print("WishboneIntercon.addSlave:\n"
                 +"\tTypeError occurred: "+e.args[0]+"\nstopping execution")
             return False
+        except ValueError as e:
+            print("WishboneIntercon.addSlave:\n"
+                +"\tValueError occurred: "+e.args[0]+"\nstopping execution")
+            return False
 
-        self._slaves.add(wbslave)
         return True
 
+    def addSlaves(self, slaves):
+        ''' add several wishbone slaves at once, either as WishboneSlave
+            objects or as records, which are checked in one pass and merged
+            into the address map by one sort. No slave is added, if one of
+            them is not valid
+            @param slaves: slaves
+            @type slaves: Iterable containing WishboneSlave objects or
+                          Dictionaries (keys of the config files)
+            @raise ValueError: raised if a record is not valid or a slave has
+                               no base address or address size
+        '''
+        self._slaves.extend(self._fromRecords(slaves, WishboneSlave))
+
+    def allocateSlaves(self, slaves):
+        ''' add several wishbone slaves at once like addSlaves, slaves
+            without base address get one from the allocator (see
+            WishboneAllocator) around the slaves added before. The address
+            bus width has to be set before
+            @param slaves: slaves
+            @type slaves: Iterable containing WishboneSlave objects or
+                          Dictionaries (keys of the config files)
+            @raise ValueError: raised if a record is not valid, a slave has
+                               no address size, violates its alignment or
+                               region or does not fit into the address bus
+        '''
+        slaves = self._fromRecords(slaves, WishboneSlave)
+        unplaced = [slave for slave in slaves if slave.getBaseAddress() == None]
+
+        # the constraints of slaves with base address are checked as well
+        if unplaced or any(slave.getAddressAlignment() != None\
+                           or slave.getAddressRegion() != None for slave in slaves):
+            if self._addressbuswidth == None:
+                raise ValueError("address_bus_width is needed to allocate base addresses")
+
+            placed = [slave for slave in slaves if slave.getBaseAddress() != None]
+            WishboneAllocator(self._addressbuswidth).allocate(list(self._slaves)+placed,\
+                                                              unplaced)
+
+        self._slaves.extend(slaves)
+
     def getSlaves(self):
-        ''' get a list containing all wishbone slaves which have been applied 
-            to this intercon object
-            @rtype: Set (can be empty) containing WishboneSlave objects
-            @return: Set containing all slaves for this intercon
+        ''' get the address map containing all wishbone slaves which have
+            been applied to this intercon object
+            @rtype: WishboneAddressMap (can be empty, iterates over the
+                    WishboneSlave objects sorted by base address)
+            @return: address map containing all slaves for this intercon
         '''
 
         return self._slaves
@@ -0,0 +1,136 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+
+''' this programm offers functions to check records (dictionaries using the
+keys of the config files) and to apply them to the wishbone model in one
+pass, without calling the setters of every field '''
+
+__author__ = "Harald Heckmann"
+__copyright__ = "Copyright 2016"
+__credits__ = ["Prof. Dr. Steffen Reith (steffen.reith@hs-rm.de)", \
+                "Harald Heckmann (harald.heckmann@student.hs-rm.de)"]
+__license__ = "GPLv3"
+__version__ = "1.0.0"
+__maintainer__ = "Harald Heckmann"
+__email__ = "harald.heckmann@student.hs-rm.de"
+__status__ = "Development (beta)"
+
+# returned by the checks for values which are not allowed
+INVALID = object()
+
+BOOLEAN = {"true": True, "false": False}
+
+def natural(value):
+    ''' check a non negative integer '''
+    if value.__class__ is int and value >= 0:
+        return value
+
+    return INVALID
+
+def positive(value):
+    ''' check an integer greater than 0 '''
+    if value.__class__ is int and value > 0:
+        return value
+
+    return INVALID
+
+def power(value):
+    ''' check a power of two '''
+    if value.__class__ is int and value > 0 and not value & (value-1):
+        return value
+
+    return INVALID
+
+def region(value):
+    ''' check an address region, given as (first address, last address) '''
+    if isinstance(value, (list, tuple)) and len(value) == 2\
+    and all(address.__class__ is int and address >= 0 for address in value)\
+    and value[0] <= value[1]:
+        return tuple(value)
+
+    return INVALID
+
+def text(value):
+    ''' check a name, blanks are replaced by underscores '''
+    if isinstance(value, str):
+        return value.replace(" ", "_")
+
+    return INVALID
+
+def names(value):
+    ''' check a list of names or a comma separated string of names '''
+    if isinstance(value, str):
+        value = [name.strip() for name in value.split(",") if name.strip()]
+
+    if isinstance(value, (list, tuple)) and all(isinstance(name, str) for name in value):
+        return [name.replace(" ", "_") for name in value]
+
+    return INVALID
+
+def choice(allowed):
+    ''' create a check for one of the allowed values. The value can be given
+        by its name (case insensitive) or as the value itself
+        @param allowed: names mapped to the values
+        @type allowed: Dictionary
+        @rtype: Function
+        @return: check for the allowed values
+    '''
+    # the values themselves are accepted as well, but True == 1, so booleans
+    # are only accepted as booleans and constants only as integers
+    values = {value: value for value in allowed.values()}
+    boolean = isinstance(next(iter(values)), bool)
+    names = dict(allowed)
+    names.update((name.upper(), value) for name, value in allowed.items())
+
+    def check(value):
+        if value.__class__ is str:
+            converted = names.get(value, INVALID)
+
+            if converted is INVALID:
+                converted = names.get(value.lower(), INVALID)
+
+            return converted
+
+        if (value.__class__ is bool) == boolean:
+            return values.get(value, INVALID)
+
+        return INVALID
+
+    check.allowed = allowed
+    return check
+
+def applyRecord(target, record, schema):
+    ''' check all values of a record and assign them to the attributes of
+        the target. The target is only partially configured, if a value is
+        not allowed, so records are applied to new objects
+        @param target: component or intercon to configure
+        @type target: Object
+        @param record: config keys mapped to the values
+        @type record: Dictionary
+        @param schema: config keys mapped to (attribute, check)
+        @type schema: Dictionary
+        @raise ValueError: raised on unknown keys and values which are not
+                           allowed, the message lists every problem
+    '''
+    problems = []
+
+    for key, value in record.items():
+        entry = schema.get(key)
+
+        if entry == None:
+            problems.append("unknown key: "+str(key))
+            continue
+
+        attribute, check = entry
+        converted = check(value)
+
+        if converted is INVALID:
+            if hasattr(check, "allowed"):
+                problems.append(key+" can be: "+", ".join(check.allowed)+", got: "+repr(value))
+            else:
+                problems.append(key+" can not be: "+repr(value))
+        else:
+            setattr(target, attribute, converted)
+
+    if problems:
+        raise ValueError("; ".join(problems))
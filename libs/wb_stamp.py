@@ -0,0 +1,134 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+
+# standard
+import os
+import hashlib
+
+''' this programm offers functions to check if a generated intercon is up
+to date. It only needs the standard library, so the check is fast enough to
+run before the generator itself is loaded '''
+
+__author__ = "Harald Heckmann"
+__copyright__ = "Copyright 2016"
+__credits__ = ["Prof. Dr. Steffen Reith (steffen.reith@hs-rm.de)", \
+                "Harald Heckmann (harald.heckmann@student.hs-rm.de)"]
+__license__ = "GPLv3"
+__version__ = "1.0.0"
+__maintainer__ = "Harald Heckmann"
+__email__ = "harald.heckmann@student.hs-rm.de"
+__status__ = "Development (beta)"
+
+# default directories, relative to the working directory
+TEMPLATEDIR = "vhdl"
+OUTPUTDIR = "vhdl"
+CACHEDIR = ".wb_cache"
+
+# file names of the templates in the template directory
+TEMPLATES = ("template_intercon.tmpl", "template_slave.tmpl", "template_master.tmpl",
+             "template_crossbar.tmpl")
+
+def directory(path, default):
+    ''' get the absolute path of a directory with a trailing /
+        @param path: path of the directory, None for the default
+        @type path: String
+        @param default: path of the default directory
+        @type default: String
+        @rtype: String
+        @return: absolute path
+    '''
+    return os.path.join(os.path.abspath(default if path == None else path), "")
+
+def generatorDigest(templatedir):
+    ''' get the hash of the generator: version, sources and templates
+        @param templatedir: directory of the templates (with trailing /)
+        @type templatedir: String
+        @raise OSError: raised if a file cannot be read
+        @rtype: String
+        @return: hexadecimal sha256 digest
+    '''
+    digest = hashlib.sha256()
+    digest.update(__version__.encode())
+    libdir = os.path.dirname(os.path.abspath(__file__))
+    sources = sorted(os.path.join(libdir, name) for name in os.listdir(libdir)\
+                     if name.endswith(".py"))
+
+    for path in [templatedir+name for name in TEMPLATES]+sources:
+        with open(path, "rb") as inputfile:
+            digest.update(inputfile.read())
+
+    return digest.hexdigest()
+
+def inputKey(config, templatedir, outputdir, deterministic):
+    ''' get the hash of everything a generated intercon depends on: the
+        config file, the generator and the options of the generation
+        @param config: path to the config file
+        @type config: String
+        @param templatedir: directory of the templates (with trailing /)
+        @type templatedir: String
+        @param outputdir: directory of the generated file (with trailing /)
+        @type outputdir: String
+        @param deterministic: generation without date stamp
+        @type deterministic: Boolean
+        @raise OSError: raised if an input cannot be read
+        @rtype: String
+        @return: hexadecimal sha256 digest
+    '''
+    digest = hashlib.sha256()
+    digest.update((generatorDigest(templatedir)+outputdir+str(deterministic)).encode())
+
+    with open(config, "rb") as inputfile:
+        digest.update(inputfile.read())
+
+    return digest.hexdigest()
+
+def stampPath(config):
+    ''' get the path of the stamp file of a config file
+        @param config: path to the config file
+        @type config: String
+        @rtype: String
+        @return: path in the cache directory
+    '''
+    name = hashlib.sha256(os.path.abspath(config).encode()).hexdigest()
+    return directory(None, CACHEDIR)+name+".stamp"
+
+def readStamp(config, key):
+    ''' check the stamp of a config file. A stamp contains the input key,
+        the path and the modification time of the generated file, so a file
+        changed by someone else is generated again
+        @param config: path to the config file
+        @type config: String
+        @param key: current input key, see inputKey
+        @type key: String
+        @rtype: String
+        @return: path of the generated file if it is up to date, None
+                 otherwise
+    '''
+    try:
+        with open(stampPath(config), "r") as stampfile:
+            lines = stampfile.read().splitlines()
+
+        if len(lines) == 3 and lines[0] == key\
+        and str(os.stat(lines[1]).st_mtime_ns) == lines[2]:
+            return lines[1]
+    except OSError:
+        pass
+
+    return None
+
+def writeStamp(config, key, output):
+    ''' write the stamp of a config file after generating its intercon
+        @param config: path to the config file
+        @type config: String
+        @param key: input key, see inputKey
+        @type key: String
+        @param output: path of the generated file
+        @type output: String
+        @raise OSError: raised if the stamp cannot be written
+    '''
+    stamp = stampPath(config)
+    os.makedirs(os.path.dirname(stamp), exist_ok=True)
+
+    with open(stamp, "w") as stampfile:
+        stampfile.write(key+"\n"+os.path.abspath(output)+"\n"\
+                        +str(os.stat(output).st_mtime_ns)+"\n")
@@ -0,0 +1,118 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+
+# standard
+import os
+import re
+
+''' this programm offers a class to parse vhdl templates once into literal
+and placeholder segments, which can be rendered afterwards in a single pass '''
+
+__author__ = "Harald Heckmann"
+__copyright__ = "Copyright 2016"
+__credits__ = ["Prof. Dr. Steffen Reith (steffen.reith@hs-rm.de)", \
+                "Harald Heckmann (harald.heckmann@student.hs-rm.de)"]
+__license__ = "GPLv3"
+__version__ = "1.0.0"
+__maintainer__ = "Harald Heckmann"
+__email__ = "harald.heckmann@student.hs-rm.de"
+__status__ = "Development (beta)"
+
+# placeholders look like %name%
+PLACEHOLDER = re.compile(r"%([A-Za-z0-9_]+)%")
+
+class WishboneTemplate:
+    ''' WishboneTemplate is a class which stores a compiled template. The
+template text is split once into literals and placeholders, rendering joins
+the literals and the values for the placeholders in one step '''
+
+    # compiled templates, shared by every generator in this process
+    # path -> (modification time, WishboneTemplate)
+    __cache = {}
+
+    def __init__(self, text):
+        ''' compile the given template text
+            @param text: template text containing %placeholders%
+            @type text: String
+        '''
+        # even indices: literals, odd indices: placeholder names
+        self._parts = PLACEHOLDER.split(text)
+        self._names = frozenset(self._parts[1::2])
+
+    @classmethod
+    def load(cls, path):
+        ''' get the compiled template for a file. Every file is read and
+            parsed only once per process, unless it changed on disk
+            @param path: path to the template file
+            @type path: String
+            @raise OSError: raised if the file cannot be read
+            @rtype: WishboneTemplate
+            @return: compiled template
+        '''
+        path = os.path.abspath(path)
+        mtime = os.stat(path).st_mtime_ns
+        cached = cls.__cache.get(path)
+
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+
+        with open(path, "r") as template:
+            compiled = cls(template.read())
+
+        cls.__cache[path] = (mtime, compiled)
+        return compiled
+
+    def getPlaceholders(self):
+        ''' get the names of all placeholders in this template
+            @rtype: frozenset
+            @return: names of the placeholders (without %)
+        '''
+        return self._names
+
+    def render(self, values):
+        ''' substitute all placeholders in one pass
+            @param values: maps placeholder names (without %) to strings
+            @type values: Dictionary
+            @raise KeyError: raised if a placeholder has no value
+            @rtype: String
+            @return: rendered template
+        '''
+        parts = self._parts[:]
+
+        try:
+            for i in range(1, len(parts), 2):
+                parts[i] = values[parts[i]]
+        except KeyError as e:
+            raise KeyError("no value for template placeholder %"+e.args[0]+"%")
+
+        return "".join(parts)
+
+    def stream(self, out, values):
+        ''' write the template into a file object. In contrast to render a
+            value can also be an iterable (e.g. a generator) of strings, which
+            is consumed while writing
+            @param out: object offering write(String)
+            @type out: file object
+            @param values: maps placeholder names (without %) to strings or
+                           iterables of strings
+            @type values: Dictionary
+            @raise KeyError: raised if a placeholder has no value
+        '''
+        parts = self._parts
+        write = out.write
+
+        for i in range(0, len(parts)-1, 2):
+            write(parts[i])
+
+            try:
+                value = values[parts[i+1]]
+            except KeyError as e:
+                raise KeyError("no value for template placeholder %"+e.args[0]+"%")
+
+            if isinstance(value, str):
+                write(value)
+            else:
+                for chunk in value:
+                    write(chunk)
+
+        write(parts[-1])
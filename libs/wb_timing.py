@@ -0,0 +1,167 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+
+# standard
+from time import perf_counter
+
+''' this programm offers a class to measure how long the phases of the
+generation (reading, parsing, rendering, writing) take '''
+
+__author__ = "Harald Heckmann"
+__copyright__ = "Copyright 2016"
+__credits__ = ["Prof. Dr. Steffen Reith (steffen.reith@hs-rm.de)", \
+                "Harald Heckmann (harald.heckmann@student.hs-rm.de)"]
+__license__ = "GPLv3"
+__version__ = "1.0.0"
+__maintainer__ = "Harald Heckmann"
+__email__ = "harald.heckmann@student.hs-rm.de"
+__status__ = "Development (beta)"
+
+class WishboneTimer:
+    ''' WishboneTimer is a class which adds up the time spent in named phases.
+Phases can be nested, the time is counted for the innermost phase only, so
+the times of all phases add up to the measured time. The sections of the
+intercon are generators consumed while writing, therefore phases can also be
+measured per step of a generator (see iterate) or per write (see stream) '''
+
+    def __init__(self):
+        ''' initialize an empty timer '''
+        # phase -> [seconds, count], in the order of the first start
+        self._phases = {}
+        self._stack = []
+        self._mark = None
+
+    def start(self, phase):
+        ''' start a phase, the current phase is paused until stop is called
+            @param phase: name of the phase
+            @type phase: String
+        '''
+        now = perf_counter()
+
+        if self._stack:
+            self._phases[self._stack[-1]][0] += now-self._mark
+
+        entry = self._phases.get(phase)
+
+        if entry is None:
+            entry = self._phases[phase] = [0.0, 0]
+
+        entry[1] += 1
+        self._stack.append(phase)
+        self._mark = now
+
+    def stop(self):
+        ''' stop the current phase and continue the phase started before '''
+        now = perf_counter()
+        self._phases[self._stack.pop()][0] += now-self._mark
+        self._mark = now
+
+    def phase(self, phase):
+        ''' measure a with block as a phase
+            @param phase: name of the phase
+            @type phase: String
+            @rtype: Object
+            @return: context manager
+        '''
+        return _Phase(self, phase)
+
+    def iterate(self, phase, iterable):
+        ''' measure every step of an iterable as a phase, e.g. a section
+            which is consumed while the template is written
+            @param phase: name of the phase
+            @type phase: String
+            @param iterable: iterable to measure
+            @type iterable: Iterable
+            @rtype: Generator
+            @return: items of the iterable
+        '''
+        iterator = iter(iterable)
+
+        while True:
+            self.start(phase)
+
+            try:
+                item = next(iterator)
+            except StopIteration:
+                return
+            finally:
+                self.stop()
+
+            yield item
+
+    def stream(self, phase, stream):
+        ''' measure the writes to a file object as a phase
+            @param phase: name of the phase
+            @type phase: String
+            @param stream: object offering write(String)
+            @type stream: file object
+            @rtype: Object
+            @return: object offering write(String)
+        '''
+        return _Stream(self, phase, stream)
+
+    def getPhases(self):
+        ''' get the measured phases
+            @rtype: List containing Tuples
+            @return: (name, seconds, count) per phase, in the order they
+                     were started first
+        '''
+        return [(phase, seconds, count) for phase, (seconds, count) in self._phases.items()]
+
+    def getReport(self):
+        ''' get the measured phases for a machine readable report
+            @rtype: Dictionary
+            @return: phases mapped to {"seconds", "count"} and the time of
+                     all phases (measured)
+        '''
+        phases = {phase: {"seconds": seconds, "count": count}\
+                  for phase, seconds, count in self.getPhases()}
+        return {"phases": phases, "measured": sum(entry["seconds"] for entry in phases.values())}
+
+    def printPhases(self, out=None):
+        ''' print the measured phases nicely to console
+            @param out: file object to print to, None for stdout
+            @type out: file object
+        '''
+        phases = self.getPhases()
+        total = sum(seconds for phase, seconds, count in phases) or 1.0
+        print("%-12s %12s %8s %8s" % ("phase", "time [ms]", "share", "count"), file=out)
+
+        for phase, seconds, count in phases:
+            print("%-12s %12.3f %7.1f%% %8d" % (phase, seconds*1000, seconds*100/total,\
+                  count), file=out)
+
+class _Phase:
+    ''' with block measured by WishboneTimer.phase '''
+
+    __slots__ = ("_timer", "_phase")
+
+    def __init__(self, timer, phase):
+        self._timer = timer
+        self._phase = phase
+
+    def __enter__(self):
+        self._timer.start(self._phase)
+        return self
+
+    def __exit__(self, *exception):
+        self._timer.stop()
+        return False
+
+class _Stream:
+    ''' file object measured by WishboneTimer.stream '''
+
+    __slots__ = ("_timer", "_phase", "_stream")
+
+    def __init__(self, timer, phase, stream):
+        self._timer = timer
+        self._phase = phase
+        self._stream = stream
+
+    def write(self, text):
+        self._timer.start(self._phase)
+
+        try:
+            return self._stream.write(text)
+        finally:
+            self._timer.stop()
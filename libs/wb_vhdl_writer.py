@@ -0,0 +1,2044 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+
+# standard
+import io
+import copy
+from datetime import datetime
+from itertools import chain
+# custom
+from wb_component import *
+from wb_intercon import *
+from wb_template import WishboneTemplate
+
+''' this programm offers a class to emit the vhdl code of an intercon section
+by section into a file object '''
+
+__author__ = "Harald Heckmann"
+__copyright__ = "Copyright 2016"
+__credits__ = ["Prof. Dr. Steffen Reith (steffen.reith@hs-rm.de)", \
+                "Harald Heckmann (harald.heckmann@student.hs-rm.de)"]
+__license__ = "GPLv3"
+__version__ = "1.0.0"
+__maintainer__ = "Harald Heckmann"
+__email__ = "harald.heckmann@student.hs-rm.de"
+__status__ = "Development (beta)"
+
+class WishboneVhdlWriter:
+    ''' WishboneVhdlWriter is a class which translates a WishboneIntercon into
+vhdl. The sections of the intercon (header, master ports, slave ports, signals,
+address decoder) are produced by generators and written to the output while
+they are created, so the whole file is never held in memory '''
+
+    def __init__(self, intercon, tmplinter, tmplslave, tmplmaster, deterministic=False,\
+                 timer=None):
+        ''' initialize the writer
+            @param intercon: intercon to translate
+            @type intercon: WishboneIntercon
+            @param tmplinter: path to the intercon template
+            @type tmplinter: String
+            @param tmplslave: path to the slave port template
+            @type tmplslave: String
+            @param tmplmaster: path to the master port template
+            @type tmplmaster: String
+            @param deterministic: leave out the date, so the same intercon
+                                  always results in the same file
+            @type deterministic: Boolean
+            @param timer: timer for the phases templates, slaves and
+                          decoder, None to measure nothing
+            @type timer: WishboneTimer
+        '''
+        self._intercon = intercon
+        self._deterministic = deterministic
+        self._timer = timer
+
+        if timer is not None:
+            timer.start("templates")
+
+        self._tmplinter = WishboneTemplate.load(tmplinter)
+        self._tmplslave = WishboneTemplate.load(tmplslave)
+        self._tmplmaster = WishboneTemplate.load(tmplmaster)
+
+        if timer is not None:
+            timer.stop()
+
+    def write(self, stream):
+        ''' write the intercon section by section into a file object
+            @param stream: object offering write(String)
+            @type stream: file object
+            @raise ValueError: raised if the address ranges of slaves overlap,
+                               the masters cannot share a bus or a slave
+                               cannot be bridged to the data bus width of
+                               the master
+        '''
+        intercon = self._intercon
+        self._prune = intercon.getPrune()
+        self._masters = self._pruned(intercon.getMasters())
+
+        # the address decoder is driven by the only master or by the arbiter
+        if len(self._masters) > 1:
+            master = self._busMaster(self._masters)
+        else:
+            master = self._pruned([intercon.getMaster()])[0]
+
+        # sorted once, every section iterates over this list
+        self._master = master
+        self._slaves = self._sortedSlaves()
+        # slaves with another data bus width than the master are connected to
+        # the bus side of a width bridge (see _bridgeSide)
+        self._bridged = {}
+
+        for slave in self._slaves:
+            if slave.getDataBusWidth() != master.getDataBusWidth():
+                self._bridged[id(slave)] = self._bridgeSide(slave)
+
+        self._tgabits = str(intercon.getTgaBits()-1)
+        self._tgcbits = str(intercon.getTgcBits()-1)
+        self._tgdbits = str(intercon.getTgdBits()-1)
+        # range comparators in the address decoder: total, replaced by prefixes
+        self._comparators = 0
+        self._prefixmatches = 0
+        # partial decoding: address bits per address bus width, selected slaves
+        self._partial = {}
+        self._partialmatches = 0
+        self._partialbits = set()
+
+        # wishbone B4: the bus is pipelined if every master is pipelined and
+        # no pipeline stage holds the requests. Otherwise a request is held
+        # until it is terminated and pipelined slaves accept it once (pend)
+        stages = intercon.getPipelineStages()
+        self._pipelinedbus = stages == 0 and master.getPipelinedMode()
+        self._masterstall = stages == 0 and any(m.getPipelinedMode() for m in self._masters)
+        self._pending = not self._pipelinedbus\
+            and any(slave.getPipelinedMode() for slave in self._slaves)
+        self._slavestall = self._pipelinedbus or self._pending
+        self._cycletypes = any(self._isBurst(slave) for slave in self._slaves)
+        # and_or: the return signals are assigned outside of the decoder
+        self._andor = intercon.getReturnPath() == intercon.CONST.ANDOR
+
+        if self._andor and intercon.getDecoderStyle() != intercon.CONST.PARALLEL:
+            raise ValueError("return_path = and_or needs the one-hot slave select of"\
+                +" decoder = parallel")
+
+        # fragments of the slaves rendered so far, see _fragment
+        self._fragments = {}
+
+        # placeholder values, header
+        values = {}
+        values["date"] = self._date()
+        values["iname"] = intercon.getName()
+
+        # master(s)
+        values["masters"] = self._masterPortDefinitions()
+        values["additonalsignals"] = chain(self._masterSignals(), self._cycleSignals(),\
+                                           self._decoderSignals(), self._arbiterSignals(),\
+                                           self._pipelineSignals(), self._bridgeSignals())
+        values["additional_assignments"] = chain(self._masterAssignments(),\
+                                                self._cycleAssignments(),\
+                                                self._decoderAssignments(),\
+                                                self._timed("decoder", self._returnPath()),\
+                                                self._bridges())
+
+        # pipeline stages, the intercon reads the request from (mreq) and
+        # writes the response to (mresp) the registers instead of the master
+        # (msrc), which is the master port or the arbiter
+        self._msrc = master.getName()
+        values["mreq"] = self._mreq = self._msrc
+        values["mresp"] = self._mresp = self._msrc
+
+        if intercon.getPipelineStages() > 0:
+            values["mreq"] = self._mreq = "req"
+
+        if intercon.getPipelineStages() > 1:
+            values["mresp"] = self._mresp = "rsp"
+
+        values["pipeline"] = chain(self._arbiter(), self._pipeline(), self._pendingRequest())
+
+        # slaves, address decoder and interconnection
+        values["slaves"] = self._slavePorts()
+        values["sensitivity"] = self._sensitivity()
+        values["interconnection"] = self._timed("decoder", self._interconnection())
+        values["antilatch2"] = self._invalidCycle()
+
+        # signal definitions
+        # required signals
+        values["intabwidth"] = str(intercon.getAddressBusWidth()-1)
+        values["intdbwidth"] = str(intercon.getDataBusWidth()-1)
+        values["selwidth"] = str((intercon.getDataBusWidth() >> 3)-1)
+
+        self._tmplinter.stream(stream, values)
+
+    def _date(self):
+        ''' get the date for the header
+            @rtype: String
+            @return: current date, empty in deterministic mode
+        '''
+        if self._deterministic:
+            return ""
+
+        return datetime.now().__str__()
+
+    def _sortedSlaves(self):
+        ''' get the slaves of the intercon in address order
+            @raise ValueError: raised if the address ranges of slaves overlap
+            @rtype: List
+            @return: slaves sorted by base address
+        '''
+        addressmap = self._intercon.getSlaves()
+        overlaps = addressmap.getOverlaps()
+
+        if overlaps:
+            raise ValueError("address ranges of slaves overlap: "+", ".join(\
+                [first.getName()+" and "+second.getName() for first, second in overlaps]))
+
+        return self._pruned(list(addressmap))
+
+    def _pruned(self, components):
+        ''' get the components with the tag signals switched off, which
+            have 0 bits, if pruning is enabled. The components of the
+            intercon are not changed, changed components are copies
+            @param components: masters or slaves
+            @type components: List
+            @rtype: List
+            @return: components to write
+        '''
+        intercon = self._intercon
+
+        if not self._prune:
+            return components
+
+        pruned = []
+        unused = [(getter, setter) for bits, getter, setter in (\
+            (intercon.getTgaBits(), WishboneComponent.getTgaSignal, WishboneComponent.setTgaSignal),\
+            (intercon.getTgcBits(), WishboneComponent.getTgcSignal, WishboneComponent.setTgcSignal),\
+            (intercon.getTgdBits(), WishboneComponent.getTgdSignal, WishboneComponent.setTgdSignal))\
+            if bits == 0]
+
+        for component in components:
+            if any(getter(component) for getter, setter in unused):
+                component = copy.copy(component)
+
+                for getter, setter in unused:
+                    setter(component, False)
+
+            pruned.append(component)
+
+        return pruned
+
+    def _writesData(self, slave):
+        ''' check if data is written to a slave. Without pruning every
+            slave gets the write data
+            @param slave: slave
+            @type slave: WishboneSlave
+            @rtype: Boolean
+            @return: false if the slave is read only and pruning is enabled
+        '''
+        return not self._prune or slave.getDataFlow() != slave.CONST.READ
+
+    def _readsData(self, slave):
+        ''' check if data is read from a slave. Without pruning every slave
+            is an input of the return multiplexer
+            @param slave: slave
+            @type slave: WishboneSlave
+            @rtype: Boolean
+            @return: false if the slave is write only and pruning is enabled
+        '''
+        return not self._prune or slave.getDataFlow() != slave.CONST.WRITE
+
+    def render(self):
+        ''' create the intercon in memory
+            @rtype: String
+            @return: vhdl code of the intercon
+        '''
+        buf = io.StringIO()
+        self.write(buf)
+        return buf.getvalue()
+
+    def getPrefixStatistics(self):
+        ''' get the amount of range comparators in the address decoder of
+            the last written intercon and how many of them were replaced by
+            prefix matches
+            @rtype: Tuple
+            @return: (replaced comparators, total comparators)
+        '''
+        return (self._prefixmatches, self._comparators)
+
+    def getPartialStatistics(self):
+        ''' get how many range comparators in the address decoder of the last
+            written intercon were replaced by partial address decoding and how
+            many address bits the replacements compare
+            @rtype: Tuple
+            @return: (replaced comparators, total comparators, address bits)
+        '''
+        return (self._partialmatches, self._comparators, len(self._partialbits))
+
+    def _masterPortDefinitions(self):
+        ''' generator for the port definitions of all masters '''
+        for masternr, master in enumerate(self._masters):
+            mvalues = {}
+            mvalues["mname"] = master.getName()
+            mvalues["mdbwidth"] = str(master.getDataBusWidth()-1)
+            mvalues["madwidth"] = str(master.getAddressBusWidth()-1)
+            mvalues["mselwidth"] = str((master.getDataBusWidth() >> 3)-1)
+            mvalues["madditional"] = "".join(self._masterPorts(master))
+
+            if masternr > 0:
+                yield "\n\n"
+
+            yield self._tmplmaster.render(mvalues)
+
+    def _masterPorts(self, master):
+        ''' generator for the optional port definitions of a master
+            @param master: master to define the ports for
+            @type master: WishboneMaster
+        '''
+        mname = master.getName()
+        multimaster = len(self._masters) > 1
+
+        if self._hasStall() or master.getPipelinedMode():
+            yield "\n\t\t\t"+mname+"_stall_i : out std_logic := '0';"
+
+        if master.getLockSignal() and multimaster:
+            yield "\n\t\t\t"+mname+"_lock_o : in  std_logic;"
+
+        if master.getErrorSignal():
+            yield "\n\t\t\t"+mname+"_err_i : out std_logic := '0';"
+
+        if master.getRetrySignal():
+            yield "\n\t\t\t"+mname+"_rty_i : out std_logic := '0';"
+
+        if master.getTgaSignal():
+            yield "\n\t\t\t"+mname+"_tga_o : in  std_logic_vector("\
+                +self._tgabits+" downto 0);"
+
+        if master.getTgcSignal():
+            yield "\n\t\t\t"+mname+"_tgc_o : in  std_logic_vector("\
+                +self._tgcbits+" downto 0);"
+
+        if master.getTgdSignal():
+            yield "\n\t\t\t"+mname+"_tgd_i : out std_logic_vector("\
+                +self._tgdbits+" downto 0) := (others => '0');"
+            yield "\n\t\t\t"+mname+"_tgd_o : in  std_logic_vector("\
+                +self._tgdbits+" downto 0);"
+
+        if self._isBurst(master):
+            yield "\n\t\t\t"+mname+"_cti_o : in  std_logic_vector(2 downto 0);"
+            yield "\n\t\t\t"+mname+"_bte_o : in  std_logic_vector(1 downto 0);"
+
+    def _isBurst(self, component):
+        ''' check if a component uses burst cycles (cti and bte signals)
+            @param component: master or slave
+            @type component: WishboneComponent
+            @rtype: Boolean
+            @return: true for burst components
+        '''
+        return component.getDataTransfer() == component.CONST.BURST
+
+    def _hasStall(self):
+        ''' check if the masters get a stall_i port, which is required if the
+            intercon can delay a request (pipeline stages, arbiter)
+            @rtype: Boolean
+            @return: true if stall_i is generated
+        '''
+        return self._intercon.getPipelineStages() > 0 or len(self._masters) > 1
+
+    def _masterSignals(self):
+        ''' generator for the optional signal definitions '''
+        master = self._master
+
+        if master.getErrorSignal():
+            yield "\nsignal err : std_logic := '0';"
+
+        if master.getRetrySignal():
+            yield "\nsignal rty : std_logic := '0';"
+
+        if master.getTgaSignal():
+            yield "\nsignal tga : std_logic_vector("+self._tgabits\
+                +" downto 0) := (others => '0');"
+
+        if master.getTgcSignal():
+            yield "\nsignal tgc : std_logic_vector("+self._tgcbits\
+                +" downto 0) := (others => '0');"
+
+        if master.getTgdSignal():
+            yield "\nsignal tgdm2s : std_logic_vector("+self._tgdbits\
+                +" downto 0) := (others => '0');"
+            yield "\nsignal tgds2m : std_logic_vector("+self._tgdbits\
+                +" downto 0) := (others => '0');"
+
+    def _masterAssignments(self):
+        ''' generator for the optional concurrent signal assignments '''
+        master = self._master
+        mreq = self._mreq
+        mresp = self._mresp
+
+        if master.getErrorSignal():
+            yield "\n\t"+mresp+"_err_i <= err;"
+
+        if master.getRetrySignal():
+            yield "\n\t"+mresp+"_rty_i <= rty;"
+
+        if master.getTgaSignal():
+            yield "\n\ttga <= "+mreq+"_tga_o;"
+
+        if master.getTgcSignal():
+            yield "\n\ttgc <= "+mreq+"_tgc_o;"
+
+        if master.getTgdSignal():
+            yield "\n\ttgdm2s <= "+mreq+"_tgd_o;"
+            yield "\n\t"+mresp+"_tgd_i <= tgds2m;"
+
+    def _cycleSignals(self):
+        ''' generator for the signal definitions of the wishbone B4 cycle
+            types (cti, bte) and of the pipelined mode (stall, pend) '''
+        if self._cycletypes:
+            yield "\nsignal cti : std_logic_vector(2 downto 0) := (others => '0');"
+            yield "\nsignal bte : std_logic_vector(1 downto 0) := (others => '0');"
+
+        if self._slavestall:
+            yield "\nsignal stall : std_logic := '0';"
+
+        if self._pending:
+            yield "\nsignal pend : std_logic := '0';"
+
+    def _cycleAssignments(self):
+        ''' generator for the concurrent assignments of the cycle types and
+            of the stall signal of pipelined masters '''
+        master = self._master
+
+        if self._cycletypes:
+            # masters without bursts only run classic cycles (cti = "000")
+            if self._isBurst(master):
+                yield "\n\tcti <= "+self._mreq+"_cti_o;"
+                yield "\n\tbte <= "+self._mreq+"_bte_o;"
+            else:
+                yield "\n\tcti <= (others => '0');"
+                yield "\n\tbte <= (others => '0');"
+
+        if self._pipelinedbus:
+            yield "\n\t"+self._mresp+"_stall_i <= stall;"
+        elif self._masterstall:
+            # held requests: pipelined masters wait for the termination
+            yield "\n\t"+self._mresp+"_stall_i <= not ("+self._terminate()+");"
+
+    def _terminate(self):
+        ''' get the signals of the bus, which terminate a cycle
+            @rtype: String
+            @return: vhdl expression (std_logic)
+        '''
+        term = ["ack"]
+        if self._master.getErrorSignal(): term.append("err")
+        if self._master.getRetrySignal(): term.append("rty")
+        return " or ".join(term)
+
+    def _pendingRequest(self):
+        ''' generator for the register, which remembers that a held request
+            was accepted by a pipelined slave. The strobe of pipelined slaves
+            is masked until the slave terminates the request '''
+        if not self._pending:
+            return
+
+        yield "\n\n\t-- pipelined slaves accept a held request only once"
+        yield "\n\tpending : process (clk_i)"
+        yield "\n\tbegin"
+        yield "\n\t\tif (rising_edge(clk_i)) then"
+        yield "\n\t\t\tif (rst_i = '1' or cyc = '0') then"
+        yield "\n\t\t\t\tpend <= '0';"
+        yield "\n\t\t\telsif (("+self._terminate()+") = '1') then"
+        yield "\n\t\t\t\tpend <= '0';"
+        yield "\n\t\t\telsif (stb = '1' and stall = '0') then"
+        yield "\n\t\t\t\tpend <= '1';"
+        yield "\n\t\t\tend if;"
+        yield "\n\t\tend if;"
+        yield "\n\tend process pending;"
+
+    def _pipelineSignals(self):
+        ''' generator for the registers of the pipeline stages '''
+        stages = self._intercon.getPipelineStages()
+
+        if stages == 0:
+            return
+
+        master = self._master
+        mdbwidth = str(master.getDataBusWidth()-1)
+        madwidth = str(master.getAddressBusWidth()-1)
+        mselwidth = str((master.getDataBusWidth() >> 3)-1)
+
+        yield "\n\n-- pipeline stage 1: registered request"
+        yield "\nsignal req_dat_o : std_logic_vector("+mdbwidth+" downto 0) := (others => '0');"
+        yield "\nsignal req_adr_o : std_logic_vector("+madwidth+" downto 0) := (others => '0');"
+        yield "\nsignal req_sel_o : std_logic_vector("+mselwidth+" downto 0) := (others => '0');"
+        yield "\nsignal req_we_o, req_stb_o, req_cyc_o, term : std_logic := '0';"
+
+        if master.getTgaSignal():
+            yield "\nsignal req_tga_o : std_logic_vector("+self._tgabits\
+                +" downto 0) := (others => '0');"
+
+        if master.getTgcSignal():
+            yield "\nsignal req_tgc_o : std_logic_vector("+self._tgcbits\
+                +" downto 0) := (others => '0');"
+
+        if master.getTgdSignal():
+            yield "\nsignal req_tgd_o : std_logic_vector("+self._tgdbits\
+                +" downto 0) := (others => '0');"
+
+        if self._isBurst(master):
+            yield "\nsignal req_cti_o : std_logic_vector(2 downto 0) := (others => '0');"
+            yield "\nsignal req_bte_o : std_logic_vector(1 downto 0) := (others => '0');"
+
+        if stages < 2:
+            return
+
+        yield "\n\n-- pipeline stage 2: registered response (rsp_*_i: input, rsp_*_r: register)"
+        yield "\nsignal rsp_dat_i, rsp_dat_r : std_logic_vector("+mdbwidth\
+            +" downto 0) := (others => '0');"
+        yield "\nsignal rsp_ack_i, rsp_ack_r, done : std_logic := '0';"
+
+        if master.getErrorSignal():
+            yield "\nsignal rsp_err_i, rsp_err_r : std_logic := '0';"
+
+        if master.getRetrySignal():
+            yield "\nsignal rsp_rty_i, rsp_rty_r : std_logic := '0';"
+
+        if master.getTgdSignal():
+            yield "\nsignal rsp_tgd_i, rsp_tgd_r : std_logic_vector("+self._tgdbits\
+                +" downto 0) := (others => '0');"
+
+    def _pipeline(self):
+        ''' generator for the processes of the pipeline stages. A request is
+            captured when the master strobes and no other request is in
+            flight. It is held until the slave terminates it (ack, err, rty)
+            and the master is stalled meanwhile '''
+        stages = self._intercon.getPipelineStages()
+
+        if stages == 0:
+            return
+
+        master = self._master
+        msrc = self._msrc
+
+        # signals which terminate a cycle
+        term = ["ack"]
+        if master.getErrorSignal(): term.append("err")
+        if master.getRetrySignal(): term.append("rty")
+
+        yield "\n\n\t-- pipeline stage 1: registered request"
+        yield "\n\tterm <= "+" or ".join(term)+";"
+
+        if stages == 2:
+            yield "\n\t"+msrc+"_stall_i <= req_stb_o or done;"
+        else:
+            yield "\n\t"+msrc+"_stall_i <= req_stb_o;"
+
+        yield "\n\n\trequest_stage : process (clk_i)"
+        yield "\n\tbegin"
+        yield "\n\t\tif (rising_edge(clk_i)) then"
+        yield "\n\t\t\tif (rst_i = '1') then"
+        yield "\n\t\t\t\treq_cyc_o <= '0';"
+        yield "\n\t\t\t\treq_stb_o <= '0';"
+        yield "\n\t\t\telse"
+        yield "\n\t\t\t\treq_cyc_o <= "+msrc+"_cyc_o;"
+        yield "\n\n\t\t\t\tif ("+msrc+"_cyc_o = '0') then"
+        yield "\n\t\t\t\t\t-- cycle finished or aborted by the master"
+        yield "\n\t\t\t\t\treq_stb_o <= '0';"
+        yield "\n\t\t\t\telsif (req_stb_o = '1') then"
+        yield "\n\t\t\t\t\t-- hold the request until the slave terminates it"
+        yield "\n\t\t\t\t\tif (term = '1') then"
+        yield "\n\t\t\t\t\t\treq_stb_o <= '0';"
+        yield "\n\t\t\t\t\tend if;"
+
+        # with a registered response the master still strobes for the old
+        # request while it sees the termination (done)
+        if stages == 2:
+            yield "\n\t\t\t\telsif ("+msrc+"_stb_o = '1' and done = '0') then"
+        else:
+            yield "\n\t\t\t\telsif ("+msrc+"_stb_o = '1') then"
+
+        yield "\n\t\t\t\t\treq_dat_o <= "+msrc+"_dat_o;"
+        yield "\n\t\t\t\t\treq_adr_o <= "+msrc+"_adr_o;"
+        yield "\n\t\t\t\t\treq_sel_o <= "+msrc+"_sel_o;"
+        yield "\n\t\t\t\t\treq_we_o <= "+msrc+"_we_o;"
+
+        if master.getTgaSignal():
+            yield "\n\t\t\t\t\treq_tga_o <= "+msrc+"_tga_o;"
+
+        if master.getTgcSignal():
+            yield "\n\t\t\t\t\treq_tgc_o <= "+msrc+"_tgc_o;"
+
+        if master.getTgdSignal():
+            yield "\n\t\t\t\t\treq_tgd_o <= "+msrc+"_tgd_o;"
+
+        if self._isBurst(master):
+            yield "\n\t\t\t\t\treq_cti_o <= "+msrc+"_cti_o;"
+            yield "\n\t\t\t\t\treq_bte_o <= "+msrc+"_bte_o;"
+
+        yield "\n\t\t\t\t\treq_stb_o <= '1';"
+        yield "\n\t\t\t\tend if;"
+        yield "\n\t\t\tend if;"
+        yield "\n\t\tend if;"
+        yield "\n\tend process request_stage;"
+
+        if stages < 2:
+            return
+
+        # optional response signals: (name, reset value)
+        response = [("dat", None), ("ack", "'0'")]
+        if master.getErrorSignal(): response.append(("err", "'0'"))
+        if master.getRetrySignal(): response.append(("rty", "'0'"))
+        if master.getTgdSignal(): response.append(("tgd", None))
+
+        yield "\n\n\t-- pipeline stage 2: registered response"
+        yield "\n\tdone <= "+" or ".join(["rsp_"+name+"_r" for name in term])+";"
+
+        for name, reset in response:
+            yield "\n\t"+msrc+"_"+name+"_i <= rsp_"+name+"_r;"
+
+        yield "\n\n\tresponse_stage : process (clk_i)"
+        yield "\n\tbegin"
+        yield "\n\t\tif (rising_edge(clk_i)) then"
+        yield "\n\t\t\tif (rst_i = '1') then"
+
+        for name, reset in response:
+            if reset != None:
+                yield "\n\t\t\t\trsp_"+name+"_r <= "+reset+";"
+
+        yield "\n\t\t\telse"
+
+        for name, reset in response:
+            yield "\n\t\t\t\trsp_"+name+"_r <= rsp_"+name+"_i;"
+
+        yield "\n\t\t\tend if;"
+        yield "\n\t\tend if;"
+        yield "\n\tend process response_stage;"
+
+    def _busMaster(self, masters):
+        ''' create the master, which represents the arbiter output (arb_*)
+            towards the address decoder. It has every optional signal one of
+            the masters has
+            @param masters: masters sharing the bus
+            @type masters: List
+            @raise ValueError: raised if the masters use different bus widths
+                               or endianess
+            @rtype: WishboneMaster
+            @return: master component named "arb"
+        '''
+        first = masters[0]
+
+        for master in masters[1:]:
+            if master.getDataBusWidth() != first.getDataBusWidth()\
+            or master.getAddressBusWidth() != first.getAddressBusWidth()\
+            or master.getEndianess() != first.getEndianess():
+                raise ValueError("masters sharing a bus need the same data_bus_width,"\
+                    +" address_bus_width and endianess: "+first.getName()+", "\
+                    +master.getName())
+
+        bus = WishboneMaster()
+        bus.setName("arb")
+        bus.setDataBusWidth(first.getDataBusWidth())
+        bus.setAddressBusWidth(first.getAddressBusWidth())
+        bus.setEndianess(first.getEndianess())
+        bus.setErrorSignal(any(master.getErrorSignal() for master in masters))
+        bus.setRetrySignal(any(master.getRetrySignal() for master in masters))
+        bus.setTgaSignal(any(master.getTgaSignal() for master in masters))
+        bus.setTgcSignal(any(master.getTgcSignal() for master in masters))
+        bus.setTgdSignal(any(master.getTgdSignal() for master in masters))
+        bus.setLockSignal(any(master.getLockSignal() for master in masters))
+        bus.setPipelinedMode(all(master.getPipelinedMode() for master in masters))
+
+        if any(self._isBurst(master) for master in masters):
+            bus.setDataTransfer(bus.CONST.BURST)
+
+        return bus
+
+    def _arbiterSlots(self, masters):
+        ''' get the round robin schedule of an arbiter. Every master has as
+            many slots as its weight (1 without weighted arbitration), the
+            slots of heavier masters are spread over the round
+            @param masters: masters competing in this arbiter
+            @type masters: List
+            @rtype: List
+            @return: index (in masters) of the master for every slot
+        '''
+        weighted = self._intercon.getArbitration() == self._intercon.CONST.WEIGHTED
+        weights = [master.getWeight() if weighted else 1 for master in masters]
+        slots = []
+
+        for turn in range(max(weights)):
+            for masternr, weight in enumerate(weights):
+                if weight > turn:
+                    slots.append(masternr)
+
+        return slots
+
+    def _arbiterSignals(self):
+        ''' generator for the signal definitions of the arbiter '''
+        if len(self._masters) < 2:
+            return
+
+        bus = self._master
+        mdbwidth = str(bus.getDataBusWidth()-1)
+
+        yield "\n\n-- arbiter, arb_* is the bus of the granted master (owner)"
+        yield "\nsignal arb_dat_o, arb_dat_i : std_logic_vector("+mdbwidth\
+            +" downto 0) := (others => '0');"
+        yield "\nsignal arb_adr_o : std_logic_vector("+str(bus.getAddressBusWidth()-1)\
+            +" downto 0) := (others => '0');"
+        yield "\nsignal arb_sel_o : std_logic_vector("+str((bus.getDataBusWidth() >> 3)-1)\
+            +" downto 0) := (others => '0');"
+        yield "\nsignal arb_we_o, arb_stb_o, arb_cyc_o, arb_ack_i : std_logic := '0';"
+
+        if bus.getErrorSignal():
+            yield "\nsignal arb_err_i : std_logic := '0';"
+
+        if bus.getRetrySignal():
+            yield "\nsignal arb_rty_i : std_logic := '0';"
+
+        if bus.getLockSignal():
+            yield "\nsignal arb_lock_o : std_logic := '0';"
+
+        if self._intercon.getPipelineStages() > 0 or self._masterstall:
+            yield "\nsignal arb_stall_i : std_logic := '0';"
+
+        if bus.getTgaSignal():
+            yield "\nsignal arb_tga_o : std_logic_vector("+self._tgabits\
+                +" downto 0) := (others => '0');"
+
+        if bus.getTgcSignal():
+            yield "\nsignal arb_tgc_o : std_logic_vector("+self._tgcbits\
+                +" downto 0) := (others => '0');"
+
+        if bus.getTgdSignal():
+            yield "\nsignal arb_tgd_o, arb_tgd_i : std_logic_vector("+self._tgdbits\
+                +" downto 0) := (others => '0');"
+
+        if self._isBurst(bus):
+            yield "\nsignal arb_cti_o : std_logic_vector(2 downto 0) := (others => '0');"
+            yield "\nsignal arb_bte_o : std_logic_vector(1 downto 0) := (others => '0');"
+
+        yield "\nsignal owner : integer range 0 to "+str(len(self._masters)-1)+" := 0;"
+
+        if self._intercon.getArbitration() != self._intercon.CONST.PRIORITY:
+            yield "\nsignal slot : integer range 0 to "+str(len(self._arbiterSlots(self._masters))-1)\
+                +" := 0;"
+
+        yield "\nsignal granted, busy : std_logic := '0';"
+
+    def _arbiterMux(self, signal, gated, default):
+        ''' generator for a selected signal assignment, which connects an
+            output of the owner to the arbiter bus
+            @param signal: signal suffix, e.g. "adr_o"
+            @type signal: String
+            @param gated: true if the signal has to be masked by granted
+            @type gated: Boolean
+            @param default: value for masters without this signal, None if
+                            every master has it
+            @type default: String
+        '''
+        getters = {"lock_o": WishboneMaster.getLockSignal,
+                   "tga_o": WishboneComponent.getTgaSignal,
+                   "tgc_o": WishboneComponent.getTgcSignal,
+                   "tgd_o": WishboneComponent.getTgdSignal,
+                   "cti_o": self._isBurst,
+                   "bte_o": self._isBurst}
+        masters = self._masters
+
+        yield "\n\twith owner select arb_"+signal+" <="
+
+        for masternr, master in enumerate(masters):
+            if default != None and not getters[signal](master):
+                value = default
+            elif gated:
+                value = master.getName()+"_"+signal+" and granted"
+            else:
+                value = master.getName()+"_"+signal
+
+            if masternr == len(masters)-1:
+                yield "\n\t\t"+value+" when others;"
+            else:
+                yield "\n\t\t"+value+" when "+str(masternr)+","
+
+    def _arbiter(self):
+        ''' generator for the arbiter. While the owner keeps cyc (or lock)
+            asserted the bus is busy, otherwise a new owner is chosen on the
+            next clock edge, so arbitration takes one cycle '''
+        if len(self._masters) < 2:
+            return
+
+        intercon = self._intercon
+        bus = self._master
+        masters = self._masters
+        parking = intercon.getBusParking()
+
+        # request path: multiplexer controlled by the owner
+        yield "\n\n\t-- arbiter: the granted master (owner) drives the bus"
+
+        for signal in ("dat_o", "adr_o", "sel_o", "we_o"):
+            for line in self._arbiterMux(signal, False, None):
+                yield line
+
+        for signal in ("cyc_o", "stb_o"):
+            for line in self._arbiterMux(signal, True, None):
+                yield line
+
+        if bus.getLockSignal():
+            for line in self._arbiterMux("lock_o", True, "'0'"):
+                yield line
+
+        for signal, enabled in (("tga_o", bus.getTgaSignal()), ("tgc_o", bus.getTgcSignal()),\
+                                ("tgd_o", bus.getTgdSignal()), ("cti_o", self._isBurst(bus)),\
+                                ("bte_o", self._isBurst(bus))):
+            if enabled:
+                for line in self._arbiterMux(signal, False, "(others => '0')"):
+                    yield line
+
+        # response path: data is shared, terminations reach the owner only
+        yield "\n\n\t-- arbiter: responses are only visible to the owner"
+
+        for masternr, master in enumerate(masters):
+            mname = master.getName()
+            owned = "(granted = '1' and owner = "+str(masternr)+")"
+
+            yield "\n\t"+mname+"_dat_i <= arb_dat_i;"
+            yield "\n\t"+mname+"_ack_i <= arb_ack_i when "+owned+" else '0';"
+
+            if master.getErrorSignal():
+                yield "\n\t"+mname+"_err_i <= arb_err_i when "+owned+" else '0';"
+
+            if master.getRetrySignal():
+                yield "\n\t"+mname+"_rty_i <= arb_rty_i when "+owned+" else '0';"
+
+            if master.getTgdSignal():
+                yield "\n\t"+mname+"_tgd_i <= arb_tgd_i;"
+
+            if intercon.getPipelineStages() > 0 or self._masterstall:
+                yield "\n\t"+mname+"_stall_i <= arb_stall_i when "+owned+" else '1';"
+            else:
+                yield "\n\t"+mname+"_stall_i <= '0' when "+owned+" else '1';"
+
+        if bus.getLockSignal():
+            yield "\n\n\tbusy <= arb_cyc_o or arb_lock_o;"
+        else:
+            yield "\n\n\tbusy <= arb_cyc_o;"
+
+        # grant
+        if intercon.getArbitration() == intercon.CONST.PRIORITY:
+            yield "\n\n\t-- arbiter: fixed priority, the master defined first wins"
+        elif intercon.getArbitration() == intercon.CONST.WEIGHTED:
+            yield "\n\n\t-- arbiter: weighted round robin, slot schedule: "\
+                +", ".join([masters[masternr].getName() for masternr in self._arbiterSlots(masters)])
+        else:
+            yield "\n\n\t-- arbiter: round robin"
+
+        if parking:
+            yield "\n\t-- bus parking: the grant stays with the last owner while idle"
+
+        if intercon.getArbitration() == intercon.CONST.PRIORITY:
+            slots = None
+        else:
+            slots = self._arbiterSlots(masters)
+
+        requests = [master.getName()+"_cyc_o" for master in masters]
+
+        for line in self._arbiterProcess("arbiter", "", requests, slots):
+            yield line
+
+    def _arbiterProcess(self, label, prefix, requests, slots):
+        ''' generator for the clocked process, which chooses the owner of a
+            bus while it is not busy
+            @param label: name of the process
+            @type label: String
+            @param prefix: prefix of the arbiter signals (owner, slot,
+                           granted, busy)
+            @type prefix: String
+            @param requests: request condition (std_logic) for every master
+            @type requests: List
+            @param slots: round robin schedule (see _arbiterSlots), None for
+                          fixed priority
+            @type slots: List
+        '''
+        parking = self._intercon.getBusParking()
+
+        yield "\n\t"+label+" : process (clk_i)"
+        yield "\n\tbegin"
+        yield "\n\t\tif (rising_edge(clk_i)) then"
+        yield "\n\t\t\tif (rst_i = '1') then"
+        yield "\n\t\t\t\t"+prefix+"owner <= 0;"
+
+        if slots != None:
+            yield "\n\t\t\t\t"+prefix+"slot <= 0;"
+
+        yield "\n\t\t\t\t"+prefix+"granted <= '"+("1" if parking else "0")+"';"
+        yield "\n\t\t\telsif ("+prefix+"busy = '0') then"
+
+        if slots == None:
+            order = [(masternr, None) for masternr in range(len(requests))]
+
+            for line in self._arbiterGrant(order, "\n\t\t\t\t", requests, prefix):
+                yield line
+        else:
+            yield "\n\t\t\t\tcase "+prefix+"slot is"
+
+            for slotnr in range(len(slots)):
+                if slotnr == len(slots)-1:
+                    yield "\n\t\t\t\t\twhen others =>"
+                else:
+                    yield "\n\t\t\t\t\twhen "+str(slotnr)+" =>"
+
+                # search the schedule, starting behind the current slot
+                order = []
+                seen = set()
+
+                for offset in range(1, len(slots)+1):
+                    nextslot = (slotnr+offset) % len(slots)
+
+                    if slots[nextslot] not in seen:
+                        seen.add(slots[nextslot])
+                        order.append((slots[nextslot], nextslot))
+
+                for line in self._arbiterGrant(order, "\n\t\t\t\t\t\t", requests, prefix):
+                    yield line
+
+            yield "\n\t\t\t\tend case;"
+
+        yield "\n\t\t\tend if;"
+        yield "\n\t\tend if;"
+        yield "\n\tend process "+label+";"
+
+    def _arbiterGrant(self, order, indent, requests, prefix):
+        ''' generator for an if/elsif chain, which grants the bus to the
+            first requesting master
+            @param order: (master index, slot or None) in order of priority
+            @type order: List
+            @param indent: newline and indentation to use
+            @type indent: String
+            @param requests: request condition (std_logic) for every master
+            @type requests: List
+            @param prefix: prefix of the arbiter signals
+            @type prefix: String
+        '''
+        for nr, (masternr, slotnr) in enumerate(order):
+            keyword = "if" if nr == 0 else "elsif"
+            yield indent+keyword+" ("+requests[masternr]+" = '1') then"
+            yield indent+"\t"+prefix+"owner <= "+str(masternr)+";"
+
+            if slotnr != None:
+                yield indent+"\t"+prefix+"slot <= "+str(slotnr)+";"
+
+            yield indent+"\t"+prefix+"granted <= '1';"
+
+        if not self._intercon.getBusParking():
+            yield indent+"else"
+            yield indent+"\t"+prefix+"granted <= '0';"
+
+        yield indent+"end if;"
+
+    def _slavePorts(self):
+        ''' generator for the port definitions of all slaves '''
+        for slave in self._slaves:
+            yield self._fragment("port", slave, self._slavePort)
+            yield "\n"
+
+    def _slavePort(self, slave):
+        ''' get the port definition of a slave
+            @param slave: slave to define
+            @type slave: WishboneSlave
+            @rtype: String
+            @return: port definition, ending with ";" unless it is the
+                     definition of the last slave
+        '''
+        sname = slave.getName()
+
+        svalues = {}
+        svalues["sname"] = sname
+        svalues["sdbwidth"] = str(slave.getDataBusWidth()-1)
+        svalues["sdata"] = ""
+
+        if self._writesData(slave):
+            svalues["sdata"] += "            "+sname+"_dat_i : out std_logic_vector("\
+                +svalues["sdbwidth"]+" downto 0) := (others => '0');\n"
+
+        if self._readsData(slave):
+            svalues["sdata"] += "            "+sname+"_dat_o : in  std_logic_vector("\
+                +svalues["sdbwidth"]+" downto 0);\n"
+        svalues["sadhi"] = str(slave.getHighestAddressBit())
+        svalues["sadlo"] = str(slave.getLowestAddressBit())
+        svalues["sselwidth"] = str((slave.getDataBusWidth() >> 3)-1)
+
+        # set optional slave signals
+        additional = []
+
+        if slave.getErrorSignal():
+            additional.append(";\n\t\t\t"+sname+"_err_o : in  std_logic")
+
+        if slave.getRetrySignal():
+            additional.append(";\n\t\t\t"+sname+"_rty_o : in  std_logic")
+
+        if slave.getTgaSignal():
+            additional.append(";\n\t\t\t"+sname+"_tga_i : out std_logic_vector("\
+                +self._tgabits+" downto 0) := (others => '0')")
+
+        if slave.getTgcSignal():
+            additional.append(";\n\t\t\t"+sname+"_tgc_i : out std_logic_vector("\
+                +self._tgcbits+" downto 0) := (others => '0')")
+
+        if slave.getTgdSignal() and self._writesData(slave):
+            additional.append(";\n\t\t\t"+sname+"_tgd_i : out std_logic_vector("\
+                +self._tgdbits+" downto 0) := (others => '0')")
+
+        if slave.getTgdSignal() and self._readsData(slave):
+            additional.append(";\n\t\t\t"+sname+"_tgd_o : in  std_logic_vector("\
+                +self._tgdbits+" downto 0)")
+
+        if self._isBurst(slave):
+            additional.append(";\n\t\t\t"+sname+"_cti_i : out std_logic_vector(2 downto 0)"\
+                +" := (others => '0')")
+            additional.append(";\n\t\t\t"+sname+"_bte_i : out std_logic_vector(1 downto 0)"\
+                +" := (others => '0')")
+
+        if slave.getPipelinedMode():
+            additional.append(";\n\t\t\t"+sname+"_stall_o : in  std_logic")
+
+        if slave is not self._slaves[-1]:
+            additional.append(";")
+
+        svalues["sadditional"] = "".join(additional)
+        return self._tmplslave.render(svalues)
+
+    def _fragment(self, kind, slave, render):
+        ''' get a fragment of a slave. Every fragment is rendered once per
+            intercon, though the default assignments are used in every
+            branch of the decoder
+            @param kind: name of the fragment
+            @type kind: String
+            @param slave: slave the fragment belongs to
+            @type slave: WishboneSlave
+            @param render: function rendering the fragment for a slave
+            @type render: Function
+            @rtype: String or List
+            @return: rendered fragment
+        '''
+        fragments = self._fragments.setdefault(id(slave), {})
+        fragment = fragments.get(kind)
+
+        if fragment is None:
+            if self._timer is not None:
+                self._timer.start("slaves")
+
+            fragment = fragments[kind] = render(slave)
+
+            if self._timer is not None:
+                self._timer.stop()
+
+        return fragment
+
+    def _timed(self, phase, section):
+        ''' measure a section with the timer, if there is one
+            @param phase: name of the phase
+            @type phase: String
+            @param section: generator of the section
+            @type section: Generator
+            @rtype: Generator
+            @return: section
+        '''
+        if self._timer is None:
+            return section
+
+        return self._timer.iterate(phase, section)
+
+    def _interconnection(self):
+        ''' generator for the address decoder and the interconnection '''
+        style = self._intercon.getDecoderStyle()
+
+        if style == self._intercon.CONST.TREE:
+            return self._treeDecoder()
+        elif style == self._intercon.CONST.PARALLEL:
+            return self._parallelDecoder()
+        else:
+            return self._chainDecoder()
+
+    def _chainDecoder(self):
+        ''' generator for an if/elsif chain over the sorted slaves, the
+            first slave whose range contains adr is selected '''
+        yield "\n\t\t\t-- default assignments, overridden by the selected slave"
+
+        for line in self._defaults():
+            yield "\n\t\t\t"+line
+
+        if self._slaves:
+            yield "\n"
+
+        for slavenr, slave in enumerate(self._slaves):
+            # define address decoder
+            yield "\n\t\t\t-- Baseaddress: "+hex(slave.getBaseAddress())\
+                    + ", size: "+hex(slave.getAddressSize())
+
+            match = self._addressMatch(slave, self._rangeMatch(slave, "adr"))
+
+            if slavenr == 0:
+                yield "\n\t\t\tif ("+match+") then"
+            else:
+                yield "\n\t\t\telsif ("+match+") then"
+
+            # define interconnection
+            for line in self._slaveConnection(slave):
+                yield "\n\t\t\t\t"+line
+
+        if self._slaves:
+            yield "\n\t\t\tend if;"
+
+        for line in self._prefixReport("\n\t\t\t"):
+            yield line
+
+    def _treeDecoder(self):
+        ''' generator for a balanced binary search over the sorted base
+            addresses. Every slave is reached after log2(N) comparisons and
+            checked against the bounds of its range, which are not covered
+            by the search '''
+        yield "\n\t\t\t-- default assignments, overridden by the selected slave"
+
+        for line in self._defaults():
+            yield "\n\t\t\t"+line
+
+        if self._slaves:
+            yield "\n"
+
+            for line in self._treeNode(0, len(self._slaves), 3):
+                yield line
+
+        for line in self._prefixReport("\n\t\t\t"):
+            yield line
+
+    def _treeNode(self, lo, hi, depth):
+        ''' generator for the part of the binary search tree, which selects
+            one of the slaves lo..hi-1
+            @param lo: index of the first slave in this subtree
+            @type lo: Integer
+            @param hi: index behind the last slave in this subtree
+            @type hi: Integer
+            @param depth: indentation (tabs)
+            @type depth: Integer
+        '''
+        indent = "\n"+"\t"*depth
+
+        if hi-lo == 1:
+            slave = self._slaves[lo]
+            yield indent+"-- Baseaddress: "+hex(slave.getBaseAddress())\
+                    + ", size: "+hex(slave.getAddressSize())
+
+            # the search only tells the slaves apart, addresses in gaps, behind
+            # the last and below the first slave are rejected by the leaf.
+            # The first leaf also needs the lower bound of its range
+            if lo == 0:
+                match = self._rangeMatch(slave, "adr")
+            else:
+                match = "to_integer(unsigned(adr)) < "\
+                        +str(slave.getBaseAddress()+slave.getAddressSize())
+
+            yield indent+"if ("+self._addressMatch(slave, match)+") then"
+            for line in self._slaveConnection(slave):
+                yield indent+"\t"+line
+            yield indent+"end if;"
+
+            return
+
+        mid = (lo+hi) >> 1
+        yield indent+"if (to_integer(unsigned(adr)) < "\
+                +str(self._slaves[mid].getBaseAddress())+") then"
+
+        for line in self._treeNode(lo, mid, depth+1):
+            yield line
+
+        yield indent+"else"
+
+        for line in self._treeNode(mid, hi, depth+1):
+            yield line
+
+        yield indent+"end if;"
+
+    def _parallelDecoder(self):
+        ''' generator for independent slave connections, every slave is
+            enabled by its own bit of the one-hot vector ssel '''
+        yield "\n\t\t\t-- default assignments, overridden by the selected slave"
+
+        for line in self._defaults():
+            yield "\n\t\t\t"+line
+
+        for slavenr, slave in enumerate(self._slaves):
+            yield "\n\n\t\t\t-- Baseaddress: "+hex(slave.getBaseAddress())\
+                    + ", size: "+hex(slave.getAddressSize())
+            yield "\n\t\t\tif (ssel("+str(slavenr)+") = '1') then"
+
+            for line in self._slaveConnection(slave):
+                yield "\n\t\t\t\t"+line
+
+            yield "\n\t\t\tend if;"
+
+    def _decoderSignals(self):
+        ''' generator for the signal definitions the address decoder needs '''
+        if self._intercon.getDecoderStyle() == self._intercon.CONST.PARALLEL\
+        and self._slaves:
+            yield "\n\n-- one-hot slave select (parallel address decoder)"
+            yield "\nsignal ssel : std_logic_vector("+str(len(self._slaves)-1)\
+                +" downto 0) := (others => '0');"
+
+    def _decoderAssignments(self):
+        ''' generator for the concurrent range matches of the parallel
+            address decoder '''
+        if self._intercon.getDecoderStyle() != self._intercon.CONST.PARALLEL:
+            return
+
+        yield "\n\n\t-- address decoder, one range match per slave"
+
+        for slavenr, slave in enumerate(self._slaves):
+            match = self._addressMatch(slave, self._rangeMatch(slave, "adr"))
+            yield "\n\tssel("+str(slavenr)+") <= '1' when ("+match+") else '0';"
+
+        for line in self._prefixReport("\n\t"):
+            yield line
+
+    def _returnPath(self):
+        ''' generator for the and_or return path. The outputs of every slave
+            are masked with its bit of the one-hot slave select and the masked
+            outputs are ored, so every return signal is two gates deep
+            instead of a multiplexer growing with every slave '''
+        if not self._andor:
+            return
+
+        master = self._master
+        returns = {"dats2m": [], "ack": [], "err": [], "rty": [], "tgds2m": [], "stall": []}
+
+        for slavenr, slave in enumerate(self._slaves):
+            slave = self._bridged.get(id(slave), slave)
+            sname = slave.getName()
+            ssel = "ssel("+str(slavenr)+")"
+
+            if self._readsData(slave):
+                if slave.getEndianess() == master.getEndianess():
+                    dat = sname+"_dat_o"
+                else:
+                    dat = "("+self._byteSwap(sname+"_dat_o", slave.getDataBusWidth())+")"
+
+                returns["dats2m"].append("("+dat+" and ("+str(master.getDataBusWidth()-1)\
+                    +" downto 0 => "+ssel+"))")
+
+                if slave.getTgdSignal():
+                    returns["tgds2m"].append("("+sname+"_tgd_o and ("+self._tgdbits\
+                        +" downto 0 => "+ssel+"))")
+
+            returns["ack"].append("("+sname+"_ack_o and "+ssel+")")
+
+            if slave.getErrorSignal():
+                returns["err"].append("("+sname+"_err_o and "+ssel+")")
+
+            if slave.getRetrySignal():
+                returns["rty"].append("("+sname+"_rty_o and "+ssel+")")
+
+            if slave.getPipelinedMode():
+                returns["stall"].append("("+sname+"_stall_o and "+ssel+")")
+            else:
+                term = [sname+"_ack_o"]
+                if slave.getErrorSignal(): term.append(sname+"_err_o")
+                if slave.getRetrySignal(): term.append(sname+"_rty_o")
+                returns["stall"].append("(not ("+" or ".join(term)+") and "+ssel+")")
+
+        # only the signals the master (or the arbiter) has
+        used = {"dats2m": "(others => '0')", "ack": "'0'"}
+        if master.getErrorSignal(): used["err"] = "'0'"
+        if master.getRetrySignal(): used["rty"] = "'0'"
+        if master.getTgdSignal(): used["tgds2m"] = "(others => '0')"
+        if self._slavestall: used["stall"] = "'0'"
+
+        yield "\n\n\t-- return path, outputs of the slave selected by ssel"
+
+        for signal, default in used.items():
+            terms = returns[signal]
+
+            if not terms:
+                yield "\n\t"+signal+" <= "+default+";"
+            else:
+                yield "\n\t"+signal+" <= "+"\n\t\tor ".join(terms)+";"
+
+    def _bridgeSide(self, slave):
+        ''' get the bus side of the width bridge of a slave, a copy of the
+            slave named <slave>_br with the data bus width and endianess of
+            the master. The intercon connects it like any other slave and
+            _bridges connects it to the slave
+            @param slave: slave with another data bus width than the master
+            @type slave: WishboneSlave
+            @raise ValueError: raised if the slave cannot be bridged
+            @rtype: WishboneSlave
+            @return: bus side of the bridge
+        '''
+        master = self._master
+        widths = sorted((slave.getDataBusWidth(), master.getDataBusWidth()))
+
+        if widths[0] < 8 or widths[0] & 7 or widths[1] % widths[0]\
+        or (widths[1] // widths[0]) & (widths[1] // widths[0]-1):
+            raise ValueError("the data bus widths of the master and slave "+slave.getName()\
+                +" have to be multiples of 8, which differ by a power of two")
+
+        # a split transfer is acknowledged once, so the slave cannot stall
+        # or burst on its own
+        if slave.getPipelinedMode() or self._isBurst(slave):
+            raise ValueError("slave "+slave.getName()+" needs mode = classic and "\
+                +"data_transfer = single to be bridged to the data bus width of the master")
+
+        # the bridge selects the byte lanes by the lowest bits of a byte
+        # address, so the slave has to get them
+        lanebits = ((widths[1] >> 3)-1).bit_length()
+
+        if slave.getAddressingGranularity() == slave.CONST.WORD\
+        or (slave.getLowestAddressBit() or 0) > 0:
+            raise ValueError("slave "+slave.getName()+" needs addressing_granularity = byte"\
+                +" and address_bus_low = 0 to be bridged to the data bus width of the master")
+
+        if (slave.getHighestAddressBit() or 0) < lanebits:
+            raise ValueError("slave "+slave.getName()+" needs address_bus_high >= "\
+                +str(lanebits)+" to be bridged to the data bus width of the master")
+
+        bridge = copy.copy(slave)
+        bridge.setName(slave.getName()+"_br")
+        bridge.setDataBusWidth(master.getDataBusWidth())
+        bridge.setEndianess(master.getEndianess())
+        # the lanes are selected by the lowest address bits
+        bridge.setLowestAddressBit(0)
+        return bridge
+
+    def _laneOffset(self, component, lane):
+        ''' get the byte address of a byte lane relative to the data bus
+            @param component: master or slave owning the data bus
+            @type component: WishboneComponent
+            @param lane: byte lane, lane 0 is dat(7 downto 0)
+            @type lane: Integer
+            @rtype: Integer
+            @return: byte address offset
+        '''
+        if component.getEndianess() == component.CONST.LENDIAN:
+            return lane
+
+        return (component.getDataBusWidth() >> 3)-1-lane
+
+    def _lane(self, signal, lane):
+        ''' get a byte lane of a data signal
+            @param signal: name of the signal
+            @type signal: String
+            @param lane: byte lane, lane 0 is dat(7 downto 0)
+            @type lane: Integer
+            @rtype: String
+            @return: vhdl slice
+        '''
+        return signal+"("+str(8*lane+7)+" downto "+str(8*lane)+")"
+
+    def _bridgeSignals(self):
+        ''' generator for the signals of the width bridges, the bus side
+            ports and the state of the down-sizers '''
+        master = self._master
+
+        for slave in self._slaves:
+            bridge = self._bridged.get(id(slave))
+
+            if bridge is None:
+                continue
+
+            bname = bridge.getName()
+            swidth = slave.getDataBusWidth()
+            mwidth = master.getDataBusWidth()
+            parts = max(swidth, mwidth) // min(swidth, mwidth)
+
+            yield "\n\n-- data width bridge of "+slave.getName()+" ("+str(mwidth)\
+                +" to "+str(swidth)+" bits)"
+            yield "\nsignal "+bname+"_dat_i, "+bname+"_dat_o : std_logic_vector("\
+                +str(mwidth-1)+" downto 0) := (others => '0');"
+            yield "\nsignal "+bname+"_sel_i : std_logic_vector("+str((mwidth >> 3)-1)\
+                +" downto 0) := (others => '0');"
+            yield "\nsignal "+bname+"_adr_i : std_logic_vector("\
+                +str(slave.getHighestAddressBit())+" downto 0) := (others => '0');"
+
+            onebit = [bname+"_cyc_i", bname+"_stb_i", bname+"_we_i", bname+"_ack_o"]
+            if slave.getErrorSignal(): onebit.append(bname+"_err_o")
+            if slave.getRetrySignal(): onebit.append(bname+"_rty_o")
+            if swidth < mwidth: onebit.append(bname+"_last")
+            yield "\nsignal "+", ".join(onebit)+" : std_logic := '0';"
+
+            for tag, bits, used in (("tga_i", self._tgabits, slave.getTgaSignal()),\
+                    ("tgc_i", self._tgcbits, slave.getTgcSignal()),\
+                    ("tgd_i", self._tgdbits, slave.getTgdSignal() and self._writesData(slave)),\
+                    ("tgd_o", self._tgdbits, slave.getTgdSignal() and self._readsData(slave))):
+                if used:
+                    yield "\nsignal "+bname+"_"+tag+" : std_logic_vector("+bits\
+                        +" downto 0) := (others => '0');"
+
+            # part: transfer of the down-sizer (slave word) or up-sizer (master
+            # word inside of the slave word) in address order
+            yield "\nsignal "+bname+"_part : integer range 0 to "+str(parts-1)+" := 0;"
+
+            if swidth < mwidth:
+                yield "\nsignal "+bname+"_adr : std_logic_vector("\
+                    +str(slave.getHighestAddressBit())+" downto 0) := (others => '0');"
+                yield "\nsignal "+bname+"_rdat : std_logic_vector("+str(mwidth-1)\
+                    +" downto 0) := (others => '0');"
+                yield "\nsignal "+bname+"_act, "+bname+"_pend, "+bname+"_done : "\
+                    +"std_logic_vector("+str(parts-1)+" downto 0) := (others => '0');"
+
+    def _bridges(self):
+        ''' generator for the width bridges between the bus side, which the
+            intercon connects, and the slaves '''
+        for slave in self._slaves:
+            bridge = self._bridged.get(id(slave))
+
+            if bridge is None:
+                continue
+
+            sname = slave.getName()
+            bname = bridge.getName()
+
+            yield "\n\n\t-- data width bridge of "+sname+" ("+str(bridge.getDataBusWidth())\
+                +" to "+str(slave.getDataBusWidth())+" bits)"
+
+            if slave.getDataBusWidth() < bridge.getDataBusWidth():
+                lines = self._downsizer(slave, bridge)
+            else:
+                lines = self._upsizer(slave, bridge)
+
+            for line in lines:
+                yield line
+
+            yield "\n\t"+sname+"_cyc_i <= "+bname+"_cyc_i;"
+            yield "\n\t"+sname+"_stb_i <= "+bname+"_stb_i;"
+            yield "\n\t"+sname+"_we_i <= "+bname+"_we_i;"
+
+            if slave.getErrorSignal():
+                yield "\n\t"+bname+"_err_o <= "+sname+"_err_o;"
+
+            if slave.getRetrySignal():
+                yield "\n\t"+bname+"_rty_o <= "+sname+"_rty_o;"
+
+            if slave.getTgaSignal():
+                yield "\n\t"+sname+"_tga_i <= "+bname+"_tga_i;"
+
+            if slave.getTgcSignal():
+                yield "\n\t"+sname+"_tgc_i <= "+bname+"_tgc_i;"
+
+            if slave.getTgdSignal() and self._writesData(slave):
+                yield "\n\t"+sname+"_tgd_i <= "+bname+"_tgd_i;"
+
+            if slave.getTgdSignal() and self._readsData(slave):
+                yield "\n\t"+bname+"_tgd_o <= "+sname+"_tgd_o;"
+
+    def _downsizer(self, slave, bridge):
+        ''' generator for a down-sizer, which splits a transfer of the
+            master into one transfer per slave word with selected byte lanes.
+            The read data of all but the last transfer is registered, the
+            master is acknowledged by the last transfer. err and rty end the
+            transfer at once
+            @param slave: narrow slave
+            @type slave: WishboneSlave
+            @param bridge: bus side of the bridge, see _bridgeSide
+            @type bridge: WishboneSlave
+        '''
+        sname = slave.getName()
+        bname = bridge.getName()
+        slanes = slave.getDataBusWidth() >> 3
+        mlanes = bridge.getDataBusWidth() >> 3
+        parts = mlanes // slanes
+        # master lane of every slave lane (highest slave lane first) per part
+        lanes = []
+
+        for part in range(parts):
+            offsets = [part*slanes+self._laneOffset(slave, lane) for lane in range(slanes)]
+            lanes.append([self._laneOffset(bridge, offset) for offset in reversed(offsets)])
+
+        for part in range(parts):
+            yield "\n\t"+bname+"_act("+str(part)+") <= "\
+                +" or ".join(bname+"_sel_i("+str(lane)+")" for lane in lanes[part])+";"
+
+        yield "\n\t"+bname+"_pend <= "+bname+"_act and not "+bname+"_done;"
+        yield "\n\t"+bname+"_part <= "+"".join(str(part)+" when "+bname+"_pend("+str(part)\
+            +") = '1' else\n\t\t" for part in range(parts-1))+str(parts-1)+";"
+        yield "\n\t"+bname+"_last <= '1' when unsigned("+bname+"_pend and std_logic_vector("\
+            +"unsigned("+bname+"_pend)-1)) = 0 else '0';"
+
+        # the address of the part replaces the lane bits of the master
+        lanebits = (mlanes-1).bit_length()
+        wordbits = (slanes-1).bit_length()
+        adr = bname+"_adr_i("+str(slave.getHighestAddressBit())+" downto "+str(lanebits)\
+            +") & std_logic_vector(to_unsigned("+bname+"_part, "+str(lanebits-wordbits)+"))"
+
+        if wordbits:
+            adr += " & "+bname+"_adr_i("+str(wordbits-1)+" downto 0)"
+
+        yield "\n\t"+bname+"_adr <= "+adr+";"
+        yield "\n\t"+sname+"_adr_i <= "+bname+"_adr("+str(slave.getHighestAddressBit())\
+            +" downto "+str(slave.getLowestAddressBit())+");"
+
+        if self._writesData(slave):
+            yield "\n\twith "+bname+"_part select "+sname+"_dat_i <="
+            yield ",".join("\n\t\t"+" & ".join(self._lane(bname+"_dat_i", lane)\
+                for lane in lanes[part])+" when "+(str(part) if part < parts-1 else "others")\
+                for part in range(parts))+";"
+
+        yield "\n\twith "+bname+"_part select "+sname+"_sel_i <="
+        yield ",".join("\n\t\t("+", ".join(str(slanes-1-nr)+" => "+bname+"_sel_i("+str(lane)\
+            +")" for nr, lane in enumerate(lanes[part]))+") when "\
+            +(str(part) if part < parts-1 else "others") for part in range(parts))+";"
+        yield "\n\t"+bname+"_ack_o <= "+sname+"_ack_o and "+bname+"_last;"
+
+        if self._readsData(slave):
+            for part in range(parts):
+                for nr, lane in enumerate(lanes[part]):
+                    yield "\n\t"+self._lane(bname+"_dat_o", lane)+" <= "\
+                        +self._lane(sname+"_dat_o", slanes-1-nr)+" when "+bname\
+                        +"_part = "+str(part)+" else "+self._lane(bname+"_rdat", lane)+";"
+
+        term = []
+        if slave.getErrorSignal(): term.append(sname+"_err_o = '1'")
+        if slave.getRetrySignal(): term.append(sname+"_rty_o = '1'")
+
+        yield "\n\n\t"+sname+"_bridge : process (clk_i)"
+        yield "\n\tbegin"
+        yield "\n\t\tif (rising_edge(clk_i)) then"
+        yield "\n\t\t\tif (rst_i = '1' or "+bname+"_cyc_i = '0') then"
+        yield "\n\t\t\t\t"+bname+"_done <= (others => '0');"
+        yield "\n\t\t\telsif ("+bname+"_stb_i = '1' and "+sname+"_ack_o = '1') then"
+        yield "\n\t\t\t\tif ("+bname+"_last = '1') then"
+        yield "\n\t\t\t\t\t"+bname+"_done <= (others => '0');"
+        yield "\n\t\t\t\telse"
+        yield "\n\t\t\t\t\t"+bname+"_done("+bname+"_part) <= '1';"
+        yield "\n\t\t\t\tend if;"
+
+        if self._readsData(slave):
+            yield "\n\n\t\t\t\tcase "+bname+"_part is"
+
+            for part in range(parts):
+                yield "\n\t\t\t\t\twhen "+(str(part) if part < parts-1 else "others")+" =>"
+
+                for nr, lane in enumerate(lanes[part]):
+                    yield "\n\t\t\t\t\t\t"+self._lane(bname+"_rdat", lane)+" <= "\
+                        +self._lane(sname+"_dat_o", slanes-1-nr)+";"
+
+            yield "\n\t\t\t\tend case;"
+
+        if term:
+            yield "\n\t\t\telsif ("+" or ".join(term)+") then"
+            yield "\n\t\t\t\t"+bname+"_done <= (others => '0');"
+
+        yield "\n\t\t\tend if;"
+        yield "\n\t\tend if;"
+        yield "\n\tend process;\n"
+
+    def _upsizer(self, slave, bridge):
+        ''' generator for an up-sizer, which places a transfer of the master
+            on the byte lanes of the wide slave selected by the address. The
+            write data is repeated on every part of the slave word, only the
+            lanes of the addressed part are selected
+            @param slave: wide slave
+            @type slave: WishboneSlave
+            @param bridge: bus side of the bridge, see _bridgeSide
+            @type bridge: WishboneSlave
+        '''
+        sname = slave.getName()
+        bname = bridge.getName()
+        slanes = slave.getDataBusWidth() >> 3
+        mlanes = bridge.getDataBusWidth() >> 3
+        parts = slanes // mlanes
+        lanebits = (mlanes-1).bit_length()
+        wordbits = (slanes-1).bit_length()
+        # (part, master lane) of every slave lane
+        lanes = []
+
+        for lane in range(slanes):
+            offset = self._laneOffset(slave, lane)
+            lanes.append((offset // mlanes, self._laneOffset(bridge, offset % mlanes)))
+
+        yield "\n\t"+bname+"_part <= to_integer(unsigned("+bname+"_adr_i("+str(wordbits-1)\
+            +" downto "+str(lanebits)+")));"
+        yield "\n\t"+sname+"_adr_i <= "+bname+"_adr_i("+str(slave.getHighestAddressBit())\
+            +" downto "+str(slave.getLowestAddressBit())+");"
+
+        if self._writesData(slave):
+            yield "\n\t"+sname+"_dat_i <= "+" & ".join(self._lane(bname+"_dat_i", lanes[lane][1])\
+                for lane in reversed(range(slanes)))+";"
+
+        for lane, (part, mlane) in enumerate(lanes):
+            yield "\n\t"+sname+"_sel_i("+str(lane)+") <= "+bname+"_sel_i("+str(mlane)\
+                +") when "+bname+"_part = "+str(part)+" else '0';"
+
+        yield "\n\t"+bname+"_ack_o <= "+sname+"_ack_o;"
+
+        if self._readsData(slave):
+            for mlane in range(mlanes):
+                # slave lane of this master lane per part
+                choices = sorted((part, lane) for lane, (part, used) in enumerate(lanes)\
+                                 if used == mlane)
+                yield "\n\twith "+bname+"_part select "+self._lane(bname+"_dat_o", mlane)+" <="
+                yield ",".join("\n\t\t"+self._lane(sname+"_dat_o", lane)+" when "\
+                    +(str(part) if part < parts-1 else "others") for part, lane in choices)+";"
+
+    def _rangeMatch(self, slave, adr):
+        ''' get a condition, which selects the address range of a slave by
+            comparing against both ends of the range
+            @param slave: slave to select
+            @type slave: WishboneSlave
+            @param adr: name of the address signal
+            @type adr: String
+            @rtype: String
+            @return: vhdl condition
+        '''
+        base = slave.getBaseAddress()
+        end = base+slave.getAddressSize()
+
+        if base == 0:
+            return "to_integer(unsigned("+adr+")) < "+str(end)
+
+        return "to_integer(unsigned("+adr+")) >= "+str(base)\
+            +" and to_integer(unsigned("+adr+")) < "+str(end)
+
+    def _prefixMatch(self, slave, adr, width):
+        ''' get a condition, which selects the address range of a slave by
+            comparing the upper address bits only. This is possible if the
+            size of the range is a power of two and the base address is
+            aligned to it
+            @param slave: slave to select
+            @type slave: WishboneSlave
+            @param adr: name of the address signal
+            @type adr: String
+            @param width: width of the address signal
+            @type width: Integer
+            @rtype: String
+            @return: vhdl condition on success, None if a range compare is required
+        '''
+        base = slave.getBaseAddress()
+        size = slave.getAddressSize()
+
+        if size <= 0 or size & (size-1) or base & (size-1):
+            return None
+
+        # number of address bits inside of the range
+        low = size.bit_length()-1
+
+        if low >= width:
+            # the range covers the whole address bus
+            return "true" if base == 0 else None
+
+        prefix = base >> low
+
+        if prefix >> (width-low):
+            # the range starts behind the address bus
+            return None
+
+        bits = format(prefix, "0"+str(width-low)+"b")
+
+        if width-low == 1:
+            return adr+"("+str(low)+") = '"+bits+"'"
+
+        return adr+"("+str(width-1)+" downto "+str(low)+") = \""+bits+"\""
+
+    def _partialBits(self, width):
+        ''' get the address bits, which tell every slave apart from all other
+            slaves. Every slave occupies the smallest aligned block enclosing
+            its range. The blocks are split bit by bit from the top, like a
+            binary trie: where a group of slaves has members on both sides of a
+            bit, this bit is compared for all of them. Slaves whose block
+            encloses other slaves cannot be told apart and are left out, so
+            they and the enclosed slaves are decoded completely
+            @param width: width of the address signal
+            @type width: Integer
+            @rtype: Dictionary
+            @return: base address -> list of (bit, value), highest bit first
+        '''
+        if width in self._partial:
+            return self._partial[width]
+
+        blocks = []
+
+        for slave in self._slaves:
+            base = slave.getBaseAddress()
+            last = base+slave.getAddressSize()-1
+
+            # slaves behind the address bus are never selected
+            if last < base or last >> width:
+                continue
+
+            # bits below low vary inside of the block
+            blocks.append((base, (base ^ last).bit_length()))
+
+        bits = {base: [] for base, low in blocks}
+        groups = [(blocks, width-1)]
+
+        while groups:
+            group, bit = groups.pop()
+
+            if len(group) < 2:
+                continue
+
+            if bit < 0 or any(low > bit for base, low in group):
+                # a block encloses the others
+                for base, low in group:
+                    del bits[base]
+                continue
+
+            zeros = [block for block in group if not block[0] >> bit & 1]
+            ones = [block for block in group if block[0] >> bit & 1]
+
+            if zeros and ones:
+                for base, low in group:
+                    bits[base].append((bit, base >> bit & 1))
+
+            groups.append((zeros, bit-1))
+            groups.append((ones, bit-1))
+
+        self._partial[width] = bits
+        return bits
+
+    def _bitsMatch(self, bits, adr):
+        ''' get the condition comparing some address bits, neighbouring bits
+            are compared as one slice
+            @param bits: (bit, value) pairs, highest bit first
+            @type bits: List
+            @param adr: name of the address signal
+            @type adr: String
+            @rtype: String
+            @return: vhdl condition
+        '''
+        if not bits:
+            # the only slave
+            return "true"
+
+        slices = []
+        start = 0
+
+        for nr in range(1, len(bits)+1):
+            if nr < len(bits) and bits[nr][0] == bits[nr-1][0]-1:
+                continue
+
+            high = bits[start][0]
+            values = "".join(str(value) for bit, value in bits[start:nr])
+
+            if nr-start == 1:
+                slices.append(adr+"("+str(high)+") = '"+values+"'")
+            else:
+                slices.append(adr+"("+str(high)+" downto "+str(bits[nr-1][0])\
+                    +") = \""+values+"\"")
+
+            start = nr
+
+        return " and ".join(slices)
+
+    def _addressMatch(self, slave, match, adr="adr", width=None):
+        ''' get the condition to select a slave, which compares only some
+            address bits if partial decoding is enabled and a prefix match if
+            prefix matching is enabled and possible
+            @param slave: slave to select
+            @type slave: WishboneSlave
+            @param match: range compare to use otherwise
+            @type match: String
+            @param adr: name of the address signal
+            @type adr: String
+            @param width: width of the address signal, None for the address
+                          bus width of the intercon
+            @type width: Integer
+            @rtype: String
+            @return: vhdl condition
+        '''
+        self._comparators += 1
+
+        if width == None:
+            width = self._intercon.getAddressBusWidth()
+
+        if self._intercon.getPartialDecode():
+            bits = self._partialBits(width).get(slave.getBaseAddress())
+
+            if bits != None:
+                self._partialmatches += 1
+                self._partialbits.update(bit for bit, value in bits)
+                return self._bitsMatch(bits, adr)
+
+        if not self._intercon.getPrefixMatch():
+            return match
+
+        prefix = self._prefixMatch(slave, adr, width)
+
+        if prefix == None:
+            return match
+
+        self._prefixmatches += 1
+        return prefix
+
+    def _prefixReport(self, indent):
+        ''' generator for a comment, which reports how many range comparators
+            of the address decoder were replaced by prefix matches or partial
+            decoding
+            @param indent: newline and indentation to use
+            @type indent: String
+        '''
+        if self._intercon.getPrefixMatch():
+            yield indent+"-- prefix matching replaced "+str(self._prefixmatches)\
+                +" of "+str(self._comparators)+" range comparators"
+
+        if self._intercon.getPartialDecode():
+            yield indent+"-- partial decoding replaced "+str(self._partialmatches)\
+                +" of "+str(self._comparators)+" range comparators, comparing "\
+                +str(len(self._partialbits))+" address bits"
+
+    def _sensitivity(self):
+        ''' get the sensitivity list of the interconnect process, it contains
+            every signal the process reads, so simulation matches synthesis
+            @rtype: String
+            @return: signals, separated by ", "
+        '''
+        signals = ["cyc", "adr", "sel", "we", "stb"]
+
+        if any(self._writesData(slave) for slave in self._slaves):
+            signals.append("datm2s")
+
+        for signal, used in (("tga", "getTgaSignal"), ("tgc", "getTgcSignal")):
+            if any(getattr(slave, used)() for slave in self._slaves):
+                signals.append(signal)
+
+        if any(slave.getTgdSignal() and self._writesData(slave) for slave in self._slaves):
+            signals.append("tgdm2s")
+
+        if any(self._isBurst(slave) for slave in self._slaves):
+            signals += ["cti", "bte"]
+
+        if self._intercon.getDecoderStyle() == self._intercon.CONST.PARALLEL\
+        and self._slaves:
+            signals.append("ssel")
+
+        if self._pending:
+            signals.append("pend")
+
+        # with and_or the process does not read the slave outputs
+        if self._andor:
+            return ", ".join(signals)
+
+        for slave in self._slaves:
+            slave = self._bridged.get(id(slave), slave)
+            sname = slave.getName()
+
+            if self._readsData(slave):
+                signals.append(sname+"_dat_o")
+
+            signals.append(sname+"_ack_o")
+
+            if slave.getErrorSignal():
+                signals.append(sname+"_err_o")
+
+            if slave.getRetrySignal():
+                signals.append(sname+"_rty_o")
+
+            if slave.getTgdSignal() and self._readsData(slave):
+                signals.append(sname+"_tgd_o")
+
+            if self._slavestall and slave.getPipelinedMode():
+                signals.append(sname+"_stall_o")
+
+        return ", ".join(signals)
+
+    def _invalidCycle(self):
+        ''' generator for the assignments when cyc is low (no valid cycle) '''
+        yield "\n\t\t\t-- prevent latches on invalid cycles"
+
+        for line in self._defaults():
+            yield "\n\t\t\t"+line
+
+    def _slaveConnection(self, slave):
+        ''' get the statements (without indentation), which connect a
+            slave to the intercon signals
+            @param slave: selected slave
+            @type slave: WishboneSlave
+            @rtype: List
+            @return: list of vhdl statements
+        '''
+        return self._fragment("connection", slave, self._renderConnection)
+
+    def _byteSwap(self, signal, width):
+        ''' get an expression, which reverses the byte order of a signal
+            @param signal: name of the signal
+            @type signal: String
+            @param width: width of the signal in bits
+            @type width: Integer
+            @rtype: String
+            @return: vhdl expression
+        '''
+        if width <= 8:
+            return signal
+
+        return " & ".join([signal+"("+str(8*i+7)+" downto "+str(8*i)+")"\
+            for i in range(width >> 3)])
+
+    def _renderConnection(self, slave):
+        ''' render the statements (without indentation), which connect a
+            slave to the intercon signals
+            @param slave: selected slave
+            @type slave: WishboneSlave
+            @rtype: List
+            @return: list of vhdl statements
+        '''
+        master = self._master
+        slave = self._bridged.get(id(slave), slave)
+        sname = slave.getName()
+        lines = []
+
+        writes = self._writesData(slave)
+        reads = self._readsData(slave)
+        # with and_or the return signals are assigned by _returnPath
+        returns = not self._andor
+
+        # a write only slave returns no data, the constant is no input of
+        # the return multiplexer (and keeps dats2m free of latches)
+        if returns and not reads:
+            lines.append("dats2m <= (others => '0');")
+
+        # endianess conversion
+        if slave.getEndianess() == master.getEndianess():
+            if writes: lines.append(sname+"_dat_i <= datm2s;")
+            if returns and reads: lines.append("dats2m <= "+sname+"_dat_o;")
+            lines.append(sname+"_sel_i <= sel;")
+        else:
+            lines.append("-- conversion of endianess")
+            mbw = master.getDataBusWidth()-1
+            sbw = slave.getDataBusWidth()-1
+            selmax = (master.getDataBusWidth() >> 3)
+
+            for i in range(0, (slave.getDataBusWidth() >> 3)):
+                datm2shi = str(mbw-8*i)
+                if i != (slave.getDataBusWidth() >> 3): datm2slo = str(mbw-8*(i+1)+1)
+                else: datm2slo = "0"
+
+                phi = str(8*(i+1)-1)
+                if i != 0: plo = str(8*i)
+                else: plo = "0"
+
+                lines.append(sname+"_sel_i("+str(i)+" downto "+str(i)+") <= sel("\
+                    +str(selmax-(i+1))+" downto "+str(selmax-(i+1))+");")
+                if writes: lines.append(sname+"_dat_i("+phi+" downto "+plo+") <= datm2s("\
+                    +datm2shi+" downto "+datm2slo+");")
+                if returns and reads: lines.append("dats2m("+datm2shi+" downto "+datm2slo\
+                    +") <= "+sname+"_dat_o("+phi+" downto "+plo+");")
+
+            lines.append("-- end of conversion")
+
+        if returns:
+            lines.append("ack <= "+sname+"_ack_o;")
+
+        lines.append(sname+"_adr_i <= adr("+str(slave.getHighestAddressBit())\
+            +" downto "+str(slave.getLowestAddressBit())+");")
+        lines.append(sname+"_cyc_i <= cyc;")
+
+        if slave.getPipelinedMode() and self._pending:
+            lines.append(sname+"_stb_i <= stb and not pend;")
+        else:
+            lines.append(sname+"_stb_i <= stb;")
+
+        lines.append(sname+"_we_i <= we;")
+
+        # set optional slave signals
+        if returns and slave.getErrorSignal():
+            lines.append("err <= "+sname+"_err_o;")
+
+        if returns and slave.getRetrySignal():
+            lines.append("rty <= "+sname+"_rty_o;")
+
+        if slave.getTgaSignal():
+            lines.append(sname+"_tga_i <= tga;")
+
+        if slave.getTgcSignal():
+            lines.append(sname+"_tgc_i <= tgc;")
+
+        if slave.getTgdSignal() and writes:
+            lines.append(sname+"_tgd_i <= tgdm2s;")
+
+        if returns and slave.getTgdSignal() and reads:
+            lines.append("tgds2m <= "+sname+"_tgd_o;")
+        elif returns and slave.getTgdSignal():
+            lines.append("tgds2m <= (others => '0');")
+
+        if self._isBurst(slave):
+            lines.append(sname+"_cti_i <= cti;")
+            lines.append(sname+"_bte_i <= bte;")
+
+        # stall: the slave does not accept the current request (yet)
+        if returns and self._slavestall:
+            if slave.getPipelinedMode():
+                lines.append("stall <= "+sname+"_stall_o;")
+            else:
+                term = [sname+"_ack_o"]
+                if slave.getErrorSignal(): term.append(sname+"_err_o")
+                if slave.getRetrySignal(): term.append(sname+"_rty_o")
+                lines.append("stall <= not ("+" or ".join(term)+");")
+
+        return lines
+
+    def _slaveDefaults(self, slave):
+        ''' get the default assignments (without indentation) for a slave,
+            which prevent latches when the slave is not selected
+            @param slave: slave to deselect
+            @type slave: WishboneSlave
+            @rtype: List
+            @return: list of vhdl statements
+        '''
+        return self._fragment("defaults", slave, self._renderDefaults)
+
+    def _renderDefaults(self, slave):
+        ''' render the default assignments (without indentation) for a
+            slave, which prevent latches when the slave is not selected
+            @param slave: slave to deselect
+            @type slave: WishboneSlave
+            @rtype: List
+            @return: list of vhdl statements
+        '''
+        slave = self._bridged.get(id(slave), slave)
+        sname = slave.getName()
+        lines = [sname+"_dat_i <= (others => '0');",
+                 sname+"_sel_i <= (others => '0');",
+                 sname+"_adr_i <= (others => '0');",
+                 sname+"_cyc_i <= '0';",
+                 sname+"_stb_i <= '0';",
+                 sname+"_we_i <= '0';"]
+
+        if not self._writesData(slave):
+            del lines[0]
+
+        # with and_or the return signals are assigned by _returnPath
+        returns = not self._andor
+
+        if returns and slave.getErrorSignal():
+            lines.append("err <= '0';")
+
+        if returns and slave.getRetrySignal():
+            lines.append("rty <= '0';")
+
+        if slave.getTgaSignal():
+            lines.append(sname+"_tga_i <= (others => '0');")
+
+        if slave.getTgcSignal():
+            lines.append(sname+"_tgc_i <= (others => '0');")
+
+        if slave.getTgdSignal() and self._writesData(slave):
+            lines.append(sname+"_tgd_i <= (others => '0');")
+
+        if returns and slave.getTgdSignal():
+            lines.append("tgds2m <= (others => '0');")
+
+        if self._isBurst(slave):
+            lines.append(sname+"_cti_i <= (others => '0');")
+            lines.append(sname+"_bte_i <= (others => '0');")
+
+        return lines
+
+    def _defaults(self):
+        ''' generator for the default assignments (without indentation) of
+            all slaves and the intercon return signals '''
+        for slave in self._slaves:
+            for line in self._slaveDefaults(slave):
+                yield line
+
+        if self._andor:
+            return
+
+        yield "dats2m <= (others => '0');"
+        yield "ack <= '0';"
+
+        if self._slavestall:
+            yield "stall <= '0';"
@@ -0,0 +1,190 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+
+# standard
+import os
+import glob
+from time import perf_counter, sleep
+# custom
+from wb_file_manager import WishboneFileManager
+from wb_stamp import *
+
+''' this programm offers a class which watches config files and templates
+and generates the intercons again as soon as they are saved '''
+
+__author__ = "Harald Heckmann"
+__copyright__ = "Copyright 2016"
+__credits__ = ["Prof. Dr. Steffen Reith (steffen.reith@hs-rm.de)", \
+                "Harald Heckmann (harald.heckmann@student.hs-rm.de)"]
+__license__ = "GPLv3"
+__version__ = "1.0.0"
+__maintainer__ = "Harald Heckmann"
+__email__ = "harald.heckmann@student.hs-rm.de"
+__status__ = "Development (beta)"
+
+# seconds between two checks of the files
+INTERVAL = 0.05
+
+def _signature(path):
+    ''' get what identifies a version of a file
+        @param path: path to the file
+        @type path: String
+        @rtype: Tuple
+        @return: (modification time, size), None if the file does not exist
+    '''
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+
+    return (stat.st_mtime_ns, stat.st_size)
+
+class WishboneWatch:
+    ''' WishboneWatch is a class which keeps the parsed intercons of config
+files in memory and checks the files periodically. A changed config file is
+parsed and generated again, a changed template generates all intercons
+again from the parsed configs. The compiled templates are kept by
+WishboneTemplate, so only changed templates are compiled again '''
+
+    def __init__(self, configs, interval=INTERVAL, deterministic=False,\
+                 templatedir=None, outputdir=None):
+        ''' initialize the watch
+            @param configs: paths or glob patterns (e.g. cfg/*.ini) of the
+                            config files, patterns are expanded on every
+                            check, so new config files are found
+            @type configs: List containing Strings
+            @param interval: seconds between two checks of the files
+            @type interval: Float
+            @param deterministic: see WishboneFileManager
+            @type deterministic: Boolean
+            @param templatedir: see WishboneFileManager
+            @type templatedir: String
+            @param outputdir: see WishboneFileManager
+            @type outputdir: String
+        '''
+        self._patterns = configs
+        self._interval = interval
+        self._deterministic = deterministic
+        self._templatedir = templatedir
+        self._outputdir = outputdir
+        self._templates = [directory(templatedir, TEMPLATEDIR)+name for name in TEMPLATES]
+        self._templatesignature = None
+        # config -> [signature, WishboneFileManager holding the parsed
+        # intercon or None if it was not parsed]
+        self._configs = {}
+
+    def _manager(self):
+        ''' create a file manager with the options of the watch
+            @rtype: WishboneFileManager
+            @return: new file manager
+        '''
+        return WishboneFileManager(deterministic=self._deterministic,\
+                                   templatedir=self._templatedir,\
+                                   outputdir=self._outputdir)
+
+    def _expand(self):
+        ''' get the config files matching the patterns
+            @rtype: List containing Strings
+            @return: paths of the config files
+        '''
+        configs = []
+
+        for pattern in self._patterns:
+            for config in (sorted(glob.glob(pattern)) or [pattern]):
+                if config not in configs and os.path.isfile(config):
+                    configs.append(config)
+
+        return configs
+
+    def _generate(self, config, entry, parse):
+        ''' generate the intercon of a config file
+            @param config: path to the config file
+            @type config: String
+            @param entry: [signature, file manager] of the config file
+            @type entry: List
+            @param parse: parse the config file, false to use the intercon
+                          parsed before
+            @type parse: Boolean
+            @rtype: Tuple
+            @return: (config, status, path of the vhdl file, seconds, message)
+        '''
+        start = perf_counter()
+
+        try:
+            if parse or entry[1] == None:
+                entry[1] = None
+                wbmngr = self._manager()
+                status = "generated" if wbmngr.update(config) else "up to date"
+                # an intercon, which was up to date, is parsed when the
+                # templates change
+                if status == "generated":
+                    entry[1] = wbmngr
+            else:
+                wbmngr = entry[1]
+                wbmngr.regenerate(config)
+                status = "generated"
+
+            return (config, status, wbmngr._vhdlinter, perf_counter()-start, "")
+        except Exception as e:
+            entry[1] = None
+            return (config, "failure", None, perf_counter()-start, str(e))
+
+    def check(self):
+        ''' check the files once and generate the intercons, whose config
+            file or templates changed since the last check
+            @rtype: List
+            @return: (config, status, path of the vhdl file, seconds,
+                     message) per generated config file
+        '''
+        results = []
+        templatesignature = [_signature(path) for path in self._templates]
+        templateschanged = self._templatesignature != None\
+                           and templatesignature != self._templatesignature
+        self._templatesignature = templatesignature
+        configs = self._expand()
+
+        for config in list(self._configs):
+            if config not in configs:
+                del self._configs[config]
+
+        for config in configs:
+            signature = _signature(config)
+            entry = self._configs.get(config)
+
+            if entry == None or entry[0] != signature:
+                entry = self._configs[config] = [signature, None]
+                results.append(self._generate(config, entry, True))
+            elif templateschanged:
+                results.append(self._generate(config, entry, False))
+
+        return results
+
+    def run(self, report=None):
+        ''' check the files until the watch is interrupted (ctrl+c)
+            @param report: called with the results of every check, which
+                           generated something, None to print them
+            @type report: Function
+        '''
+        report = report or self.printResults
+
+        try:
+            while True:
+                results = self.check()
+
+                if results:
+                    report(results)
+
+                sleep(self._interval)
+        except KeyboardInterrupt:
+            pass
+
+    def printResults(self, results):
+        ''' print the status and the time of every generated config file
+            @param results: results of check
+            @type results: List
+        '''
+        for config, status, output, took, message in results:
+            print("%s: %s (%.2f ms)" % (config, status, took*1000))
+
+            if message:
+                print("\t"+message)
@@ -3,16 +3,19 @@
 
 import sys
 import os
-from time import time
+import json
+import argparse
+from time import perf_counter
 
 # add custom libraries
 path = os.path.abspath(os.path.join(os.path.dirname(__file__), 'libs'))
 if not path in sys.path:
-    print(path)
     sys.path.insert(1, path)
 del path
 
-from wb_file_manager import WishboneFileManager
+# the generator is imported when it is needed, so --help and intercons
+# which are up to date return without loading it
+from wb_stamp import *
 
 ''' this programm controlls the general flow '''
 
@@ -26,25 +29,289 @@ __maintainer__ = "Harald Heckmann"
 __email__ = "harald.heckmann@student.hs-rm.de"
 __status__ = "Development (beta)"
 
-if __name__ == '__main__':
-    start = time()
-    terminate = "success"
+def parseArguments(arguments):
+    ''' parse the command line
+        @param arguments: command line arguments without the programm name
+        @type arguments: List containing Strings
+        @rtype: argparse.Namespace
+        @return: parsed arguments
+    '''
+    parser = argparse.ArgumentParser(description="generate a wishbone intercon "\
+                                     "in vhdl from a config file")
+    parser.add_argument("configs", nargs="*", metavar="config",\
+                        help="config files or glob patterns like cfg/*.ini "\
+                        "(default: ./cfg/wishbone.ini), several config files "\
+                        "are generated in a batch")
+    parser.add_argument("-o", "--output-dir", metavar="DIR",\
+                        help="directory of the generated intercons (default: vhdl)")
+    parser.add_argument("-t", "--template-dir", metavar="DIR",\
+                        help="directory of the templates (default: vhdl)")
+    parser.add_argument("--stdout", action="store_true",\
+                        help="write the intercon to stdout instead of a file")
+    parser.add_argument("-q", "--quiet", action="store_true",\
+                        help="do not print the parsed config")
+    parser.add_argument("--deterministic", action="store_true",\
+                        help="no date stamp, the same config results in the same file")
+    parser.add_argument("--write-map", metavar="FILE",\
+                        help="write the config with the base addresses assigned "\
+                        "to slaves without base_address into FILE")
+    parser.add_argument("-j", "--jobs", type=int, metavar="N",\
+                        help="worker processes for several config files "\
+                        "(default: one per processor)")
+    parser.add_argument("-w", "--watch", action="store_true",\
+                        help="keep running and generate again when a config "\
+                        "file or a template is saved (stop with ctrl+c)")
+    parser.add_argument("--interval", type=float, default=0.05, metavar="SECONDS",\
+                        help="seconds between two checks in watch mode (default: 0.05)")
+    parser.add_argument("--timing", action="store_true",\
+                        help="print the time of every phase of the generation")
+    parser.add_argument("--report", metavar="FILE",\
+                        help="write the times of the phases as json into FILE")
+    parser.add_argument("--profile", metavar="FILE",\
+                        help="profile the generation with cProfile and write "\
+                        "the statistics into FILE (see pstats)")
+    parser.add_argument("--trace-memory", action="store_true",\
+                        help="measure the peak memory with tracemalloc")
+    args = parser.parse_args(arguments)
+
+    if args.stdout and len(args.configs) > 1:
+        parser.error("--stdout takes a single config file")
+
+    if args.write_map and (len(args.configs) > 1 or args.watch\
+    or any(char in "".join(args.configs) for char in "*?[")):
+        parser.error("--write-map takes a single config file")
+
+    if args.stdout and args.watch:
+        parser.error("--stdout cannot be used with --watch")
+
+    if args.watch and (args.timing or args.report or args.profile or args.trace_memory):
+        parser.error("--watch cannot be measured, measure a single run instead")
+
+    if args.interval <= 0:
+        parser.error("--interval must be greater than 0")
+
+    if args.jobs != None and args.jobs < 1:
+        parser.error("--jobs must be at least 1")
+
+    return args
+
+def isUpToDate(config, args):
+    ''' check the stamp of a config file without loading the generator
+        @param config: path to the config file
+        @type config: String
+        @param args: parsed arguments
+        @type args: argparse.Namespace
+        @rtype: Boolean
+        @return: true if the intercon of the config file is up to date
+    '''
+    try:
+        key = inputKey(config, directory(args.template_dir, TEMPLATEDIR),\
+                       directory(args.output_dir, OUTPUTDIR), args.deterministic)
+    except OSError:
+        # reported by the generator
+        return False
+
+    return readStamp(config, key) != None
+
+def printStatistics(statistics):
+    ''' print the statistics of the address decoder
+        @param statistics: statistics, see WishboneFileManager.getDecoderStatistics
+        @type statistics: Dictionary
+    '''
+    if "prefix" in statistics:
+        print("prefix matching replaced %d of %d range comparators" % statistics["prefix"])
+
+    if "partial" in statistics:
+        print("partial decoding replaced %d of %d range comparators, comparing %d "\
+              "address bits" % statistics["partial"])
+
+def writeStdout(args, timer):
+    ''' generate the intercon of a config file to stdout, nothing else is
+        printed there, so the output can be piped
+        @param args: parsed arguments
+        @type args: argparse.Namespace
+        @param timer: timer for the phases, None to measure nothing
+        @type timer: WishboneTimer
+        @rtype: String
+        @return: exit status
+    '''
+    from wb_file_manager import WishboneFileManager
+    config = args.configs[0] if args.configs else "./cfg/wishbone.ini"
+
+    if not os.path.isfile(config):
+        sys.stderr.write("main: config file not found: "+config+"\n")
+        return "failure"
 
     try:
-        wbmngr = WishboneFileManager()
-        wbmngr.parse()
-        wbmngr.printConfigContent()
-        wbmngr.generateIntercon()
+        wbmngr = WishboneFileManager(deterministic=args.deterministic,\
+                                     templatedir=args.template_dir, timer=timer)
+        wbmngr.parse(config)
+        sys.stdout.write(wbmngr.renderIntercon())
+
+        if args.write_map:
+            wbmngr.writeAddressMap(args.write_map)
     except Exception as e:
-        terminate = "failure"
-        print("\nmain: "+e.args[0])
+        sys.stderr.write("main: "+str(e)+"\n")
+        return "failure"
+
+    return "success"
+
+def generate(args, timer, start):
+    ''' generate the intercons of the config files, a single config file
+        directly, several config files and glob patterns in a batch
+        @param args: parsed arguments
+        @type args: argparse.Namespace
+        @param timer: timer for the phases, None to measure nothing. The
+                      jobs of a batch are measured as a whole only
+        @type timer: WishboneTimer
+        @param start: perf_counter value at the start of the programm
+        @type start: Float
+        @rtype: Tuple
+        @return: (exit status, results of the batch or None)
+    '''
+    configs = args.configs if args.configs else ["./cfg/wishbone.ini"]
+    single = len(configs) == 1 and not any(char in configs[0] for char in "*?[")
+    results = None
+
+    try:
+        if single and not args.write_map and isUpToDate(configs[0], args):
+            print("intercon is up to date")
+        elif single:
+            from wb_file_manager import WishboneFileManager
+            wbmngr = WishboneFileManager(deterministic=args.deterministic,\
+                                         templatedir=args.template_dir,\
+                                         outputdir=args.output_dir, timer=timer)
+
+            if not wbmngr.update(configs[0]):
+                print("intercon is up to date")
+
+                # the address map is allocated while parsing
+                if args.write_map:
+                    wbmngr.parse(configs[0])
+            elif not args.quiet:
+                printStatistics(wbmngr.getDecoderStatistics())
+                wbmngr.printConfigContent()
+
+            if args.write_map:
+                wbmngr.writeAddressMap(args.write_map)
+                print("address map written to "+args.write_map)
+        else:
+            from wb_batch import WishboneBatch
+            batch = WishboneBatch(configs, args.jobs, args.deterministic,\
+                                  args.template_dir, args.output_dir)
+            results = batch.run()
+            batch.printSummary(results, perf_counter()-start)
+
+            if any(result[1] == "failure" for result in results):
+                return ("failure", results)
+    except Exception as e:
+        print("\nmain: "+str(e))
+        return ("failure", results)
+
+    return ("success", results)
+
+def writeReport(path, args, terminate, seconds, timer, results, peak):
+    ''' write the measurements as json, so the performance can be compared
+        between versions and configs
+        @param path: path of the report
+        @type path: String
+        @param args: parsed arguments
+        @type args: argparse.Namespace
+        @param terminate: exit status
+        @type terminate: String
+        @param seconds: time of the whole run
+        @type seconds: Float
+        @param timer: timer of the phases
+        @type timer: WishboneTimer
+        @param results: results of the batch, None for a single config file
+        @type results: List
+        @param peak: peak memory in bytes, None if it was not measured
+        @type peak: Integer
+        @raise OSError: raised if the report cannot be written
+    '''
+    report = {"version": __version__, "python": sys.version.split()[0],\
+              "configs": args.configs if args.configs else ["./cfg/wishbone.ini"],\
+              "options": {"deterministic": args.deterministic,\
+                          "stdout": args.stdout,\
+                          "jobs": args.jobs},\
+              "status": terminate, "seconds": seconds}
+    report.update(timer.getReport())
+
+    if results != None:
+        report["jobs"] = [{"config": config, "status": status, "output": output,\
+                           "seconds": took, "message": message}\
+                          for config, status, output, took, message in results]
+
+    if peak != None:
+        report["peak_memory"] = peak
+
+    with open(path, "w") as reportfile:
+        json.dump(report, reportfile, indent=4)
+        reportfile.write("\n")
+
+if __name__ == '__main__':
+    start = perf_counter()
+    args = parseArguments(sys.argv[1:])
+
+    if args.watch:
+        from wb_watch import WishboneWatch
+        print("watching, stop with ctrl+c")
+        WishboneWatch(args.configs if args.configs else ["./cfg/wishbone.ini"],\
+                      args.interval, args.deterministic, args.template_dir,\
+                      args.output_dir).run()
+        sys.exit(0)
+
+    timer = None
+    profiler = None
+
+    if args.timing or args.report:
+        from wb_timing import WishboneTimer
+        timer = WishboneTimer()
+
+    if args.trace_memory:
+        import tracemalloc
+        tracemalloc.start()
+
+    if args.profile:
+        import cProfile
+        profiler = cProfile.Profile()
+        profiler.enable()
+
+    if args.stdout:
+        terminate, results = writeStdout(args, timer), None
+    else:
+        terminate, results = generate(args, timer, start)
+
+    if profiler != None:
+        profiler.disable()
+        profiler.dump_stats(args.profile)
+
+    peak = tracemalloc.get_traced_memory()[1] if args.trace_memory else None
+    seconds = perf_counter()-start
+    # with --stdout only the intercon is written to stdout
+    out = sys.stderr if args.stdout else sys.stdout
+
+    if args.timing:
+        print("", file=out)
+        timer.printPhases(out)
+
+    if peak != None:
+        print("Peak memory: %d bytes" % peak, file=out)
+
+    if args.report:
+        try:
+            writeReport(args.report, args, terminate, seconds, timer, results, peak)
+        except OSError as e:
+            terminate = "failure"
+            print("main: "+str(e), file=out)
 
+    if args.stdout:
+        sys.exit(0 if terminate == "success" else 1)
 
-    timedif = time()-start
-    testdif = timedif*1000000
     print("\n")
-    if (testdif > 1000000): print("Execution time: %f seconds" % (timedif*1000000))
-    elif (testdif > 1000): print("Execution time: %f milliseconds" % (timedif*1000))
-    else: print("Execution time: %f microseconds" % testdif)
+    if seconds >= 1: print("Execution time: %f seconds" % seconds)
+    elif seconds >= 0.001: print("Execution time: %f milliseconds" % (seconds*1000))
+    else: print("Execution time: %f microseconds" % (seconds*1000000))
 
     print("Exit status: "+terminate)
+    sys.exit(0 if terminate == "success" else 1)
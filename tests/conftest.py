@@ -0,0 +1,98 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+
+# standard
+import os
+import sys
+# custom
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# the generator modules are imported from libs/, like main.py does
+sys.path.insert(1, os.path.join(ROOT, "libs"))
+
+''' this programm offers the fixtures shared by the tests: config files of
+small intercons and the directory of the templates '''
+
+__author__ = "Harald Heckmann"
+__copyright__ = "Copyright 2016"
+__credits__ = ["Prof. Dr. Steffen Reith (steffen.reith@hs-rm.de)", \
+                "Harald Heckmann (harald.heckmann@student.hs-rm.de)"]
+__license__ = "GPLv3"
+__version__ = "1.0.0"
+__maintainer__ = "Harald Heckmann"
+__email__ = "harald.heckmann@student.hs-rm.de"
+__status__ = "Development (beta)"
+
+GENERAL = """[GENERAL]
+name = %s
+tga_bits = 2
+tgc_bits = 0
+tgd_bits = 0
+data_bus_width = 32
+address_bus_width = 32
+decoder = %s
+
+[MASTER0]
+name = cpu
+data_bus_width = 32
+address_bus_width = 32
+endianess = big
+data_flow = rw
+err = false
+rty = false
+tga = false
+tgc = false
+tgd = false
+"""
+
+SLAVE = """
+[SLAVE%d]
+name = %s
+data_bus_width = 32
+endianess = %s
+address_bus_high = %d
+address_bus_low = 0
+base_address = 0x%x
+address_size = 0x%x
+addressing_granularity = byte
+word_size = 32
+data_flow = rw
+err = false
+rty = false
+tga = false
+tgc = false
+tgd = false
+"""
+
+# name, base address, address size: adjacent slaves, gaps and a slave at 0
+SLAVES = [("boot", 0x0, 0x10), ("ram", 0x10, 0x10), ("rom", 0x50, 0x10),\
+          ("uart", 0x2000, 0x10)]
+
+@pytest.fixture
+def templatedir():
+    ''' get the directory of the templates of the repository '''
+    return os.path.join(ROOT, "vhdl")
+
+@pytest.fixture
+def config(tmp_path):
+    ''' get a function, which writes a config file into the temporary
+        directory of the test and returns its path. Its arguments are the
+        file name, the intercon name, the decoder style and the slaves as
+        (name, base address, address size), SLAVES by default
+    '''
+    def write(file="wishbone.ini", name="test_intercon", decoder="chain",\
+              slaves=SLAVES):
+        content = GENERAL % (name, decoder)
+
+        for number, (sname, base, size) in enumerate(slaves):
+            endianess = "little" if number % 2 else "big"
+            content += SLAVE % (number, sname, endianess, size.bit_length()-2,\
+                                base, size)
+
+        path = tmp_path / file
+        path.write_text(content)
+        return str(path)
+
+    return write
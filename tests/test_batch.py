@@ -0,0 +1,54 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+
+# standard
+import os
+# custom
+import pytest
+from wb_batch import WishboneBatch
+
+''' this programm tests, that a batch does not generate two config files
+into the same vhdl file '''
+
+__author__ = "Harald Heckmann"
+__copyright__ = "Copyright 2016"
+__credits__ = ["Prof. Dr. Steffen Reith (steffen.reith@hs-rm.de)", \
+                "Harald Heckmann (harald.heckmann@student.hs-rm.de)"]
+__license__ = "GPLv3"
+__version__ = "1.0.0"
+__maintainer__ = "Harald Heckmann"
+__email__ = "harald.heckmann@student.hs-rm.de"
+__status__ = "Development (beta)"
+
+@pytest.mark.parametrize("first, second", [("my_bus", "my_bus"), ("my bus", "my_bus")])
+def testDuplicateOutput(config, templatedir, tmp_path, monkeypatch, first, second):
+    ''' the second config file of an intercon name fails without running,
+        also if the names only become equal as file names '''
+    # the stamps are written to the working directory
+    monkeypatch.chdir(tmp_path)
+    outputdir = str(tmp_path / "out")
+    configs = [config("first.ini", first, decoder="chain"),\
+               config("second.ini", second, decoder="parallel")]
+
+    batch = WishboneBatch(configs, 1, True, templatedir, outputdir)
+    results = batch.run()
+    output = os.path.join(outputdir, "my_bus.vhdl")
+
+    assert [result[1] for result in results] == ["generated", "failure"]
+    assert results[0][2] == output
+    assert results[1][2] == output
+    assert results[1][4] == "same vhdl file as "+configs[0]+": "+output
+    # the file is the intercon of the first config, not of the second
+    assert "ssel" not in open(output).read()
+    assert os.listdir(outputdir) == ["my_bus.vhdl"]
+
+def testDistinctOutputs(config, templatedir, tmp_path, monkeypatch):
+    ''' config files of different intercons are all generated '''
+    monkeypatch.chdir(tmp_path)
+    outputdir = str(tmp_path / "out")
+    configs = [config("first.ini", "bus_a"), config("second.ini", "bus_b")]
+
+    results = WishboneBatch(configs, 1, True, templatedir, outputdir).run()
+
+    assert [result[1] for result in results] == ["generated", "generated"]
+    assert sorted(os.listdir(outputdir)) == ["bus_a.vhdl", "bus_b.vhdl"]
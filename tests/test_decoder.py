@@ -0,0 +1,117 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+
+# standard
+import re
+# custom
+import pytest
+from wb_file_manager import WishboneFileManager
+from conftest import SLAVES
+
+''' this programm tests the address bounds of the decoder styles: the
+generated vhdl is evaluated for addresses at and next to the borders of the
+slaves, every address has to select the slave containing it and nothing
+else '''
+
+__author__ = "Harald Heckmann"
+__copyright__ = "Copyright 2016"
+__credits__ = ["Prof. Dr. Steffen Reith (steffen.reith@hs-rm.de)", \
+                "Harald Heckmann (harald.heckmann@student.hs-rm.de)"]
+__license__ = "GPLv3"
+__version__ = "1.0.0"
+__maintainer__ = "Harald Heckmann"
+__email__ = "harald.heckmann@student.hs-rm.de"
+__status__ = "Development (beta)"
+
+ADDRESS = "to_integer(unsigned(adr))"
+
+def condition(vhdl, address, ssel):
+    ''' evaluate a decoder condition
+        @param vhdl: condition, comparisons of the address and ssel bits
+        @type vhdl: String
+        @param address: value of adr
+        @type address: Integer
+        @param ssel: values of the select vector of the parallel decoder
+        @type ssel: Dictionary
+        @rtype: Boolean
+        @return: value of the condition
+    '''
+    python = vhdl.replace(ADDRESS, "address")
+    python = re.sub(r"ssel\((\d+)\) = '1'", r"ssel[\1]", python)
+    assert re.fullmatch(r"[\w\s()\[\]<>=]*", python), "unexpected condition: "+vhdl
+    return eval(python, {}, {"address": address, "ssel": ssel})
+
+def selected(vhdl, address):
+    ''' get the slaves, which the interconnect process connects to the
+        master for an address
+        @param vhdl: generated intercon
+        @type vhdl: String
+        @param address: value of adr
+        @type address: Integer
+        @rtype: List
+        @return: names of the selected slaves
+    '''
+    ssel = {}
+
+    for index, match in re.findall(r"ssel\((\d+)\) <= '1' when \((.*)\) else '0';", vhdl):
+        ssel[int(index)] = condition(match, address, {})
+
+    process = vhdl[vhdl.index("interconnect : process"):]
+    lines = process[process.index("if (cyc = '1') then"):].splitlines()[1:]
+    # per open if: is its branch active, was one of its branches taken
+    stack = []
+    slaves = []
+
+    for line in lines:
+        line = line.strip()
+        outer = all(active for active, taken in stack)
+        match = re.match(r"(els)?if \((.*)\) then$", line)
+
+        if match and match.group(1):
+            active, taken = stack[-1]
+            value = not taken and condition(match.group(2), address, ssel)
+            stack[-1] = (value, taken or value)
+        elif match:
+            value = outer and condition(match.group(2), address, ssel)
+            stack.append((value, value))
+        elif line == "else" and not stack:
+            # end of the valid cycle
+            break
+        elif line == "else":
+            active, taken = stack[-1]
+            stack[-1] = (not taken, True)
+        elif line == "end if;":
+            stack.pop()
+        elif outer and re.match(r"\w+_cyc_i <= cyc;$", line):
+            slaves.append(line.split("_cyc_i")[0])
+
+    return slaves
+
+@pytest.mark.parametrize("decoder", ["chain", "tree", "parallel"])
+def testDecoderBounds(config, templatedir, decoder):
+    ''' every address selects the slave containing it, addresses outside
+        of all slaves select none '''
+    wbmngr = WishboneFileManager(deterministic=True, templatedir=templatedir)
+    wbmngr.parse(config(decoder=decoder))
+    vhdl = wbmngr.renderIntercon()
+    checked = set()
+
+    for name, base, size in SLAVES:
+        for address in (base-1, base, base+size-1, base+size):
+            if address < 0 or address in checked:
+                continue
+
+            checked.add(address)
+            expected = [sname for sname, sbase, ssize in SLAVES\
+                        if sbase <= address < sbase+ssize]
+            assert selected(vhdl, address) == expected, hex(address)
+
+@pytest.mark.parametrize("decoder", ["chain", "tree", "parallel"])
+def testDecoderComparisons(config, templatedir, decoder):
+    ''' the address is compared to the end of a slave with <, inclusive
+        ends select the first address behind the slave '''
+    wbmngr = WishboneFileManager(deterministic=True, templatedir=templatedir)
+    wbmngr.parse(config(decoder=decoder))
+    vhdl = wbmngr.renderIntercon()
+
+    assert ADDRESS+" <=" not in vhdl
@@ -0,0 +1,79 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+
+# standard
+import os
+# custom
+import pytest
+from wb_file_manager import WishboneFileManager
+from conftest import SLAVES
+
+''' this programm tests, that a failed generation keeps the intercon
+generated before '''
+
+__author__ = "Harald Heckmann"
+__copyright__ = "Copyright 2016"
+__credits__ = ["Prof. Dr. Steffen Reith (steffen.reith@hs-rm.de)", \
+                "Harald Heckmann (harald.heckmann@student.hs-rm.de)"]
+__license__ = "GPLv3"
+__version__ = "1.0.0"
+__maintainer__ = "Harald Heckmann"
+__email__ = "harald.heckmann@student.hs-rm.de"
+__status__ = "Development (beta)"
+
+# the last slave overlaps the first one
+OVERLAPPING = SLAVES+[("mmu", 0x8, 0x10)]
+
+def testFailedGenerationKeepsOutput(config, templatedir, tmp_path, monkeypatch):
+    ''' the overlap is detected while the intercon is written, the vhdl
+        file of the last run stays as it is and no temporary file is left '''
+    monkeypatch.chdir(tmp_path)
+    outputdir = str(tmp_path / "out")
+
+    wbmngr = WishboneFileManager(deterministic=True, templatedir=templatedir,\
+                                 outputdir=outputdir)
+    assert wbmngr.update(config("good.ini"))
+    output = os.path.join(outputdir, "test_intercon.vhdl")
+    generated = open(output).read()
+
+    wbmngr = WishboneFileManager(deterministic=True, templatedir=templatedir,\
+                                 outputdir=outputdir)
+    wbmngr.parse(config("bad.ini", slaves=OVERLAPPING))
+
+    with pytest.raises(ValueError, match="overlap"):
+        wbmngr.generateIntercon()
+
+    assert open(output).read() == generated
+    assert os.listdir(outputdir) == ["test_intercon.vhdl"]
+
+def testFailedUpdateIsRetried(config, templatedir, tmp_path, monkeypatch):
+    ''' a failed update writes neither a vhdl file nor a stamp, so the next
+        update tries again instead of reporting it up to date '''
+    monkeypatch.chdir(tmp_path)
+    outputdir = str(tmp_path / "out")
+    path = config(slaves=OVERLAPPING)
+
+    for attempt in range(2):
+        wbmngr = WishboneFileManager(deterministic=True, templatedir=templatedir,\
+                                     outputdir=outputdir)
+
+        with pytest.raises(ValueError, match="overlap"):
+            wbmngr.update(path)
+
+    assert os.listdir(outputdir) == []
+
+def testGeneratedFileMode(config, templatedir, tmp_path, monkeypatch):
+    ''' the temporary file replacing the vhdl file gets the mode of a file
+        created by open '''
+    monkeypatch.chdir(tmp_path)
+    outputdir = str(tmp_path / "out")
+    umask = os.umask(0o022)
+
+    try:
+        WishboneFileManager(deterministic=True, templatedir=templatedir,\
+                            outputdir=outputdir).update(config())
+    finally:
+        os.umask(umask)
+
+    mode = os.stat(os.path.join(outputdir, "test_intercon.vhdl")).st_mode & 0o777
+    assert mode == 0o644